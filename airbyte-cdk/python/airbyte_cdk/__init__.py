@@ -2,8 +2,25 @@
 # Copyright (c) 2021 Airbyte, Inc., all rights reserved.
 #
 
-from .connector import AirbyteSpec, Connector
-from .entrypoint import AirbyteEntrypoint
-from .logger import AirbyteLogger
+from typing import TYPE_CHECKING
+
+from .utils.lazy_imports import lazy_module_getattr
+
+if TYPE_CHECKING:
+    from .connector import AirbyteSpec, Connector
+    from .entrypoint import AirbyteEntrypoint
+    from .logger import AirbyteLogger
+
+# The public names are imported when they are first used so that importing a submodule of airbyte_cdk doesn't import the entrypoint and
+# all the sources it depends on
+__getattr__ = lazy_module_getattr(
+    __name__,
+    {
+        "AirbyteEntrypoint": ".entrypoint",
+        "AirbyteLogger": ".logger",
+        "AirbyteSpec": ".connector",
+        "Connector": ".connector",
+    },
+)
 
 __all__ = ["AirbyteEntrypoint", "AirbyteLogger", "AirbyteSpec", "Connector"]
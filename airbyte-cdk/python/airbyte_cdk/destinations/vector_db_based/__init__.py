@@ -2,19 +2,60 @@
 # Copyright (c) 2021 Airbyte, Inc., all rights reserved.
 #
 
-from .config import (
-    AzureOpenAIEmbeddingConfigModel,
-    CohereEmbeddingConfigModel,
-    FakeEmbeddingConfigModel,
-    FromFieldEmbeddingConfigModel,
-    OpenAICompatibleEmbeddingConfigModel,
-    OpenAIEmbeddingConfigModel,
-    ProcessingConfigModel,
+from typing import TYPE_CHECKING
+
+from airbyte_cdk.utils.lazy_imports import lazy_module_getattr
+
+if TYPE_CHECKING:
+    from .config import (
+        AzureOpenAIEmbeddingConfigModel,
+        CohereEmbeddingConfigModel,
+        FakeEmbeddingConfigModel,
+        FromFieldEmbeddingConfigModel,
+        OpenAICompatibleEmbeddingConfigModel,
+        OpenAIEmbeddingConfigModel,
+        ProcessingConfigModel,
+    )
+    from .document_processor import Chunk, DocumentProcessor
+    from .embedder import (
+        AzureOpenAIEmbedder,
+        CohereEmbedder,
+        Embedder,
+        FakeEmbedder,
+        FromFieldEmbedder,
+        OpenAICompatibleEmbedder,
+        OpenAIEmbedder,
+    )
+    from .embedding_cache import EmbeddingCache, create_embedding_cache
+    from .indexer import Indexer
+    from .writer import Writer
+
+# The vector DB destination dependencies are slow to import, so the public names are imported when they are first used
+__getattr__ = lazy_module_getattr(
+    __name__,
+    {
+        "AzureOpenAIEmbeddingConfigModel": ".config",
+        "CohereEmbeddingConfigModel": ".config",
+        "FakeEmbeddingConfigModel": ".config",
+        "FromFieldEmbeddingConfigModel": ".config",
+        "OpenAICompatibleEmbeddingConfigModel": ".config",
+        "OpenAIEmbeddingConfigModel": ".config",
+        "ProcessingConfigModel": ".config",
+        "Chunk": ".document_processor",
+        "DocumentProcessor": ".document_processor",
+        "AzureOpenAIEmbedder": ".embedder",
+        "CohereEmbedder": ".embedder",
+        "Embedder": ".embedder",
+        "FakeEmbedder": ".embedder",
+        "FromFieldEmbedder": ".embedder",
+        "OpenAICompatibleEmbedder": ".embedder",
+        "OpenAIEmbedder": ".embedder",
+        "EmbeddingCache": ".embedding_cache",
+        "create_embedding_cache": ".embedding_cache",
+        "Indexer": ".indexer",
+        "Writer": ".writer",
+    },
 )
-from .document_processor import Chunk, DocumentProcessor
-from .embedder import CohereEmbedder, Embedder, FakeEmbedder, OpenAIEmbedder
-from .indexer import Indexer
-from .writer import Writer
 
 __all__ = [
     "AzureOpenAIEmbedder",
@@ -24,6 +65,7 @@ __all__ = [
     "CohereEmbeddingConfigModel",
     "DocumentProcessor",
     "Embedder",
+    "EmbeddingCache",
     "FakeEmbedder",
     "FakeEmbeddingConfigModel",
     "FromFieldEmbedder",
@@ -35,4 +77,5 @@ __all__ = [
     "OpenAIEmbeddingConfigModel",
     "ProcessingConfigModel",
     "Writer",
+    "create_embedding_cache",
 ]
@@ -0,0 +1,170 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from airbyte_cdk.destinations.vector_db_based.config import (
+    AzureOpenAIEmbeddingConfigModel,
+    CohereEmbeddingConfigModel,
+    FakeEmbeddingConfigModel,
+    FromFieldEmbeddingConfigModel,
+    OpenAICompatibleEmbeddingConfigModel,
+    OpenAIEmbeddingConfigModel,
+)
+from pydantic import BaseModel
+
+DEFAULT_MAX_SIZE_BYTES = 1024 * 1024 * 1024
+
+# SQLite limits the number of variables of a statement to 999 in older versions
+_MAX_VARIABLES_PER_STATEMENT = 900
+
+
+class EmbeddingCache:
+    """
+    Persistent cache of the embeddings of chunk texts, stored in a SQLite database.
+
+    Embeddings are identified by the fingerprint of the embedding configuration and the hash of the text, so that embeddings computed with
+    another model or another configuration are never returned. Once the embeddings stored take more than max_size_bytes, the least recently
+    used ones are evicted.
+
+    The cache can be used from several threads.
+    """
+
+    def __init__(self, path: str, fingerprint: str, max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES):
+        """
+        :param path: The path of the SQLite database, created if it doesn't exist
+        :param fingerprint: Identifies the embedding configuration, see create_fingerprint
+        :param max_size_bytes: The size of the embeddings above which the least recently used ones are evicted
+        """
+        self._fingerprint = fingerprint
+        self._max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(fingerprint TEXT, text_hash BLOB, embedding BLOB, last_used INTEGER, PRIMARY KEY (fingerprint, text_hash))"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)")
+        self._size_bytes = self._connection.execute("SELECT COALESCE(SUM(LENGTH(embedding)), 0) FROM embeddings").fetchone()[0]
+
+    @staticmethod
+    def create_fingerprint(embedding_config: BaseModel) -> str:
+        """
+        Return the fingerprint of an embedding configuration. Secrets are not part of the fingerprint so that rotating an API key doesn't
+        invalidate the cache.
+        """
+        fields = {
+            name: value
+            for name, value in embedding_config.dict().items()
+            if not embedding_config.__fields__[name].field_info.extra.get("airbyte_secret")
+        }
+        return hashlib.sha256(json.dumps(fields, sort_keys=True, default=str).encode()).hexdigest()
+
+    def get_many(self, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """
+        Return the cached embedding of each text, or None if it isn't cached.
+        """
+        text_hashes = [self._hash(text) for text in texts]
+        found: Dict[bytes, bytes] = {}
+        with self._lock:
+            for start in range(0, len(text_hashes), _MAX_VARIABLES_PER_STATEMENT):
+                batch = text_hashes[start : start + _MAX_VARIABLES_PER_STATEMENT]
+                rows = self._connection.execute(
+                    f"SELECT text_hash, embedding FROM embeddings WHERE fingerprint = ? AND text_hash IN ({','.join('?' * len(batch))})",
+                    [self._fingerprint, *batch],
+                )
+                found.update(rows)
+            if found:
+                last_used = time.time_ns()
+                with self._connection:
+                    self._connection.executemany(
+                        "UPDATE embeddings SET last_used = ? WHERE fingerprint = ? AND text_hash = ?",
+                        [(last_used, self._fingerprint, text_hash) for text_hash in found],
+                    )
+        return [self._decode(found[text_hash]) if text_hash in found else None for text_hash in text_hashes]
+
+    def put_many(self, embeddings: Sequence[Tuple[str, List[float]]]) -> None:
+        """
+        Store the embeddings of the texts and evict the least recently used embeddings if the cache is full.
+        """
+        last_used = time.time_ns()
+        rows = {self._hash(text): self._encode(embedding) for text, embedding in embeddings}
+        text_hashes = list(rows)
+        with self._lock, self._connection:
+            # Replaced embeddings don't count in the size of the cache anymore
+            for start in range(0, len(text_hashes), _MAX_VARIABLES_PER_STATEMENT):
+                batch = text_hashes[start : start + _MAX_VARIABLES_PER_STATEMENT]
+                self._size_bytes -= self._connection.execute(
+                    "SELECT COALESCE(SUM(LENGTH(embedding)), 0) FROM embeddings "
+                    f"WHERE fingerprint = ? AND text_hash IN ({','.join('?' * len(batch))})",
+                    [self._fingerprint, *batch],
+                ).fetchone()[0]
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (fingerprint, text_hash, embedding, last_used) VALUES (?, ?, ?, ?)",
+                [(self._fingerprint, text_hash, embedding, last_used) for text_hash, embedding in rows.items()],
+            )
+            self._size_bytes += sum(len(embedding) for embedding in rows.values())
+            self._evict()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _evict(self) -> None:
+        """
+        Delete the least recently used embeddings until the cache is 10% below its maximum size to not evict on every write.
+        """
+        if self._size_bytes <= self._max_size_bytes:
+            return
+        target_size_bytes = int(self._max_size_bytes * 0.9)
+        rows = self._connection.execute("SELECT rowid, LENGTH(embedding) FROM embeddings ORDER BY last_used")
+        evicted_rowids = []
+        for rowid, size in rows:
+            if self._size_bytes <= target_size_bytes:
+                break
+            evicted_rowids.append((rowid,))
+            self._size_bytes -= size
+        rows.close()
+        self._connection.executemany("DELETE FROM embeddings WHERE rowid = ?", evicted_rowids)
+
+    @staticmethod
+    def _hash(text: str) -> bytes:
+        return hashlib.sha256(text.encode()).digest()
+
+    @staticmethod
+    def _encode(embedding: List[float]) -> bytes:
+        return array("d", embedding).tobytes()
+
+    @staticmethod
+    def _decode(value: bytes) -> List[float]:
+        embedding = array("d")
+        embedding.frombytes(value)
+        return embedding.tolist()
+
+
+def create_embedding_cache(
+    path: str,
+    embedding_config: Union[
+        AzureOpenAIEmbeddingConfigModel,
+        CohereEmbeddingConfigModel,
+        FakeEmbeddingConfigModel,
+        FromFieldEmbeddingConfigModel,
+        OpenAIEmbeddingConfigModel,
+        OpenAICompatibleEmbeddingConfigModel,
+    ],
+    max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES,
+) -> Optional[EmbeddingCache]:
+    """
+    Return a cache for the embeddings computed with the embedding configuration, or None if the embeddings are not computed from the text
+    of the chunks and can't be cached.
+    """
+    if isinstance(embedding_config, (FakeEmbeddingConfigModel, FromFieldEmbeddingConfigModel)):
+        return None
+    return EmbeddingCache(path, EmbeddingCache.create_fingerprint(embedding_config), max_size_bytes)
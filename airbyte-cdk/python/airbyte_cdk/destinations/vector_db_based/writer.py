@@ -3,12 +3,14 @@
 #
 
 
-from collections import defaultdict
-from typing import Dict, Iterable, List, Tuple
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
 
 from airbyte_cdk.destinations.vector_db_based.config import ProcessingConfigModel
 from airbyte_cdk.destinations.vector_db_based.document_processor import Chunk, DocumentProcessor
 from airbyte_cdk.destinations.vector_db_based.embedder import Embedder
+from airbyte_cdk.destinations.vector_db_based.embedding_cache import EmbeddingCache
 from airbyte_cdk.destinations.vector_db_based.indexer import Indexer
 from airbyte_cdk.models import AirbyteMessage, ConfiguredAirbyteCatalog, Type
 
@@ -21,15 +23,37 @@ class Writer:
     * The embedder embeds the documents
     * The indexer deletes old documents by the associated record id before indexing the new ones
 
+    The stages run as a pipeline: while a batch is being embedded, the next records are processed and the previous batch is indexed.
+    Up to max_concurrent_embeddings batches are embedded at the same time while batches are indexed one after the other, in the order of
+    the records. The number of batches in flight is bounded so that reading the records waits for the slowest stage to catch up.
+    State messages are only emitted once all the batches before them were indexed.
+
     The destination connector is responsible to create a writer instance and pass the input messages iterable to the write method.
     The batch size can be configured by the destination connector to give the freedom of either letting the user configure it or hardcoding it to a sensible value depending on the destination.
+    The embedder has to support embed_chunks being called from several threads if max_concurrent_embeddings is greater than 1.
+
+    If an embedding cache is given, the embedder is only called for the chunks whose text wasn't embedded before. Only use a cache with
+    embedders computing the embeddings from the text of the chunks.
     """
 
-    def __init__(self, processing_config: ProcessingConfigModel, indexer: Indexer, embedder: Embedder, batch_size: int) -> None:
+    def __init__(
+        self,
+        processing_config: ProcessingConfigModel,
+        indexer: Indexer,
+        embedder: Embedder,
+        batch_size: int,
+        max_concurrent_embeddings: int = 1,
+        embedding_cache: Optional[EmbeddingCache] = None,
+    ) -> None:
         self.processing_config = processing_config
         self.indexer = indexer
         self.embedder = embedder
         self.batch_size = batch_size
+        self.max_concurrent_embeddings = max_concurrent_embeddings
+        self.embedding_cache = embedding_cache
+        self._embedding_pool: Optional[ThreadPoolExecutor] = None
+        self._indexing_pool: Optional[ThreadPoolExecutor] = None
+        self._pending_batches: Deque[Future[None]] = deque()
         self._init_batch()
 
     def _init_batch(self) -> None:
@@ -38,34 +62,91 @@ class Writer:
         self.number_of_documents = 0
 
     def _process_batch(self) -> None:
-        for (namespace, stream), ids in self.ids_to_delete.items():
+        """
+        Embed and index the current batch in the background and start a new batch. Wait for the oldest batches to be indexed if there are
+        too many batches in flight.
+        """
+        if self._embedding_pool is None or self._indexing_pool is None:
+            raise RuntimeError("Batches can only be processed while writing")
+
+        embeddings = {
+            stream_identifier: self._embedding_pool.submit(self._embed_chunks, documents)
+            for stream_identifier, documents in self.documents.items()
+        }
+        self._pending_batches.append(self._indexing_pool.submit(self._index_batch, self.ids_to_delete, self.documents, embeddings))
+        self._init_batch()
+
+        # One batch can be indexed while the next ones are embedded
+        while len(self._pending_batches) > self.max_concurrent_embeddings + 1:
+            self._pending_batches.popleft().result()
+
+    def _embed_chunks(self, chunks: List[Chunk]) -> List[Optional[List[float]]]:
+        if self.embedding_cache is None:
+            return self.embedder.embed_chunks(chunks)
+
+        embeddings = self.embedding_cache.get_many([chunk.page_content for chunk in chunks])
+        chunks_to_embed = [index for index, embedding in enumerate(embeddings) if embedding is None]
+        if chunks_to_embed:
+            computed_embeddings = self.embedder.embed_chunks([chunks[index] for index in chunks_to_embed])
+            for index, embedding in zip(chunks_to_embed, computed_embeddings):
+                embeddings[index] = embedding
+            self.embedding_cache.put_many(
+                [(chunks[index].page_content, embedding) for index, embedding in zip(chunks_to_embed, computed_embeddings) if embedding]
+            )
+        return embeddings
+
+    def _index_batch(
+        self,
+        ids_to_delete: Dict[Tuple[str, str], List[str]],
+        documents: Dict[Tuple[str, str], List[Chunk]],
+        embeddings: Dict[Tuple[str, str], "Future[List[Optional[List[float]]]]"],
+    ) -> None:
+        for (namespace, stream), ids in ids_to_delete.items():
             self.indexer.delete(ids, namespace, stream)
 
-        for (namespace, stream), documents in self.documents.items():
-            embeddings = self.embedder.embed_chunks(documents)
-            for i, document in enumerate(documents):
-                document.embedding = embeddings[i]
-            self.indexer.index(documents, namespace, stream)
+        for (namespace, stream), stream_documents in documents.items():
+            stream_embeddings = embeddings[(namespace, stream)].result()
+            for i, document in enumerate(stream_documents):
+                document.embedding = stream_embeddings[i]
+            self.indexer.index(stream_documents, namespace, stream)
 
-        self._init_batch()
+    def _flush(self) -> None:
+        """
+        Process the current batch and wait for all the batches to be indexed.
+        """
+        self._process_batch()
+        while self._pending_batches:
+            self._pending_batches.popleft().result()
 
     def write(self, configured_catalog: ConfiguredAirbyteCatalog, input_messages: Iterable[AirbyteMessage]) -> Iterable[AirbyteMessage]:
         self.processor = DocumentProcessor(self.processing_config, configured_catalog)
         self.indexer.pre_sync(configured_catalog)
-        for message in input_messages:
-            if message.type == Type.STATE:
-                # Emitting a state message indicates that all records which came before it have been written to the destination. So we flush
-                # the queue to ensure writes happen, then output the state message to indicate it's safe to checkpoint state
-                self._process_batch()
-                yield message
-            elif message.type == Type.RECORD:
-                record_documents, record_id_to_delete = self.processor.process(message.record)
-                self.documents[(message.record.namespace, message.record.stream)].extend(record_documents)
-                if record_id_to_delete is not None:
-                    self.ids_to_delete[(message.record.namespace, message.record.stream)].append(record_id_to_delete)
-                self.number_of_documents += len(record_documents)
-                if self.number_of_documents >= self.batch_size:
-                    self._process_batch()
+        self._embedding_pool = ThreadPoolExecutor(max_workers=self.max_concurrent_embeddings, thread_name_prefix="embedder")
+        # Batches are indexed by a single thread so that the deletions and insertions of a batch happen after the ones of the previous batch
+        self._indexing_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="indexer")
+        try:
+            for message in input_messages:
+                if message.type == Type.STATE:
+                    # Emitting a state message indicates that all records which came before it have been written to the destination. So we
+                    # flush the queue to ensure writes happen, then output the state message to indicate it's safe to checkpoint state
+                    self._flush()
+                    yield message
+                elif message.type == Type.RECORD:
+                    record_documents, record_id_to_delete = self.processor.process(message.record)
+                    self.documents[(message.record.namespace, message.record.stream)].extend(record_documents)
+                    if record_id_to_delete is not None:
+                        self.ids_to_delete[(message.record.namespace, message.record.stream)].append(record_id_to_delete)
+                    self.number_of_documents += len(record_documents)
+                    if self.number_of_documents >= self.batch_size:
+                        self._process_batch()
 
-        self._process_batch()
+            self._flush()
+        finally:
+            for pending_batch in self._pending_batches:
+                pending_batch.cancel()
+            self._pending_batches.clear()
+            self._embedding_pool.shutdown(wait=True)
+            self._indexing_pool.shutdown(wait=True)
+            self._embedding_pool = None
+            self._indexing_pool = None
         yield from self.indexer.post_sync()
@@ -5,11 +5,13 @@
 import argparse
 import importlib
 import ipaddress
+import json
 import logging
 import os.path
 import socket
 import sys
 import tempfile
+import time
 from functools import wraps
 from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
 from urllib.parse import urlparse
@@ -18,7 +20,7 @@ import requests
 from airbyte_cdk.connector import TConfig
 from airbyte_cdk.exception_handler import init_uncaught_exception_handler
 from airbyte_cdk.logger import init_logger
-from airbyte_cdk.models import AirbyteMessage, Status, Type
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, Status, Type
 from airbyte_cdk.models.airbyte_protocol import ConnectorSpecification  # type: ignore [attr-defined]
 from airbyte_cdk.sources import Source
 from airbyte_cdk.sources.utils.schema_helpers import check_config_against_spec_or_exit, split_config
@@ -26,12 +28,17 @@ from airbyte_cdk.utils import is_cloud_environment
 from airbyte_cdk.utils.airbyte_secrets_utils import get_secrets, update_secrets
 from airbyte_cdk.utils.constants import ENV_REQUEST_CACHE_PATH
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
+from pydantic.json import pydantic_encoder
 from requests import PreparedRequest, Response, Session
 
 logger = init_logger("airbyte")
 
 VALID_URL_SCHEMES = ["https"]
 CLOUD_DEPLOYMENT_MODE = "cloud"
+STDOUT_FLUSH_INTERVAL_SECONDS = 1.0
+
+_RECORD_MESSAGE_FIELDS = {"type", "record"}
+_RECORD_FIELDS = list(AirbyteRecordMessage.__fields__)
 
 
 class AirbyteEntrypoint(object):
@@ -175,6 +182,8 @@ class AirbyteEntrypoint(object):
 
     @staticmethod
     def airbyte_message_to_string(airbyte_message: AirbyteMessage) -> Any:
+        if airbyte_message.type == Type.RECORD and airbyte_message.__fields_set__ == _RECORD_MESSAGE_FIELDS:
+            return _record_message_to_string(airbyte_message.record)
         return airbyte_message.json(exclude_unset=True)
 
     @classmethod
@@ -204,11 +213,34 @@ class AirbyteEntrypoint(object):
         return
 
 
+def _record_message_to_string(record: AirbyteRecordMessage) -> str:
+    """
+    Serialize a record message without going through pydantic's `.json()` as records are by far the most common messages.
+
+    The output is the same as `AirbyteMessage(type=Type.RECORD, record=record).json(exclude_unset=True)`: the fields that were set are
+    dumped in the order they are declared using the same encoder. Records with extra fields fall back to pydantic.
+    """
+    fields_set = record.__fields_set__
+    if not fields_set.issubset(_RECORD_FIELDS):
+        return str(AirbyteMessage(type=Type.RECORD, record=record).json(exclude_unset=True))
+    record_dict = {field: getattr(record, field) for field in _RECORD_FIELDS if field in fields_set}
+    return f'{{"type": "RECORD", "record": {json.dumps(record_dict, default=pydantic_encoder)}}}'
+
+
 def launch(source: Source, args: List[str]) -> None:
     source_entrypoint = AirbyteEntrypoint(source)
     parsed_args = source_entrypoint.parse_args(args)
-    for message in source_entrypoint.run(parsed_args):
-        print(message)
+    # Messages are written to the buffered stdout and flushed periodically instead of being printed one by one. They go through the same
+    # stream as the logs so the ordering between logs and messages is preserved.
+    last_flush = time.monotonic()
+    try:
+        for message in source_entrypoint.run(parsed_args):
+            sys.stdout.write(f"{message}\n")
+            if time.monotonic() - last_flush > STDOUT_FLUSH_INTERVAL_SECONDS:
+                sys.stdout.flush()
+                last_flush = time.monotonic()
+    finally:
+        sys.stdout.flush()
 
 
 def _init_internal_request_filter() -> None:
@@ -2,11 +2,15 @@
 # Copyright (c) 2021 Airbyte, Inc., all rights reserved.
 #
 
+from typing import TYPE_CHECKING
+
 import dpath.options
+from airbyte_cdk.utils.lazy_imports import lazy_module_getattr
 
-from .abstract_source import AbstractSource
-from .config import BaseConfig
-from .source import Source
+if TYPE_CHECKING:
+    from .abstract_source import AbstractSource
+    from .config import BaseConfig
+    from .source import Source
 
 # As part of the CDK sources, we do not control what the APIs return and it is possible that a key is empty.
 # Reasons why we are doing this at the airbyte_cdk level:
@@ -19,4 +23,8 @@ from .source import Source
 # this will not be thread-safe.
 dpath.options.ALLOW_EMPTY_STRING_KEYS = True
 
+# The public names are imported when they are first used so that importing a submodule of airbyte_cdk.sources doesn't import all the
+# streams AbstractSource depends on
+__getattr__ = lazy_module_getattr(__name__, {"AbstractSource": ".abstract_source", "BaseConfig": ".config", "Source": ".source"})
+
 __all__ = ["AbstractSource", "BaseConfig", "Source"]
@@ -3,7 +3,10 @@
 #
 
 import logging
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from queue import Empty, Queue
 from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 from airbyte_cdk.models import (
@@ -18,16 +21,17 @@ from airbyte_cdk.models import (
     SyncMode,
 )
 from airbyte_cdk.models import Type as MessageType
-from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
+from airbyte_cdk.sources.connector_state_manager import ConcurrentStreamStateManager, ConnectorStateManager
 from airbyte_cdk.sources.message import MessageRepository
 from airbyte_cdk.sources.source import Source
 from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.streams.concurrent.stream_message_reader import StreamCompleteSentinel, StreamMessageQueueItem, StreamMessageReader
 from airbyte_cdk.sources.streams.core import StreamData
 from airbyte_cdk.sources.streams.http.http import HttpStream
-from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
+from airbyte_cdk.sources.utils.record_helper import RecordEmitter
 from airbyte_cdk.sources.utils.schema_helpers import InternalConfig, split_config
 from airbyte_cdk.sources.utils.slice_logger import DebugSliceLogger, SliceLogger
-from airbyte_cdk.utils.event_timing import create_timer
+from airbyte_cdk.utils.event_timing import EventTimer, create_timer
 from airbyte_cdk.utils.stream_status_utils import as_airbyte_message as stream_status_as_airbyte_message
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
@@ -59,6 +63,9 @@ class AbstractSource(Source, ABC):
         :return: A list of the streams in this source connector.
         """
 
+    _CONCURRENT_STREAMS_MAX_QUEUE_SIZE = 10_000
+    _CONCURRENT_STREAMS_DRAIN_TIMEOUT_SECONDS = 0.1
+
     # Stream name to instance map for applying output object transformation
     _stream_to_instance_map: Dict[str, Stream] = {}
     _slice_logger: SliceLogger = DebugSliceLogger()
@@ -100,50 +107,14 @@ class AbstractSource(Source, ABC):
         state_manager = ConnectorStateManager(stream_instance_map=stream_instances, state=state)
         self._stream_to_instance_map = stream_instances
         with create_timer(self.name) as timer:
-            for configured_stream in catalog.streams:
-                stream_instance = stream_instances.get(configured_stream.stream.name)
-                if not stream_instance:
-                    if not self.raise_exception_on_missing_stream:
-                        continue
-                    raise KeyError(
-                        f"The stream {configured_stream.stream.name} no longer exists in the configuration. "
-                        f"Refresh the schema in replication settings and remove this stream from future sync attempts."
+            if self.max_concurrent_streams > 1:
+                yield from self._read_streams_concurrently(logger, catalog, stream_instances, state_manager, internal_config)
+            else:
+                for configured_stream in catalog.streams:
+                    yield from self._read_configured_stream(
+                        logger, configured_stream, stream_instances, state_manager, internal_config, timer
                     )
 
-                try:
-                    timer.start_event(f"Syncing stream {configured_stream.stream.name}")
-                    stream_is_available, reason = stream_instance.check_availability(logger, self)
-                    if not stream_is_available:
-                        logger.warning(f"Skipped syncing stream '{stream_instance.name}' because it was unavailable. {reason}")
-                        continue
-                    logger.info(f"Marking stream {configured_stream.stream.name} as STARTED")
-                    yield stream_status_as_airbyte_message(configured_stream.stream, AirbyteStreamStatus.STARTED)
-                    yield from self._read_stream(
-                        logger=logger,
-                        stream_instance=stream_instance,
-                        configured_stream=configured_stream,
-                        state_manager=state_manager,
-                        internal_config=internal_config,
-                    )
-                    logger.info(f"Marking stream {configured_stream.stream.name} as STOPPED")
-                    yield stream_status_as_airbyte_message(configured_stream.stream, AirbyteStreamStatus.COMPLETE)
-                except AirbyteTracedException as e:
-                    yield stream_status_as_airbyte_message(configured_stream.stream, AirbyteStreamStatus.INCOMPLETE)
-                    raise e
-                except Exception as e:
-                    yield from self._emit_queued_messages()
-                    logger.exception(f"Encountered an exception while reading stream {configured_stream.stream.name}")
-                    logger.info(f"Marking stream {configured_stream.stream.name} as STOPPED")
-                    yield stream_status_as_airbyte_message(configured_stream.stream, AirbyteStreamStatus.INCOMPLETE)
-                    display_message = stream_instance.get_error_display_message(e)
-                    if display_message:
-                        raise AirbyteTracedException.from_exception(e, message=display_message) from e
-                    raise e
-                finally:
-                    timer.finish_event()
-                    logger.info(f"Finished syncing {configured_stream.stream.name}")
-                    logger.info(timer.report())
-
         logger.info(f"Finished syncing {self.name}")
 
     @property
@@ -154,6 +125,127 @@ class AbstractSource(Source, ABC):
     def per_stream_state_enabled(self) -> bool:
         return True
 
+    @property
+    def max_concurrent_streams(self) -> int:
+        """
+        The number of streams that are read in parallel. Streams are read one after the other by default.
+
+        Reading streams concurrently is only safe if the streams of the source do not share mutable state. The messages of a given
+        stream are emitted in the order they are produced but they can be interleaved with the messages of other streams. Incremental
+        streams can be read concurrently: the state of each stream is checkpointed by its thread and the state messages are generated from
+        the state of all the streams when they are emitted.
+        """
+        return 1
+
+    def _read_configured_stream(
+        self,
+        logger: logging.Logger,
+        configured_stream: ConfiguredAirbyteStream,
+        stream_instances: Mapping[str, Stream],
+        state_manager: ConnectorStateManager,
+        internal_config: InternalConfig,
+        timer: EventTimer,
+    ) -> Iterator[AirbyteMessage]:
+        stream_instance = stream_instances.get(configured_stream.stream.name)
+        if not stream_instance:
+            if not self.raise_exception_on_missing_stream:
+                return
+            raise KeyError(
+                f"The stream {configured_stream.stream.name} no longer exists in the configuration. "
+                f"Refresh the schema in replication settings and remove this stream from future sync attempts."
+            )
+
+        try:
+            timer.start_event(f"Syncing stream {configured_stream.stream.name}")
+            stream_is_available, reason = stream_instance.check_availability(logger, self)
+            if not stream_is_available:
+                logger.warning(f"Skipped syncing stream '{stream_instance.name}' because it was unavailable. {reason}")
+                return
+            logger.info(f"Marking stream {configured_stream.stream.name} as STARTED")
+            yield stream_status_as_airbyte_message(configured_stream.stream, AirbyteStreamStatus.STARTED)
+            yield from self._read_stream(
+                logger=logger,
+                stream_instance=stream_instance,
+                configured_stream=configured_stream,
+                state_manager=state_manager,
+                internal_config=internal_config,
+            )
+            logger.info(f"Marking stream {configured_stream.stream.name} as STOPPED")
+            yield stream_status_as_airbyte_message(configured_stream.stream, AirbyteStreamStatus.COMPLETE)
+        except AirbyteTracedException as e:
+            yield stream_status_as_airbyte_message(configured_stream.stream, AirbyteStreamStatus.INCOMPLETE)
+            raise e
+        except Exception as e:
+            yield from self._emit_queued_messages()
+            logger.exception(f"Encountered an exception while reading stream {configured_stream.stream.name}")
+            logger.info(f"Marking stream {configured_stream.stream.name} as STOPPED")
+            yield stream_status_as_airbyte_message(configured_stream.stream, AirbyteStreamStatus.INCOMPLETE)
+            display_message = stream_instance.get_error_display_message(e)
+            if display_message:
+                raise AirbyteTracedException.from_exception(e, message=display_message) from e
+            raise e
+        finally:
+            timer.finish_event()
+            logger.info(f"Finished syncing {configured_stream.stream.name}")
+            logger.info(timer.report())
+
+    def _read_streams_concurrently(
+        self,
+        logger: logging.Logger,
+        catalog: ConfiguredAirbyteCatalog,
+        stream_instances: Mapping[str, Stream],
+        state_manager: ConnectorStateManager,
+        internal_config: InternalConfig,
+    ) -> Iterator[AirbyteMessage]:
+        """
+        Read the configured streams on a threadpool of max_concurrent_streams workers.
+
+        Each worker puts the messages of its stream on a bounded queue that is consumed by this generator. The first exception raised
+        while reading a stream is re-raised once the messages that were queued before it are emitted. The other streams are then stopped.
+
+        The workers don't update the state manager shared by the streams. Each stream checkpoints its state in a state manager of its own
+        and the per-stream state messages it creates are applied to the shared state manager by this generator when they are emitted, so
+        that the legacy state of the messages matches the records emitted before them.
+        """
+        queue: Queue[StreamMessageQueueItem] = Queue(maxsize=self._CONCURRENT_STREAMS_MAX_QUEUE_SIZE)
+        stop_event = threading.Event()
+        stream_reader = StreamMessageReader(queue, stop_event)
+        threadpool = ThreadPoolExecutor(max_workers=self.max_concurrent_streams, thread_name_prefix="streampool")
+        futures: List[Future[None]] = []
+        for configured_stream in catalog.streams:
+            stream_name = configured_stream.stream.name
+            namespace = stream_instances[stream_name].namespace if stream_name in stream_instances else None
+            stream_state = state_manager.get_stream_state(stream_name, namespace)
+            stream_state_manager = ConcurrentStreamStateManager(stream_name, namespace, stream_state)
+            # Events from different threads can't share a timer as the timer assumes events are nested
+            messages = self._read_configured_stream(
+                logger, configured_stream, stream_instances, stream_state_manager, internal_config, EventTimer(self.name)
+            )
+            futures.append(threadpool.submit(stream_reader.read_stream, configured_stream.stream.name, messages))
+
+        streams_to_complete = len(futures)
+        try:
+            while streams_to_complete:
+                message_or_sentinel_or_exception = queue.get(block=True)
+                if isinstance(message_or_sentinel_or_exception, Exception):
+                    raise message_or_sentinel_or_exception
+                elif isinstance(message_or_sentinel_or_exception, StreamCompleteSentinel):
+                    streams_to_complete -= 1
+                else:
+                    message = message_or_sentinel_or_exception
+                    if message.type == MessageType.STATE and message.state and message.state.stream:
+                        message = state_manager.update_state_from_message(message.state, self.per_stream_state_enabled)
+                    yield message
+        finally:
+            stop_event.set()
+            threadpool.shutdown(wait=False, cancel_futures=True)
+            # Workers might be blocked on the full queue so it has to be drained until they notice the stop event
+            while not all(future.done() for future in futures):
+                try:
+                    queue.get(block=True, timeout=self._CONCURRENT_STREAMS_DRAIN_TIMEOUT_SECONDS)
+                except Empty:
+                    pass
+
     def _read_stream(
         self,
         logger: logging.Logger,
@@ -226,6 +318,7 @@ class AbstractSource(Source, ABC):
             stream_instance.state = stream_state  # type: ignore # we check that state in the dir(stream_instance)
             logger.info(f"Setting state of {self.name} stream to {stream_state}")
 
+        record_emitter = self._get_record_emitter(stream_instance)
         for record_data_or_message in stream_instance.read_incremental(
             configured_stream.cursor_field,
             logger,
@@ -235,7 +328,7 @@ class AbstractSource(Source, ABC):
             self.per_stream_state_enabled,
             internal_config,
         ):
-            yield self._get_message(record_data_or_message, stream_instance)
+            yield self._get_message(record_data_or_message, record_emitter)
 
     def _emit_queued_messages(self) -> Iterable[AirbyteMessage]:
         if self.message_repository:
@@ -250,22 +343,33 @@ class AbstractSource(Source, ABC):
         internal_config: InternalConfig,
     ) -> Iterator[AirbyteMessage]:
         total_records_counter = 0
+        record_emitter = self._get_record_emitter(stream_instance)
         for record_data_or_message in stream_instance.read_full_refresh(configured_stream.cursor_field, logger, self._slice_logger):
-            message = self._get_message(record_data_or_message, stream_instance)
+            message = self._get_message(record_data_or_message, record_emitter)
             yield message
             if message.type == MessageType.RECORD:
                 total_records_counter += 1
                 if internal_config.is_limit_reached(total_records_counter):
                     return
 
-    def _get_message(self, record_data_or_message: Union[StreamData, AirbyteMessage], stream: Stream) -> AirbyteMessage:
+    @staticmethod
+    def _get_record_emitter(stream: Stream) -> RecordEmitter:
+        """
+        Builds the emitter converting the records of a stream to messages. The schema is only resolved if the records are transformed.
+        """
+        if not stream.transformer.is_enabled:
+            return RecordEmitter(stream.name)
+        return RecordEmitter(stream.name, stream.transformer, stream.get_json_schema())
+
+    @staticmethod
+    def _get_message(record_data_or_message: Union[StreamData, AirbyteMessage], record_emitter: RecordEmitter) -> AirbyteMessage:
         """
         Converts the input to an AirbyteMessage if it is a StreamData. Returns the input as is if it is already an AirbyteMessage
         """
         if isinstance(record_data_or_message, AirbyteMessage):
             return record_data_or_message
         else:
-            return stream_data_to_airbyte_message(stream.name, record_data_or_message, stream.transformer, stream.get_json_schema())
+            return record_emitter.to_message(record_data_or_message)
 
     @property
     def message_repository(self) -> Union[None, MessageRepository]:
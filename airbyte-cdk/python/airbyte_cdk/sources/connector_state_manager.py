@@ -2,8 +2,8 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-import copy
-from typing import Any, List, Mapping, MutableMapping, Optional, Tuple, Union
+import threading
+from typing import Any, Dict, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 from airbyte_cdk.models import AirbyteMessage, AirbyteStateBlob, AirbyteStateMessage, AirbyteStateType, AirbyteStreamState, StreamDescriptor
 from airbyte_cdk.models import Type as MessageType
@@ -26,6 +26,13 @@ class ConnectorStateManager:
     """
     ConnectorStateManager consolidates the various forms of a stream's incoming state message (STREAM / GLOBAL / LEGACY) under a common
     interface. It also provides methods to extract and update state
+
+    The state of a stream is snapshotted when it is updated and the snapshots are never modified afterwards, so they are shared between the
+    state messages rather than copied and serialized on every checkpoint. Creating a state message only costs the serialization of the
+    streams whose state changed since the previous one.
+
+    Streams read concurrently share the state manager: updating the state of a stream and building the legacy state are guarded by a lock
+    so that state messages can be created while the state of other streams is being updated.
     """
 
     def __init__(
@@ -44,6 +51,12 @@ class ConnectorStateManager:
                 "state messages with shared_state will not be processed correctly. "
             )
         self.per_stream_states = per_stream_states
+        self._serialized_states: Dict[HashableStreamDescriptor, Mapping[str, Any]] = {
+            descriptor: stream_state.dict() if stream_state else {} for descriptor, stream_state in per_stream_states.items()
+        }
+        # The legacy state is rebuilt from the serialized states only when the state of a stream changed
+        self._legacy_state: Optional[Mapping[str, Any]] = None
+        self._lock = threading.Lock()
 
     def get_stream_state(self, stream_name: str, namespace: Optional[str]) -> MutableMapping[str, Any]:
         """
@@ -65,7 +78,13 @@ class ConnectorStateManager:
         :param value: A stream state mapping that is being updated for a stream
         """
         stream_descriptor = HashableStreamDescriptor(name=stream_name, namespace=namespace)
-        self.per_stream_states[stream_descriptor] = AirbyteStateBlob.parse_obj(value)
+        # The stream can keep modifying the value after the update, so the snapshot is taken from a copy the stream doesn't reference
+        serialized_state = AirbyteStateBlob.parse_obj(value).dict()
+        state_blob = AirbyteStateBlob.parse_obj(serialized_state)
+        with self._lock:
+            self.per_stream_states[stream_descriptor] = state_blob
+            self._serialized_states[stream_descriptor] = serialized_state
+            self._legacy_state = None
 
     def create_state_message(self, stream_name: str, namespace: Optional[str], send_per_stream_state: bool) -> AirbyteMessage:
         """
@@ -95,6 +114,21 @@ class ConnectorStateManager:
             )
         return AirbyteMessage(type=MessageType.STATE, state=AirbyteStateMessage(data=dict(self._get_legacy_state())))
 
+    def update_state_from_message(self, state_message: AirbyteStateMessage, send_per_stream_state: bool) -> AirbyteMessage:
+        """
+        Updates the state of a stream from a per-stream state message created by another state manager, such as the state manager of a
+        stream read concurrently, and generates the state message of the stream from the state of all the streams
+        :param state_message: The per-stream state message holding the state of the stream
+        :param send_per_stream_state: Decides which state format the message should be generated as
+        :return: The Airbyte state message to be emitted by the connector during a sync
+        """
+        if state_message.stream is None:
+            raise ValueError(f"Expected a per-stream state message but got {state_message}")
+        stream_descriptor = state_message.stream.stream_descriptor
+        stream_state = state_message.stream.stream_state.dict() if state_message.stream.stream_state else {}
+        self.update_state_for_stream(stream_descriptor.name, stream_descriptor.namespace, stream_state)
+        return self.create_state_message(stream_descriptor.name, stream_descriptor.namespace, send_per_stream_state)
+
     @classmethod
     def _extract_from_state_message(
         cls, state: Optional[Union[List[AirbyteStateMessage], MutableMapping[str, Any]]], stream_instance_map: Mapping[str, Stream]
@@ -126,7 +160,7 @@ class ConnectorStateManager:
 
         if is_global:
             global_state = state[0].global_  # type: ignore # We verified state is a list in _is_global_state
-            shared_state = copy.deepcopy(global_state.shared_state, {})
+            shared_state = global_state.shared_state
             streams = {
                 HashableStreamDescriptor(
                     name=per_stream_state.stream_descriptor.name, namespace=per_stream_state.stream_descriptor.namespace
@@ -167,9 +201,14 @@ class ConnectorStateManager:
     def _get_legacy_state(self) -> Mapping[str, Any]:
         """
         Using the current per-stream state, creates a mapping of all the stream states for the connector being synced
-        :return: A deep copy of the mapping of stream name to stream state value
+        :return: The mapping of stream name to stream state value. The stream state values are snapshots and must not be modified
         """
-        return {descriptor.name: state.dict() if state else {} for descriptor, state in self.per_stream_states.items()}
+        with self._lock:
+            legacy_state = self._legacy_state
+            if legacy_state is None:
+                legacy_state = {descriptor.name: state for descriptor, state in self._serialized_states.items()}
+                self._legacy_state = legacy_state
+        return legacy_state
 
     @staticmethod
     def _is_legacy_dict_state(state: Union[List[AirbyteStateMessage], MutableMapping[str, Any]]) -> bool:
@@ -196,3 +235,29 @@ class ConnectorStateManager:
     @staticmethod
     def _is_per_stream_state(state: Union[List[AirbyteStateMessage], MutableMapping[str, Any]]) -> bool:
         return isinstance(state, List)
+
+
+class ConcurrentStreamStateManager(ConnectorStateManager):
+    """
+    State manager of a stream read concurrently with other streams. It only holds the state of that stream and its state messages are
+    always per-stream messages that are not emitted as is: the thread emitting the messages of all the streams applies them to the state
+    manager shared by the streams with update_state_from_message. The state messages are then generated in the order they are emitted, so
+    the legacy state of a message never holds an older state than the one of a message emitted before it, nor the state of records that
+    were not emitted yet.
+    """
+
+    def __init__(self, stream_name: str, namespace: Optional[str], stream_state: Mapping[str, Any]):
+        state = None
+        if stream_state:
+            stream_descriptor = StreamDescriptor(name=stream_name, namespace=namespace)
+            state = [
+                AirbyteStateMessage(
+                    type=AirbyteStateType.STREAM,
+                    stream=AirbyteStreamState(stream_descriptor=stream_descriptor, stream_state=AirbyteStateBlob.parse_obj(stream_state)),
+                )
+            ]
+        super().__init__({}, state)
+
+    def create_state_message(self, stream_name: str, namespace: Optional[str], send_per_stream_state: bool) -> AirbyteMessage:
+        # The format of the state message is chosen when it is applied to the state manager shared by the streams
+        return super().create_state_message(stream_name, namespace, send_per_stream_state=True)
@@ -3,7 +3,99 @@
 #
 
 import datetime
-from typing import Union
+import re
+from functools import lru_cache
+from typing import List, Optional, Union
+
+# Patterns of the directives that are parsed without strptime. They only match zero-padded values so that any value they match is parsed
+# the same way by strptime. Other values fall back to strptime.
+_DIRECTIVE_PATTERNS = {
+    "Y": r"\d{4}",
+    "m": r"0[1-9]|1[0-2]",
+    "d": r"0[1-9]|[12]\d|3[01]",
+    "H": r"[01]\d|2[0-3]",
+    "M": r"[0-5]\d",
+    "S": r"[0-5]\d",
+    "f": r"\d{1,6}",
+    "z": r"Z|[+-]\d{2}:?[0-5]\d",
+}
+# The directives in decreasing order of significance. Dates with these fixed width directives in this order sort like their strings
+_ORDERED_FIXED_WIDTH_DIRECTIVES = ["Y", "m", "d", "H", "M", "S"]
+
+
+class _CompiledFormat:
+    """
+    A datetime format compiled into a regular expression for the formats only made of numeric directives and literals, such as RFC 3339.
+    """
+
+    def __init__(self, pattern: str, directives: List[str]):
+        self._pattern = re.compile(pattern)
+        self.is_lexically_orderable = directives == [
+            directive for directive in _ORDERED_FIXED_WIDTH_DIRECTIVES if directive in directives
+        ]
+
+    def matches(self, date: str) -> bool:
+        return self._pattern.fullmatch(date) is not None
+
+    def parse(self, date: str) -> Optional[datetime.datetime]:
+        """
+        Return the parsed datetime, or None if the date must be parsed with strptime.
+        """
+        match = self._pattern.fullmatch(date)
+        if not match:
+            return None
+        values = match.groupdict()
+        tzinfo = self._parse_timezone(values["z"]) if "z" in values else None
+        try:
+            return datetime.datetime(
+                int(values.get("Y", 1900)),
+                int(values.get("m", 1)),
+                int(values.get("d", 1)),
+                int(values.get("H", 0)),
+                int(values.get("M", 0)),
+                int(values.get("S", 0)),
+                int(values["f"].ljust(6, "0")) if "f" in values else 0,
+                tzinfo=tzinfo,
+            )
+        except ValueError:
+            # Dates such as February 30th, strptime raises the error
+            return None
+
+    @staticmethod
+    def _parse_timezone(offset: str) -> datetime.timezone:
+        if offset == "Z":
+            return datetime.timezone.utc
+        seconds = int(offset[1:3]) * 3600 + int(offset[-2:]) * 60
+        return datetime.timezone(datetime.timedelta(seconds=-seconds if offset[0] == "-" else seconds))
+
+
+@lru_cache(maxsize=None)
+def _compile_format(format: str) -> Optional[_CompiledFormat]:
+    """
+    Compile the format into a parser, or return None if it contains directives or literals that must be handled by strptime.
+    """
+    pattern = []
+    directives = []
+    index = 0
+    while index < len(format):
+        char = format[index]
+        if char == "%":
+            directive = format[index + 1 : index + 2]
+            if directive == "%":
+                pattern.append("%")
+            elif directive in _DIRECTIVE_PATTERNS and directive not in directives:
+                pattern.append(f"(?P<{directive}>{_DIRECTIVE_PATTERNS[directive]})")
+                directives.append(directive)
+            else:
+                return None
+            index += 2
+        elif char.isspace():
+            # strptime matches any whitespace for a whitespace of the format
+            return None
+        else:
+            pattern.append(re.escape(char))
+            index += 1
+    return _CompiledFormat("".join(pattern), directives)
 
 
 class DatetimeParser:
@@ -14,6 +106,9 @@ class DatetimeParser:
 
     %s is part of the list of format codes required by  the 1989 C standard, but it is unreliable because it always return a datetime in the system's timezone.
     Instead of using the directive directly, we can use datetime.fromtimestamp and dt.timestamp()
+
+    Formats only made of numeric directives (%Y, %m, %d, %H, %M, %S, %f and %z) and literals, which includes RFC 3339, are compiled once
+    into a regular expression and parsed without strptime. Dates not matching the compiled format are parsed with strptime.
     """
 
     _UNIX_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
@@ -30,7 +125,10 @@ class DatetimeParser:
         elif format == "%ms":
             return self._UNIX_EPOCH + datetime.timedelta(milliseconds=int(date))
 
-        parsed_datetime = datetime.datetime.strptime(str(date), format)
+        compiled_format = _compile_format(format)
+        parsed_datetime = compiled_format.parse(str(date)) if compiled_format else None
+        if parsed_datetime is None:
+            parsed_datetime = datetime.datetime.strptime(str(date), format)
         if self._is_naive(parsed_datetime):
             return parsed_datetime.replace(tzinfo=datetime.timezone.utc)
         return parsed_datetime
@@ -47,5 +145,19 @@ class DatetimeParser:
         else:
             return dt.strftime(format)
 
+    def is_lexically_orderable(self, format: str) -> bool:
+        """
+        Return True if the dates of the format that match it exactly, see matches_exactly, are ordered like their string representations.
+        """
+        compiled_format = _compile_format(format)
+        return compiled_format is not None and compiled_format.is_lexically_orderable
+
+    def matches_exactly(self, date: str, format: str) -> bool:
+        """
+        Return True if the date is a zero-padded representation of the format, in which case it is the only representation of its datetime
+        """
+        compiled_format = _compile_format(format)
+        return compiled_format is not None and compiled_format.matches(date)
+
     def _is_naive(self, dt: datetime.datetime) -> bool:
         return dt.tzinfo is None or dt.tzinfo.utcoffset(dt) is None
@@ -0,0 +1,187 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import re
+from typing import Any, Dict, Generator, Iterable, Iterator, List
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class IncrementalJsonParser:
+    """
+    Parses a JSON document read in chunks and yields the values found at a path as soon as they are parsed, so that the memory used depends
+    on the size of the values rather than on the size of the document.
+
+    The path follows the semantics of the DpathExtractor's field path:
+    * without wildcard, the items of the array found at the path are yielded. A value that isn't an array is yielded if it is truthy
+    * with "*" segments matching any key of an object or any item of an array, every value matched by the path is yielded
+
+    The rest of the document is kept in `body_without_records` once all the records were read. The array of records is left empty and so
+    are the arrays and objects iterated with "*".
+    """
+
+    def __init__(self, chunks: Iterable[str], field_path: List[str]):
+        """
+        :param chunks: The chunks of text the document is made of
+        :param field_path: The keys and indexes to follow to the records
+        """
+        self._chunks = iter(chunks)
+        self._field_path = field_path
+        self._has_wildcard = "*" in field_path
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._is_exhausted = False
+        self.body_without_records: Any = None
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Yield the records. Raise a json.JSONDecodeError if the document is not valid JSON.
+        """
+        self.body_without_records = yield from self._extract(self._field_path)
+        self._skip_whitespace()
+        if self._position < len(self._buffer):
+            raise json.JSONDecodeError("Extra data", self._buffer, self._position)
+
+    def _extract(self, path: List[str]) -> Generator[Any, None, Any]:
+        """
+        Yield the records found by following the path from the value at the current position and return this value without the records.
+        """
+        if not path:
+            if self._has_wildcard:
+                yield self._read_value()
+                return None
+            if self._peek() == "[":
+                yield from self._read_items()
+                return []
+            value = self._read_value()
+            if value:
+                yield value
+            return value
+
+        next_char = self._peek()
+        if next_char == "{":
+            return (yield from self._extract_from_object(path))
+        elif next_char == "[":
+            return (yield from self._extract_from_array(path))
+        # The path can't be followed through a scalar value
+        return self._read_value()
+
+    def _extract_from_object(self, path: List[str]) -> Generator[Any, None, Any]:
+        segment = path[0]
+        remainder: Dict[str, Any] = {}
+        self._consume("{")
+        if self._peek() == "}":
+            self._consume("}")
+            return remainder
+        while True:
+            key = self._read_value()
+            if not isinstance(key, str):
+                raise json.JSONDecodeError("Expecting property name enclosed in double quotes", self._buffer, self._position)
+            self._consume(":")
+            if segment == "*":
+                yield from self._extract(path[1:])
+            elif key == segment:
+                remainder[key] = yield from self._extract(path[1:])
+            else:
+                remainder[key] = self._read_value()
+            if self._consume(",", "}") == "}":
+                return remainder
+
+    def _extract_from_array(self, path: List[str]) -> Generator[Any, None, Any]:
+        segment = path[0]
+        remainder: List[Any] = []
+        self._consume("[")
+        if self._peek() == "]":
+            self._consume("]")
+            return remainder
+        index = 0
+        while True:
+            if segment == "*":
+                yield from self._extract(path[1:])
+            elif segment == str(index):
+                remainder.append((yield from self._extract(path[1:])))
+            else:
+                remainder.append(self._read_value())
+            index += 1
+            if self._consume(",", "]") == "]":
+                return remainder
+
+    def _read_items(self) -> Iterator[Any]:
+        self._consume("[")
+        if self._peek() == "]":
+            self._consume("]")
+            return
+        while True:
+            yield self._read_value()
+            if self._consume(",", "]") == "]":
+                return
+
+    def _read_value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+                if self._is_exhausted or not self._number_may_continue(value, end):
+                    self._position = end
+                    return value
+            except json.JSONDecodeError:
+                if self._is_exhausted:
+                    raise
+            self._read_more()
+
+    def _number_may_continue(self, value: Any, end: int) -> bool:
+        """
+        A number at the end of the buffer or followed by the start of a fraction or an exponent could continue in the next chunk.
+        """
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return False
+        return end == len(self._buffer) or self._buffer[end] in ".eE+-"
+
+    def _consume(self, *expected_chars: str) -> str:
+        next_char = self._peek()
+        if next_char not in expected_chars:
+            raise json.JSONDecodeError(f"Expecting {' or '.join(repr(char) for char in expected_chars)}", self._buffer, self._position)
+        self._position += 1
+        return next_char
+
+    def _peek(self) -> str:
+        """
+        Return the next character that is not whitespace without consuming it.
+        """
+        while True:
+            self._skip_whitespace()
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._read_chunk():
+                raise json.JSONDecodeError("Expecting value", self._buffer, self._position)
+
+    def _skip_whitespace(self) -> None:
+        while True:
+            self._position = _WHITESPACE.match(self._buffer, self._position).end()  # type: ignore # the pattern matches empty strings
+            if self._position < len(self._buffer) or not self._read_chunk():
+                return
+
+    def _read_more(self) -> None:
+        """
+        Read chunks until the text left to parse doubled so that values spanning many chunks are not parsed again for every chunk.
+        """
+        target_size = 2 * (len(self._buffer) - self._position) + 1
+        while len(self._buffer) - self._position < target_size and self._read_chunk():
+            pass
+
+    def _read_chunk(self) -> bool:
+        """
+        Append the next chunk to the text left to parse. Return False if there are no more chunks.
+        """
+        if self._is_exhausted:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._is_exhausted = True
+            return False
+        self._buffer = self._buffer[self._position :] + chunk
+        self._position = 0
+        return True
@@ -2,23 +2,81 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import codecs
+import json
 from dataclasses import InitVar, dataclass
-from typing import Any, List, Mapping, Union
+from typing import Any, Iterator, List, Mapping, Union
+from weakref import WeakKeyDictionary
 
 import requests
 from airbyte_cdk.sources.declarative.decoders.decoder import Decoder
+from airbyte_cdk.sources.declarative.decoders.incremental_json_parser import IncrementalJsonParser
+
+# The paginator, the stop conditions and the error handler all read the body of the same response. The decoded body is kept for as long as
+# the response is so that it is only decoded once. It is shared by all these components and must not be modified: the records extracted from
+# a response are modified by the transformations and the consumers of the stream so they are copied from the shared body.
+_decoded_bodies: "WeakKeyDictionary[requests.Response, Union[Mapping[str, Any], List[Any]]]" = WeakKeyDictionary()
+
+_STREAM_CHUNK_SIZE = 64 * 1024
 
 
 @dataclass
 class JsonDecoder(Decoder):
     """
     Decoder strategy that returns the json-encoded content of a response, if any.
+
+    The content of a response is decoded once and the same decoded body is returned every time the response is decoded. The decoded body
+    is shared and must not be modified.
     """
 
     parameters: InitVar[Mapping[str, Any]]
 
-    def decode(self, response: requests.Response) -> Union[Mapping[str, Any], List]:
-        try:
-            return response.json()
-        except requests.exceptions.JSONDecodeError:
-            return {}
+    def decode(self, response: requests.Response) -> Union[Mapping[str, Any], List[Any]]:
+        return decode_json_body(response)
+
+
+def decode_json_body(response: requests.Response) -> Union[Mapping[str, Any], List[Any]]:
+    """
+    Return the json-encoded content of the response or an empty mapping if the content is not valid json.
+    """
+    try:
+        return _decoded_bodies[response]
+    except KeyError:
+        pass
+    body: Union[Mapping[str, Any], List[Any]]
+    try:
+        body = response.json()
+    except requests.exceptions.JSONDecodeError:
+        body = {}
+    _decoded_bodies[response] = body
+    return body
+
+
+def copy_decoded_json(value: Any) -> Any:
+    """
+    Return a copy of a decoded json value so that it can be handed to code that modifies it without modifying the shared decoded body. As
+    json values are only made of dicts, lists and immutable scalars, this is cheaper than copy.deepcopy.
+    """
+    if isinstance(value, dict):
+        return {key: copy_decoded_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_decoded_json(item) for item in value]
+    return value
+
+
+def stream_json_records(response: requests.Response, field_path: List[str]) -> Iterator[Any]:
+    """
+    Yield the records found at the field path while the json-encoded content of the response is read. Once the records were read, the
+    content without the records is what decoding the response returns.
+
+    Like when the response is decoded, content that is not valid json is considered empty. Records parsed before the invalid content was
+    read are still returned.
+    """
+    chunks = codecs.iterdecode(response.iter_content(chunk_size=_STREAM_CHUNK_SIZE), response.encoding or "utf-8")
+    parser = IncrementalJsonParser(chunks, field_path)
+    try:
+        yield from parser
+        body = parser.body_without_records
+    except json.JSONDecodeError:
+        body = {}
+    _decoded_bodies[response] = body
@@ -3,12 +3,12 @@
 #
 
 from dataclasses import InitVar, dataclass
-from typing import Any, List, Mapping, Union
+from typing import Any, Iterable, List, Mapping, Union
 
 import dpath.util
 import requests
 from airbyte_cdk.sources.declarative.decoders.decoder import Decoder
-from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder, copy_decoded_json, stream_json_records
 from airbyte_cdk.sources.declarative.extractors.record_extractor import RecordExtractor
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
 from airbyte_cdk.sources.declarative.types import Config
@@ -47,32 +47,43 @@ class DpathExtractor(RecordExtractor):
         field_path: []
     ```
 
+    If stream_records is set, the records are parsed from the JSON content of the response while it is read and returned one at a time
+    instead of decoding the whole response first. The rest of the response is still decoded for the other components but the array of
+    records is left empty.
+
     Attributes:
         field_path (Union[InterpolatedString, str]): Path to the field that should be extracted
         config (Config): The user-provided configuration as specified by the source's spec
         decoder (Decoder): The decoder responsible to transfom the response in a Mapping
+        stream_records (bool): Whether the records are parsed as the response is read
     """
 
     field_path: List[Union[InterpolatedString, str]]
     config: Config
     parameters: InitVar[Mapping[str, Any]]
     decoder: Decoder = JsonDecoder(parameters={})
+    stream_records: bool = False
 
     def __post_init__(self, parameters: Mapping[str, Any]):
         for path_index in range(len(self.field_path)):
             if isinstance(self.field_path[path_index], str):
                 self.field_path[path_index] = InterpolatedString.create(self.field_path[path_index], parameters=parameters)
 
-    def extract_records(self, response: requests.Response) -> List[Mapping[str, Any]]:
+    def extract_records(self, response: requests.Response) -> Iterable[Mapping[str, Any]]:
+        path = [path.eval(self.config) for path in self.field_path]
+        if self.stream_records:
+            return stream_json_records(response, path)
         response_body = self.decoder.decode(response)
-        if len(self.field_path) == 0:
+        if len(path) == 0:
             extracted = response_body
         else:
-            path = [path.eval(self.config) for path in self.field_path]
             if "*" in path:
                 extracted = dpath.util.values(response_body, path)
             else:
                 extracted = dpath.util.get(response_body, path, default=[])
+        if isinstance(self.decoder, JsonDecoder):
+            # The records are modified once extracted so they are copied out of the body JsonDecoder shares with the other components
+            extracted = copy_decoded_json(extracted)
         if isinstance(extracted, list):
             return extracted
         elif extracted:
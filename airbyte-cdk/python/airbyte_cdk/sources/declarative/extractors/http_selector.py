@@ -4,7 +4,7 @@
 
 from abc import abstractmethod
 from dataclasses import dataclass
-from typing import Any, List, Mapping, Optional
+from typing import Any, Iterable, Mapping, Optional
 
 import requests
 from airbyte_cdk.sources.declarative.types import Record, StreamSlice, StreamState
@@ -24,13 +24,13 @@ class HttpSelector:
         stream_state: StreamState,
         stream_slice: Optional[StreamSlice] = None,
         next_page_token: Optional[Mapping[str, Any]] = None,
-    ) -> List[Record]:
+    ) -> Iterable[Record]:
         """
         Selects records from the response
         :param response: The response to select the records from
         :param stream_state: The stream state
         :param stream_slice: The stream slice
         :param next_page_token: The paginator token
-        :return: List of Records selected from the response
+        :return: List of Records selected from the response or an iterator over them if they are streamed from the response
         """
         pass
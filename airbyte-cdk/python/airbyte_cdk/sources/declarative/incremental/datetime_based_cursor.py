@@ -99,6 +99,16 @@ class DatetimeBasedCursor(Cursor):
         if not self.cursor_datetime_formats:
             self.cursor_datetime_formats = [self.datetime_format]
 
+        # The format that parsed the last cursor value is tried first as the cursor values of a stream usually share the same format
+        self._last_parsed_datetime_format: Optional[str] = None
+        # Cursor values of a single lexically orderable format are compared as strings rather than parsed
+        cursor_datetime_formats = set(self.cursor_datetime_formats + [self.datetime_format])
+        self._lexically_orderable_format = (
+            self.datetime_format
+            if cursor_datetime_formats == {self.datetime_format} and self._parser.is_lexically_orderable(self.datetime_format)
+            else None
+        )
+
     def get_stream_state(self) -> StreamState:
         return {self.cursor_field.eval(self.config): self._cursor} if self._cursor else {}
 
@@ -114,6 +124,10 @@ class DatetimeBasedCursor(Cursor):
     def close_slice(self, stream_slice: StreamSlice, most_recent_record: Optional[Record]) -> None:
         last_record_cursor_value = most_recent_record.get(self.cursor_field.eval(self.config)) if most_recent_record else None
         stream_slice_value_end = stream_slice.get(self.partition_field_end.eval(self.config))
+        cursor_values = [cursor_value for cursor_value in [self._cursor, last_record_cursor_value, stream_slice_value_end] if cursor_value]
+        if cursor_values and self._are_lexically_comparable(*cursor_values):
+            self._cursor = max(cursor_values)
+            return
         cursor_value_str_by_cursor_value_datetime = dict(
             map(
                 # we need to ensure the cursor value is preserved as is in the state else the CATs might complain of something like
@@ -188,13 +202,29 @@ class DatetimeBasedCursor(Cursor):
         return comparator(cursor_date, default_date)
 
     def parse_date(self, date: str) -> datetime.datetime:
-        for datetime_format in self.cursor_datetime_formats + [self.datetime_format]:
+        if self._last_parsed_datetime_format:
             try:
-                return self._parser.parse(date, datetime_format)
+                return self._parser.parse(date, self._last_parsed_datetime_format)
             except ValueError:
                 pass
+        for datetime_format in self.cursor_datetime_formats + [self.datetime_format]:
+            if datetime_format == self._last_parsed_datetime_format:
+                continue
+            try:
+                parsed_date = self._parser.parse(date, datetime_format)
+            except ValueError:
+                continue
+            self._last_parsed_datetime_format = datetime_format
+            return parsed_date
         raise ValueError(f"No format in {self.cursor_datetime_formats} matching {date}")
 
+    def _are_lexically_comparable(self, *cursor_values: Any) -> bool:
+        lexically_orderable_format = self._lexically_orderable_format
+        return lexically_orderable_format is not None and all(
+            isinstance(cursor_value, str) and self._parser.matches_exactly(cursor_value, lexically_orderable_format)
+            for cursor_value in cursor_values
+        )
+
     @classmethod
     def _parse_timedelta(cls, time_str) -> Union[datetime.timedelta, Duration]:
         """
@@ -280,6 +310,8 @@ class DatetimeBasedCursor(Cursor):
         first_cursor_value = first.get(cursor_field)
         second_cursor_value = second.get(cursor_field)
         if first_cursor_value and second_cursor_value:
+            if self._are_lexically_comparable(first_cursor_value, second_cursor_value):
+                return bool(first_cursor_value >= second_cursor_value)
             return self.parse_date(first_cursor_value) >= self.parse_date(second_cursor_value)
         elif first_cursor_value:
             return True
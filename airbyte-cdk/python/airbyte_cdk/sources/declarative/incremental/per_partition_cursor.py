@@ -2,8 +2,9 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import heapq
 import json
-from typing import Any, Callable, Iterable, Mapping, Optional
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set
 
 from airbyte_cdk.sources.declarative.incremental.cursor import Cursor
 from airbyte_cdk.sources.declarative.stream_slicers.stream_slicer import StreamSlicer
@@ -29,9 +30,15 @@ class PerPartitionKeySerializer:
 
 
 class PerPartitionStreamSlice(StreamSlice):
-    def __init__(self, partition: Mapping[str, Any], cursor_slice: Mapping[str, Any]):
+    def __init__(self, partition: Mapping[str, Any], cursor_slice: Mapping[str, Any], partition_key: Optional[str] = None):
+        """
+        :param partition: The partition the slice belongs to
+        :param cursor_slice: The slice of the cursor of the partition
+        :param partition_key: The serialized partition, when already known, so that it doesn't need to be serialized again
+        """
         self._partition = partition
         self._cursor_slice = cursor_slice
+        self._partition_key = partition_key
         if partition.keys() & cursor_slice.keys():
             raise ValueError("Keys for partition and incremental sync cursor should not overlap")
         self._stream_slice = dict(partition) | dict(cursor_slice)
@@ -44,6 +51,10 @@ class PerPartitionStreamSlice(StreamSlice):
     def cursor_slice(self):
         return self._cursor_slice
 
+    @property
+    def partition_key(self) -> Optional[str]:
+        return self._partition_key
+
     def __repr__(self):
         return repr(self._stream_slice)
 
@@ -94,6 +105,25 @@ class CursorFactory:
         return self._create_function()
 
 
+class _PartitionState:
+    """
+    The state of a partition, ordered using the comparison of the cursor of the partition.
+    """
+
+    __slots__ = ("partition_key", "cursor_state", "_cursor")
+
+    def __init__(self, partition_key: str, cursor_state: StreamState, cursor: Cursor):
+        self.partition_key = partition_key
+        self.cursor_state = cursor_state
+        self._cursor = cursor
+
+    def __lt__(self, other: "_PartitionState") -> bool:
+        return self.is_older_than(other.cursor_state)
+
+    def is_older_than(self, cursor_state: StreamState) -> bool:
+        return not self._cursor.is_greater_than_or_equal(Record(self.cursor_state, {}), Record(cursor_state, {}))
+
+
 class PerPartitionCursor(Cursor):
     """
     Given a stream has many partitions, it is important to provide a state per partition.
@@ -113,6 +143,17 @@ class PerPartitionCursor(Cursor):
     Between record #3 and #4 | Duplication | #1, #2
 
     Therefore, we need to manage state per partition.
+
+    The state lists the cursor state of every partition: `{"states": [{"partition": ..., "cursor": ...}, ...]}`. The partitions are
+    serialized once and the state of a partition is only requested again from its cursor once a slice of the partition was closed.
+
+    With many partitions, the state can be collapsed by setting max_partitions_in_state. Once there are more partitions than that, the
+    state is `{"state": <global cursor state>, "states": [...]}` where the global cursor state is the oldest state of all the partitions and
+    is used for every partition not listed in `states`. Only the partitions without state are listed so that they are still read from the
+    start, which is only possible when they are at most max_partitions_in_state. This requires the states to be comparable using the
+    `is_greater_than_or_equal` method of the cursor, like the ones of the DatetimeBasedCursor. Collapsing the state means that
+    partitions are read again from the global cursor state and that partitions created after the state was collapsed are only read from
+    the global cursor state.
     """
 
     _NO_STATE = {}
@@ -120,38 +161,52 @@ class PerPartitionCursor(Cursor):
     _KEY = 0
     _VALUE = 1
 
-    def __init__(self, cursor_factory: CursorFactory, partition_router: StreamSlicer):
+    def __init__(self, cursor_factory: CursorFactory, partition_router: StreamSlicer, max_partitions_in_state: Optional[int] = None):
         self._cursor_factory = cursor_factory
         self._partition_router = partition_router
+        self._max_partitions_in_state = max_partitions_in_state
         self._cursor_per_partition = {}
         self._partition_serializer = PerPartitionKeySerializer()
+        self._partitions: Dict[str, Mapping[str, Any]] = {}
+        # The entries of the state per partition, in the order the partitions were created. Partitions without state have no entry
+        self._state_entries: Dict[str, Optional[Mapping[str, Any]]] = {}
+        # Used as an ordered set so that the partitions are listed in a stable order
+        self._partitions_without_state: Dict[str, None] = {}
+        self._dirty_partitions: Set[str] = set()
+        # Heap of the states of the partitions to find the oldest one when collapsing the state. States that were replaced are skipped
+        self._partition_states: List[_PartitionState] = []
+        self._global_state: Optional[StreamState] = None
+        self._all_partitions_known = False
 
     def stream_slices(self) -> Iterable[PerPartitionStreamSlice]:
         slices = self._partition_router.stream_slices()
         for partition in slices:
-            cursor = self._cursor_per_partition.get(self._to_partition_key(partition))
+            partition_key = self._to_partition_key(partition)
+            cursor = self._cursor_per_partition.get(partition_key)
             if not cursor:
-                cursor = self._create_cursor(self._NO_CURSOR_STATE)
-                self._cursor_per_partition[self._to_partition_key(partition)] = cursor
+                # Partitions missing from a collapsed state are read from the global cursor state
+                cursor = self._create_partition_cursor(partition_key, partition, self._global_state or self._NO_CURSOR_STATE)
 
             for cursor_slice in cursor.stream_slices():
-                yield PerPartitionStreamSlice(partition, cursor_slice)
+                yield PerPartitionStreamSlice(partition, cursor_slice, partition_key)
+        self._all_partitions_known = True
 
     def set_initial_state(self, stream_state: StreamState) -> None:
         if not stream_state:
             return
 
+        self._global_state = stream_state.get("state")
         for state in stream_state["states"]:
-            self._cursor_per_partition[self._to_partition_key(state["partition"])] = self._create_cursor(state["cursor"])
+            self._create_partition_cursor(self._to_partition_key(state["partition"]), state["partition"], state["cursor"])
 
     def close_slice(self, stream_slice: StreamSlice, most_recent_record: Optional[Record]) -> None:
         try:
             cursor_most_recent_record = (
                 Record(most_recent_record.data, stream_slice.cursor_slice) if most_recent_record else most_recent_record
             )
-            self._cursor_per_partition[self._to_partition_key(stream_slice.partition)].close_slice(
-                stream_slice.cursor_slice, cursor_most_recent_record
-            )
+            partition_key = self._get_partition_key(stream_slice)
+            self._cursor_per_partition[partition_key].close_slice(stream_slice.cursor_slice, cursor_most_recent_record)
+            self._dirty_partitions.add(partition_key)
         except KeyError as exception:
             raise ValueError(
                 f"Partition {str(exception)} could not be found in current state based on the record. This is unexpected because "
@@ -159,17 +214,81 @@ class PerPartitionCursor(Cursor):
             )
 
     def get_stream_state(self) -> StreamState:
-        states = []
-        for partition_tuple, cursor in self._cursor_per_partition.items():
+        self._update_dirty_states()
+        if self._max_partitions_in_state is not None and len(self._state_entries) > self._max_partitions_in_state:
+            collapsed_state = self._get_collapsed_state()
+            if collapsed_state is not None:
+                return collapsed_state
+
+        states = [entry for entry in self._state_entries.values() if entry]
+        if self._global_state and not self._all_partitions_known:
+            return {"state": self._global_state, "states": states}
+        return {"states": states}
+
+    def _create_partition_cursor(self, partition_key: str, partition: Mapping[str, Any], cursor_state: Any) -> StreamSlicer:
+        cursor = self._create_cursor(cursor_state)
+        self._cursor_per_partition[partition_key] = cursor
+        self._partitions[partition_key] = partition
+        self._state_entries.setdefault(partition_key, None)
+        self._dirty_partitions.add(partition_key)
+        return cursor
+
+    def _update_dirty_states(self) -> None:
+        """
+        Update the state entries of the partitions whose state might have changed since the state was last requested.
+        """
+        for partition_key in self._dirty_partitions:
+            cursor = self._cursor_per_partition[partition_key]
             cursor_state = cursor.get_stream_state()
             if cursor_state:
-                states.append(
-                    {
-                        "partition": self._to_dict(partition_tuple),
-                        "cursor": cursor_state,
-                    }
-                )
-        return {"states": states}
+                self._state_entries[partition_key] = {"partition": self._partitions[partition_key], "cursor": cursor_state}
+                self._partitions_without_state.pop(partition_key, None)
+                if self._max_partitions_in_state is not None:
+                    heapq.heappush(self._partition_states, _PartitionState(partition_key, cursor_state, cursor))
+            else:
+                self._state_entries[partition_key] = None
+                self._partitions_without_state[partition_key] = None
+        self._dirty_partitions.clear()
+
+    def _get_collapsed_state(self) -> Optional[StreamState]:
+        """
+        Return the state made of the global cursor state and of the partitions without state, or None if the state can't be collapsed.
+        """
+        if len(self._partitions_without_state) > self._max_partitions_in_state:  # type: ignore # only called when the maximum is set
+            return None
+        # Partitions that are not known yet would be read from the global cursor state if there was no global cursor state to start from
+        if not self._all_partitions_known and not self._global_state:
+            return None
+
+        oldest_state = self._get_oldest_partition_state()
+        if oldest_state is None:
+            global_state = self._global_state
+        elif self._global_state and not self._all_partitions_known and not oldest_state.is_older_than(self._global_state):
+            global_state = self._global_state
+        else:
+            global_state = oldest_state.cursor_state
+        if not global_state:
+            return None
+
+        return {
+            "state": global_state,
+            "states": [
+                {"partition": self._partitions[partition_key], "cursor": self._NO_CURSOR_STATE}
+                for partition_key in self._partitions_without_state
+            ],
+        }
+
+    def _get_oldest_partition_state(self) -> Optional[_PartitionState]:
+        if len(self._partition_states) > 2 * len(self._state_entries):
+            self._partition_states = [partition_state for partition_state in self._partition_states if self._is_current(partition_state)]
+            heapq.heapify(self._partition_states)
+        while self._partition_states and not self._is_current(self._partition_states[0]):
+            heapq.heappop(self._partition_states)
+        return self._partition_states[0] if self._partition_states else None
+
+    def _is_current(self, partition_state: _PartitionState) -> bool:
+        entry = self._state_entries.get(partition_state.partition_key)
+        return entry is not None and entry["cursor"] is partition_state.cursor_state
 
     def _get_state_for_partition(self, partition: Mapping[str, Any]) -> Optional[StreamState]:
         cursor = self._cursor_per_partition.get(self._to_partition_key(partition))
@@ -182,9 +301,15 @@ class PerPartitionCursor(Cursor):
     def _is_new_state(stream_state):
         return not bool(stream_state)
 
-    def _to_partition_key(self, partition) -> tuple:
+    def _to_partition_key(self, partition) -> str:
         return self._partition_serializer.to_partition_key(partition)
 
+    def _get_partition_key(self, stream_slice: Optional[StreamSlice]) -> str:
+        if stream_slice is None:
+            raise ValueError("A partition needs to be provided in order to find its cursor")
+        partition_key = stream_slice.partition_key if isinstance(stream_slice, PerPartitionStreamSlice) else None
+        return partition_key or self._to_partition_key(stream_slice.partition)
+
     def _to_dict(self, partition_key: tuple) -> StreamSlice:
         return self._partition_serializer.to_partition(partition_key)
 
@@ -211,7 +336,7 @@ class PerPartitionCursor(Cursor):
     ) -> Mapping[str, Any]:
         return self._partition_router.get_request_params(
             stream_state=stream_state, stream_slice=stream_slice.partition, next_page_token=next_page_token
-        ) | self._cursor_per_partition[self._to_partition_key(stream_slice.partition)].get_request_params(
+        ) | self._cursor_per_partition[self._get_partition_key(stream_slice)].get_request_params(
             stream_state=stream_state, stream_slice=stream_slice.cursor_slice, next_page_token=next_page_token
         )
 
@@ -224,7 +349,7 @@ class PerPartitionCursor(Cursor):
     ) -> Mapping[str, Any]:
         return self._partition_router.get_request_headers(
             stream_state=stream_state, stream_slice=stream_slice.partition, next_page_token=next_page_token
-        ) | self._cursor_per_partition[self._to_partition_key(stream_slice.partition)].get_request_headers(
+        ) | self._cursor_per_partition[self._get_partition_key(stream_slice)].get_request_headers(
             stream_state=stream_state, stream_slice=stream_slice.cursor_slice, next_page_token=next_page_token
         )
 
@@ -237,7 +362,7 @@ class PerPartitionCursor(Cursor):
     ) -> Mapping[str, Any]:
         return self._partition_router.get_request_body_data(
             stream_state=stream_state, stream_slice=stream_slice.partition, next_page_token=next_page_token
-        ) | self._cursor_per_partition[self._to_partition_key(stream_slice.partition)].get_request_body_data(
+        ) | self._cursor_per_partition[self._get_partition_key(stream_slice)].get_request_body_data(
             stream_state=stream_state, stream_slice=stream_slice.cursor_slice, next_page_token=next_page_token
         )
 
@@ -250,7 +375,7 @@ class PerPartitionCursor(Cursor):
     ) -> Mapping[str, Any]:
         return self._partition_router.get_request_body_json(
             stream_state=stream_state, stream_slice=stream_slice.partition, next_page_token=next_page_token
-        ) | self._cursor_per_partition[self._to_partition_key(stream_slice.partition)].get_request_body_json(
+        ) | self._cursor_per_partition[self._get_partition_key(stream_slice)].get_request_body_json(
             stream_state=stream_state, stream_slice=stream_slice.cursor_slice, next_page_token=next_page_token
         )
 
@@ -272,7 +397,7 @@ class PerPartitionCursor(Cursor):
         return Record(record.data, record.associated_slice.cursor_slice)
 
     def _get_cursor(self, record: Record) -> Cursor:
-        partition_key = self._to_partition_key(record.associated_slice.partition)
+        partition_key = self._get_partition_key(record.associated_slice)
         if partition_key not in self._cursor_per_partition:
             raise ValueError("Invalid state as stream slices that are emitted should refer to an existing cursor")
         cursor = self._cursor_per_partition[partition_key]
@@ -28,6 +28,8 @@ class InterpolatedString:
         self.default = self.default or self.string
         self._interpolation = JinjaInterpolation()
         self._parameters = parameters
+        # Strings without any jinja expression evaluate to themselves so there's no need to go through the template engine
+        self._is_static = JinjaInterpolation.is_static(self.string)
 
     def eval(self, config: Config, **kwargs):
         """
@@ -37,6 +39,8 @@ class InterpolatedString:
         :param kwargs: Optional parameters used for interpolation
         :return: The interpolated string
         """
+        if self._is_static:
+            return self._interpolation._literal_eval(self.string, None)
         return self._interpolation.eval(self.string, config, self.default, parameters=self._parameters, **kwargs)
 
     def __eq__(self, other):
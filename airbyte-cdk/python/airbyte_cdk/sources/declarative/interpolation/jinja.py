@@ -3,13 +3,14 @@
 #
 
 import ast
-from typing import Any, Optional, Tuple, Type
+from functools import lru_cache
+from typing import Any, Optional, Set, Tuple, Type
 
 from airbyte_cdk.sources.declarative.interpolation.filters import filters
 from airbyte_cdk.sources.declarative.interpolation.interpolation import Interpolation
 from airbyte_cdk.sources.declarative.interpolation.macros import macros
 from airbyte_cdk.sources.declarative.types import Config
-from jinja2 import meta
+from jinja2 import Template, meta
 from jinja2.exceptions import UndefinedError
 from jinja2.sandbox import Environment
 
@@ -48,15 +49,8 @@ class JinjaInterpolation(Interpolation):
     # Please add a unit test to test_jinja.py when adding a restriction.
     RESTRICTED_BUILTIN_FUNCTIONS = ["range"]  # The range function can cause very expensive computations
 
-    def __init__(self):
-        self._environment = Environment()
-        self._environment.filters.update(**filters)
-        self._environment.globals.update(**macros)
-
-        for extension in self.RESTRICTED_EXTENSIONS:
-            self._environment.extensions.pop(extension, None)
-        for builtin in self.RESTRICTED_BUILTIN_FUNCTIONS:
-            self._environment.globals.pop(builtin, None)
+    # Delimiters that make a string a jinja template. Strings without any of them are rendered as-is by jinja.
+    TEMPLATE_DELIMITERS = ("{{", "{%", "{#")
 
     def eval(
         self,
@@ -99,15 +93,55 @@ class JinjaInterpolation(Interpolation):
             return evaluated
         return result
 
+    @classmethod
+    def is_static(cls, s: Any) -> bool:
+        """
+        Returns True if rendering the string with jinja would return it unchanged, in which case interpolation can be skipped.
+
+        Jinja strips a single trailing newline and normalizes line endings, so strings affected by either are not considered static.
+        """
+        if not isinstance(s, str) or not s:
+            return False
+        return not any(delimiter in s for delimiter in cls.TEMPLATE_DELIMITERS) and "\r" not in s and not s.endswith("\n")
+
     def _eval(self, s: str, context):
         try:
-            ast = self._environment.parse(s)
-            undeclared = meta.find_undeclared_variables(ast)
+            undeclared = _find_undeclared_variables(s)
             undeclared_not_in_context = {var for var in undeclared if var not in context}
             if undeclared_not_in_context:
                 raise ValueError(f"Jinja macro has undeclared variables: {undeclared_not_in_context}. Context: {context}")
-            return self._environment.from_string(s).render(context)
+            return _compile(s).render(context)
         except TypeError:
             # The string is a static value, not a jinja template
             # It can be returned as is
             return s
+
+
+@lru_cache(maxsize=None)
+def _get_environment() -> Environment:
+    """
+    Return the environment shared by all the interpolations. The environment is never modified once created so that the templates compiled
+    with it can be shared too.
+    """
+    environment = Environment()
+    environment.filters.update(**filters)
+    environment.globals.update(**macros)
+
+    for extension in JinjaInterpolation.RESTRICTED_EXTENSIONS:
+        environment.extensions.pop(extension, None)
+    for builtin in JinjaInterpolation.RESTRICTED_BUILTIN_FUNCTIONS:
+        environment.globals.pop(builtin, None)
+    return environment
+
+
+# Parsing and compiling a template is much more expensive than rendering it, and the same templates are evaluated for every record, slice
+# and page by many components. The caches are keyed by the template only so that the components of a source share them, and are bounded
+# to limit the memory footprint of connectors generating templates dynamically.
+@lru_cache(maxsize=1024)
+def _find_undeclared_variables(s: str) -> Set[str]:
+    return meta.find_undeclared_variables(_get_environment().parse(s))
+
+
+@lru_cache(maxsize=1024)
+def _compile(s: str) -> Template:
+    return _get_environment().from_string(s)
@@ -22,6 +22,7 @@ from airbyte_cdk.sources.declarative.declarative_source import DeclarativeSource
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import CheckStream as CheckStreamModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import DeclarativeStream as DeclarativeStreamModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import Spec as SpecModel
+from airbyte_cdk.sources.declarative.parsers.compiled_manifest import CompiledManifest
 from airbyte_cdk.sources.declarative.parsers.manifest_component_transformer import ManifestComponentTransformer
 from airbyte_cdk.sources.declarative.parsers.manifest_reference_resolver import ManifestReferenceResolver
 from airbyte_cdk.sources.declarative.parsers.model_to_component_factory import ModelToComponentFactory
@@ -44,29 +45,37 @@ class ManifestDeclarativeSource(DeclarativeSource):
         debug: bool = False,
         emit_connector_builder_messages: bool = False,
         component_factory: Optional[ModelToComponentFactory] = None,
+        compiled_manifest: Optional[CompiledManifest] = None,
     ):
         """
         :param source_config(Mapping[str, Any]): The manifest of low-code components that describe the source connector
         :param debug(bool): True if debug mode is enabled
         :param component_factory(ModelToComponentFactory): optional factory if ModelToComponentFactory's default behaviour needs to be tweaked
+        :param compiled_manifest(CompiledManifest): optional manifest compiled from source_config. When it is set, source_config is not
+        resolved nor validated again and the resolved manifest of the compiled manifest is used instead
         """
         self.logger = logging.getLogger(f"airbyte.{self.name}")
 
-        # For ease of use we don't require the type to be specified at the top level manifest, but it should be included during processing
-        manifest = dict(source_config)
-        if "type" not in manifest:
-            manifest["type"] = "DeclarativeSource"
-
-        resolved_source_config = ManifestReferenceResolver().preprocess_manifest(manifest)
-        propagated_source_config = ManifestComponentTransformer().propagate_types_and_parameters("", resolved_source_config, {})
-        self._source_config = propagated_source_config
+        if compiled_manifest:
+            self._source_config: Mapping[str, Any] = dict(compiled_manifest.resolved_manifest)
+        else:
+            # For ease of use we don't require the type to be specified at the top level manifest, but it should be included during
+            # processing
+            manifest = dict(source_config)
+            if "type" not in manifest:
+                manifest["type"] = "DeclarativeSource"
+
+            resolved_source_config = ManifestReferenceResolver().preprocess_manifest(manifest)
+            propagated_source_config = ManifestComponentTransformer().propagate_types_and_parameters("", resolved_source_config, {})
+            self._source_config = propagated_source_config
         self._debug = debug
         self._emit_connector_builder_messages = emit_connector_builder_messages
         self._constructor = component_factory if component_factory else ModelToComponentFactory(emit_connector_builder_messages)
         self._message_repository = self._constructor.get_message_repository()
         self._slice_logger: SliceLogger = AlwaysLogSliceLogger() if emit_connector_builder_messages else DebugSliceLogger()
 
-        self._validate_source()
+        if not compiled_manifest:
+            self._validate_source()
 
     @property
     def resolved_manifest(self) -> Mapping[str, Any]:
@@ -131,6 +140,11 @@ class ManifestDeclarativeSource(DeclarativeSource):
         state: Optional[Union[List[AirbyteStateMessage], MutableMapping[str, Any]]] = None,
     ) -> Iterator[AirbyteMessage]:
         self._configure_logger_level(logger)
+        # Parent records are only cached for the substreams being read so that they are not kept for substreams that will never read them
+        configured_streams = getattr(catalog, "streams", None)
+        if configured_streams is not None:
+            parent_record_cache = self._constructor.get_parent_record_cache()
+            parent_record_cache.select_dependents(configured_stream.stream.name for configured_stream in configured_streams)
         yield from super().read(logger, config, catalog, state)
 
     def _configure_logger_level(self, logger: logging.Logger) -> None:
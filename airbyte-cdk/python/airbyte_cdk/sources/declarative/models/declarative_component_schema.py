@@ -6,7 +6,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Extra, Field
+from pydantic import BaseModel, Extra, Field, conint
 from typing_extensions import Literal
 
 
@@ -525,6 +525,12 @@ class OffsetIncrement(BaseModel):
         description='Using the `offset` with value `0` during the first request',
         title='Inject Offset',
     )
+    total_records: Optional[str] = Field(
+        None,
+        description='The total number of records reported by the API. Once the first response returned it, the offsets of all the pages are known and the pages can be requested concurrently, see `concurrent_pages` of the paginator.',
+        examples=["{{ response['meta']['total'] }}"],
+        title='Total Records',
+    )
     parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
 
 
@@ -547,6 +553,12 @@ class PageIncrement(BaseModel):
         description='Using the `page number` with value defined by `start_from_page` during the first request',
         title='Inject Page Number',
     )
+    total_records: Optional[str] = Field(
+        None,
+        description='The total number of records reported by the API. Once the first response returned it, the number of pages is known and the pages can be requested concurrently, see `concurrent_pages` of the paginator.',
+        examples=["{{ response['meta']['total'] }}"],
+        title='Total Records',
+    )
     parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
 
 
@@ -879,6 +891,12 @@ class DatetimeBasedCursor(BaseModel):
         examples=['P1D', "P{{ config['lookback_days'] }}D"],
         title='Lookback Window',
     )
+    max_partitions_in_state: Optional[conint(ge=1)] = Field(
+        None,
+        description='When the stream is partitioned, collapse the state into a global cursor once there are more partitions than this value. Partitions are then read from the oldest cursor value of all partitions, including partitions created after the state was collapsed. Use it for streams with so many partitions that the state becomes too large.',
+        examples=[10000],
+        title='Maximum Partitions in State',
+    )
     partition_field_end: Optional[str] = Field(
         None,
         description='Name of the partition start time field.',
@@ -945,6 +963,12 @@ class DefaultPaginator(BaseModel):
         description='Strategy defining how records are paginated.',
         title='Pagination Strategy',
     )
+    concurrent_pages: Optional[conint(ge=1)] = Field(
+        1,
+        description='The number of pages requested at the same time once the pages left to read are known from a response, which requires `total_records` on the OffsetIncrement and PageIncrement pagination strategies. Records are still read in page order. By default, pages are requested one after the other.',
+        examples=[8],
+        title='Concurrent Pages',
+    )
     decoder: Optional[JsonDecoder] = Field(
         None,
         description='Component decoding the response so records can be extracted.',
@@ -973,6 +997,11 @@ class DpathExtractor(BaseModel):
         description='Component decoding the response so records can be extracted.',
         title='Decoder',
     )
+    stream_records: Optional[bool] = Field(
+        False,
+        description='Parse the records from the JSON response while it is downloaded instead of loading the whole response in memory. Use it for APIs returning very large pages. The array of records is then empty when the response is used for pagination and `last_records` only gives access to the number of records and to the last record.',
+        title='Stream Records',
+    )
     parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
 
 
@@ -1260,6 +1289,12 @@ class ParentStreamConfig(BaseModel):
         description='A request option describing where the parent key value should be injected into and under what field name if applicable.',
         title='Request Option',
     )
+    concurrent_slices: Optional[conint(ge=1)] = Field(
+        1,
+        description='The number of parent stream slices read at the same time. The next parent slices are read ahead while the partitions of the current one are being read. By default, parent slices are read one after the other.',
+        examples=[4],
+        title='Concurrent Parent Slices',
+    )
     parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
 
 
@@ -0,0 +1,108 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from importlib import metadata
+from typing import Any, Mapping, Optional, Union
+
+logger = logging.getLogger("airbyte")
+
+
+@dataclass
+class CompiledManifest:
+    """
+    A manifest whose references were resolved, whose types and parameters were propagated and which was validated against the declarative
+    component schema ahead of time, so that declarative sources can be created from it without repeating this work on every invocation.
+
+    A compiled manifest is only valid for the manifest it was compiled from and for the CDK version that compiled it: loading it returns
+    None otherwise so that the source falls back to compiling the manifest itself.
+
+    Attributes:
+        manifest_hash (str): hash of the manifest the compiled manifest was compiled from, as returned by hash_manifest
+        cdk_version (str): version of the airbyte-cdk package that compiled the manifest
+        resolved_manifest (Mapping[str, Any]): the resolved, propagated and validated manifest
+    """
+
+    FORMAT_VERSION = 1
+
+    manifest_hash: str
+    cdk_version: str
+    resolved_manifest: Mapping[str, Any]
+
+    @staticmethod
+    def hash_manifest(manifest: Union[str, bytes, Mapping[str, Any]]) -> str:
+        """
+        :param manifest: the raw content of a manifest file or a parsed manifest
+        :return: the sha256 of the raw content, or of the parsed manifest serialized with sorted keys
+        """
+        if isinstance(manifest, Mapping):
+            manifest = json.dumps(manifest, sort_keys=True)
+        if isinstance(manifest, str):
+            manifest = manifest.encode()
+        return hashlib.sha256(manifest).hexdigest()
+
+    @staticmethod
+    def get_cdk_version() -> str:
+        return metadata.version("airbyte_cdk")
+
+    @classmethod
+    def compile(cls, manifest_hash: str, resolved_manifest: Mapping[str, Any]) -> "CompiledManifest":
+        """
+        :param manifest_hash: hash of the manifest resolved_manifest was resolved from
+        :param resolved_manifest: the resolved manifest of a declarative source, which was validated when the source was created
+        :return: the compiled manifest for the current CDK version
+        """
+        serialized_manifest = json.dumps(resolved_manifest)
+        if json.loads(serialized_manifest) != resolved_manifest:
+            raise ValueError("The resolved manifest cannot be compiled because it does not survive a round trip through JSON")
+        return cls(manifest_hash=manifest_hash, cdk_version=cls.get_cdk_version(), resolved_manifest=json.loads(serialized_manifest))
+
+    def save(self, path: str) -> None:
+        """
+        Writes the compiled manifest to a JSON file. JSON is used rather than pickle so that loading a compiled manifest cannot execute
+        code.
+        """
+        with open(path, "w") as compiled_manifest_file:
+            json.dump(
+                {
+                    "format_version": self.FORMAT_VERSION,
+                    "manifest_hash": self.manifest_hash,
+                    "cdk_version": self.cdk_version,
+                    "resolved_manifest": self.resolved_manifest,
+                },
+                compiled_manifest_file,
+            )
+
+    @classmethod
+    def load(cls, path: str, manifest_hash: str) -> Optional["CompiledManifest"]:
+        """
+        :param path: path of the compiled manifest file written by save
+        :param manifest_hash: hash of the manifest the source is created from
+        :return: the compiled manifest, or None if the file does not exist, can't be read or was compiled from another manifest or by
+        another CDK version
+        """
+        try:
+            with open(path, "r") as compiled_manifest_file:
+                compiled_manifest = json.load(compiled_manifest_file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exception:
+            logger.warning(f"Ignoring the compiled manifest {path} because it could not be read: {exception}")
+            return None
+
+        if not isinstance(compiled_manifest, dict) or compiled_manifest.get("format_version") != cls.FORMAT_VERSION:
+            logger.warning(f"Ignoring the compiled manifest {path} because its format is not supported")
+            return None
+        if compiled_manifest.get("manifest_hash") != manifest_hash:
+            logger.info(f"Ignoring the compiled manifest {path} because it was compiled from another manifest")
+            return None
+        cdk_version = cls.get_cdk_version()
+        if compiled_manifest.get("cdk_version") != cdk_version:
+            compiled_by = compiled_manifest.get("cdk_version")
+            logger.info(f"Ignoring the compiled manifest {path} because it was compiled by airbyte-cdk {compiled_by}")
+            return None
+        return cls(manifest_hash=manifest_hash, cdk_version=cdk_version, resolved_manifest=compiled_manifest["resolved_manifest"])
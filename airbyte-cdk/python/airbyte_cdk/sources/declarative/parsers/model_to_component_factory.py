@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import importlib
 import inspect
 import re
@@ -84,6 +85,7 @@ from airbyte_cdk.sources.declarative.models.declarative_component_schema import
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import WaitTimeFromHeader as WaitTimeFromHeaderModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import WaitUntilTimeFromHeader as WaitUntilTimeFromHeaderModel
 from airbyte_cdk.sources.declarative.partition_routers import ListPartitionRouter, SinglePartitionRouter, SubstreamPartitionRouter
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import ParentRecordCache
 from airbyte_cdk.sources.declarative.partition_routers.substream_partition_router import ParentStreamConfig
 from airbyte_cdk.sources.declarative.requesters import HttpRequester, RequestOption
 from airbyte_cdk.sources.declarative.requesters.error_handlers import CompositeErrorHandler, DefaultErrorHandler, HttpResponseFilter
@@ -130,6 +132,7 @@ class ModelToComponentFactory:
         emit_connector_builder_messages: bool = False,
         disable_retries: bool = False,
         message_repository: Optional[MessageRepository] = None,
+        parent_record_cache: Optional[ParentRecordCache] = None,
     ):
         self._init_mappings()
         self._limit_pages_fetched_per_slice = limit_pages_fetched_per_slice
@@ -139,6 +142,7 @@ class ModelToComponentFactory:
         self._message_repository = message_repository or InMemoryMessageRepository(  # type: ignore
             self._evaluate_log_level(emit_connector_builder_messages)
         )
+        self._parent_record_cache = parent_record_cache or ParentRecordCache()
 
     def _init_mappings(self) -> None:
         self.PYDANTIC_MODEL_TO_CONSTRUCTOR: Mapping[Type[BaseModel], Callable[..., Any]] = {
@@ -597,10 +601,10 @@ class ModelToComponentFactory:
             stream_slicer_model = model.retriever.partition_router
             if isinstance(stream_slicer_model, list):
                 stream_slicer = CartesianProductStreamSlicer(
-                    [self._create_component_from_model(model=slicer, config=config) for slicer in stream_slicer_model], parameters={}
+                    [self._create_partition_router(slicer, config, model.name) for slicer in stream_slicer_model], parameters={}
                 )
             else:
-                stream_slicer = self._create_component_from_model(model=stream_slicer_model, config=config)
+                stream_slicer = self._create_partition_router(stream_slicer_model, config, model.name)
 
         if model.incremental_sync and stream_slicer:
             incremental_sync_model = model.incremental_sync
@@ -609,6 +613,9 @@ class ModelToComponentFactory:
                     lambda: self._create_component_from_model(model=incremental_sync_model, config=config),
                 ),
                 partition_router=stream_slicer,
+                max_partitions_in_state=incremental_sync_model.max_partitions_in_state
+                if isinstance(incremental_sync_model, DatetimeBasedCursorModel)
+                else None,
             )
         elif model.incremental_sync:
             return self._create_component_from_model(model=model.incremental_sync, config=config) if model.incremental_sync else None
@@ -617,6 +624,12 @@ class ModelToComponentFactory:
         else:
             return None
 
+    def _create_partition_router(self, model: BaseModel, config: Config, stream_name: Optional[str]) -> Any:
+        # Substreams are identified by their stream name so that the parent records they share can be evicted once they were all read
+        if isinstance(model, SubstreamPartitionRouterModel):
+            return self._create_component_from_model(model=model, config=config, stream_name=stream_name)
+        return self._create_component_from_model(model=model, config=config)
+
     def create_default_error_handler(self, model: DefaultErrorHandlerModel, config: Config, **kwargs: Any) -> DefaultErrorHandler:
         backoff_strategies = []
         if model.backoff_strategies:
@@ -680,13 +693,21 @@ class ModelToComponentFactory:
     def create_dpath_extractor(self, model: DpathExtractorModel, config: Config, **kwargs: Any) -> DpathExtractor:
         decoder = self._create_component_from_model(model.decoder, config=config) if model.decoder else JsonDecoder(parameters={})
         model_field_path: List[Union[InterpolatedString, str]] = [x for x in model.field_path]
-        return DpathExtractor(decoder=decoder, field_path=model_field_path, config=config, parameters=model.parameters or {})
+        return DpathExtractor(
+            decoder=decoder,
+            field_path=model_field_path,
+            config=config,
+            parameters=model.parameters or {},
+            stream_records=bool(model.stream_records),
+        )
 
     @staticmethod
     def create_exponential_backoff_strategy(model: ExponentialBackoffStrategyModel, config: Config) -> ExponentialBackoffStrategy:
         return ExponentialBackoffStrategy(factor=model.factor or 5, parameters=model.parameters or {}, config=config)
 
-    def create_http_requester(self, model: HttpRequesterModel, config: Config, *, name: str) -> HttpRequester:
+    def create_http_requester(
+        self, model: HttpRequesterModel, config: Config, *, name: str, stream_response: bool = False
+    ) -> HttpRequester:
         authenticator = (
             self._create_component_from_model(model=model.authenticator, config=config, url_base=model.url_base, name=name)
             if model.authenticator
@@ -723,6 +744,7 @@ class ModelToComponentFactory:
             disable_retries=self._disable_retries,
             parameters=model.parameters or {},
             message_repository=self._message_repository,
+            stream_response=stream_response,
         )
 
     @staticmethod
@@ -840,6 +862,7 @@ class ModelToComponentFactory:
             page_size=model.page_size,
             config=config,
             inject_on_first_request=model.inject_on_first_request or False,
+            total_records=model.total_records,
             parameters=model.parameters or {},
         )
 
@@ -849,12 +872,15 @@ class ModelToComponentFactory:
             page_size=model.page_size,
             start_from_page=model.start_from_page or 0,
             inject_on_first_request=model.inject_on_first_request or False,
+            total_records=model.total_records,
+            config=config,
             parameters=model.parameters or {},
         )
 
     def create_parent_stream_config(self, model: ParentStreamConfigModel, config: Config, **kwargs: Any) -> ParentStreamConfig:
         declarative_stream = self._create_component_from_model(model.stream, config=config)
         request_option = self._create_component_from_model(model.request_option, config=config) if model.request_option else None
+        concurrent_slices = model.concurrent_slices or 1
         return ParentStreamConfig(
             parent_key=model.parent_key,
             request_option=request_option,
@@ -862,6 +888,9 @@ class ModelToComponentFactory:
             partition_field=model.partition_field,
             config=config,
             parameters=model.parameters or {},
+            cache_key=f"{model.stream.name}:{hashlib.sha256(model.stream.json(sort_keys=True).encode()).hexdigest()}",
+            concurrent_slices=concurrent_slices,
+            stream_factory=(lambda: self._create_component_from_model(model.stream, config=config)) if concurrent_slices > 1 else None,
         )
 
     @staticmethod
@@ -923,7 +952,13 @@ class ModelToComponentFactory:
         stop_condition_on_cursor: bool = False,
         transformations: List[RecordTransformation],
     ) -> SimpleRetriever:
-        requester = self._create_component_from_model(model=model.requester, config=config, name=name)
+        extractor_model = model.record_selector.extractor
+        streams_records = isinstance(extractor_model, DpathExtractorModel) and bool(extractor_model.stream_records)
+        if streams_records and isinstance(model.requester, HttpRequesterModel):
+            # The records can only be parsed while the response is downloaded if the requester doesn't download it beforehand
+            requester = self._create_component_from_model(model=model.requester, config=config, name=name, stream_response=True)
+        else:
+            requester = self._create_component_from_model(model=model.requester, config=config, name=name)
         record_selector = self._create_component_from_model(model=model.record_selector, config=config, transformations=transformations)
         url_base = model.requester.url_base if hasattr(model.requester, "url_base") else requester.get_url_base()
         stream_slicer = stream_slicer or SinglePartitionRouter(parameters={})
@@ -960,6 +995,7 @@ class ModelToComponentFactory:
             stream_slicer=stream_slicer,
             cursor=cursor,
             config=config,
+            concurrent_pages=(model.paginator.concurrent_pages or 1) if isinstance(model.paginator, DefaultPaginatorModel) else 1,
             parameters=model.parameters or {},
         )
 
@@ -973,7 +1009,7 @@ class ModelToComponentFactory:
         )
 
     def create_substream_partition_router(
-        self, model: SubstreamPartitionRouterModel, config: Config, **kwargs: Any
+        self, model: SubstreamPartitionRouterModel, config: Config, *, stream_name: Optional[str] = None, **kwargs: Any
     ) -> SubstreamPartitionRouter:
         parent_stream_configs = []
         if model.parent_stream_configs:
@@ -984,7 +1020,12 @@ class ModelToComponentFactory:
                 ]
             )
 
-        return SubstreamPartitionRouter(parent_stream_configs=parent_stream_configs, parameters=model.parameters or {}, config=config)
+        partition_router = SubstreamPartitionRouter(
+            parent_stream_configs=parent_stream_configs, parameters=model.parameters or {}, config=config
+        )
+        if stream_name:
+            partition_router.share_parent_records(self._parent_record_cache, stream_name)
+        return partition_router
 
     def _create_message_repository_substream_wrapper(self, model: ParentStreamConfigModel, config: Config) -> Any:
         substream_factory = ModelToComponentFactory(
@@ -997,6 +1038,7 @@ class ModelToComponentFactory:
                 self._message_repository,
                 self._evaluate_log_level(self._emit_connector_builder_messages),
             ),
+            parent_record_cache=self._parent_record_cache,
         )
         return substream_factory._create_component_from_model(model=model, config=config)
 
@@ -1015,5 +1057,8 @@ class ModelToComponentFactory:
     def get_message_repository(self) -> MessageRepository:
         return self._message_repository
 
+    def get_parent_record_cache(self) -> ParentRecordCache:
+        return self._parent_record_cache
+
     def _evaluate_log_level(self, emit_connector_builder_messages: bool) -> Level:
         return Level.DEBUG if emit_connector_builder_messages else Level.INFO
@@ -0,0 +1,195 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import os
+import pickle
+import tempfile
+import threading
+from collections import defaultdict
+from typing import IO, Any, Callable, Dict, Iterable, List, Mapping, Optional, Set
+
+from airbyte_cdk.sources.declarative.types import StreamSlice
+
+DEFAULT_MAX_RECORDS_IN_MEMORY = 10_000
+
+
+class _CachedSlice:
+    """
+    The records of a parent stream slice. Records are kept in memory until they are spilled to a file.
+    """
+
+    def __init__(self) -> None:
+        self.records: List[Mapping[str, Any]] = []
+        self.file_path: Optional[str] = None
+        self.file: Optional[IO[bytes]] = None
+        self.is_complete = False
+
+    def spill(self, directory: str) -> IO[bytes]:
+        """
+        Move the records to a file in the directory and return the file so that the next records are appended to it.
+        """
+        file_descriptor, self.file_path = tempfile.mkstemp(dir=directory, suffix=".pickle")
+        file = os.fdopen(file_descriptor, "wb")
+        for record in self.records:
+            pickle.dump(record, file)
+        self.records = []
+        self.file = file
+        return file
+
+    def read(self) -> Iterable[Mapping[str, Any]]:
+        if self.file_path is None:
+            yield from self.records
+            return
+        with open(self.file_path, "rb") as file:
+            while True:
+                try:
+                    yield pickle.load(file)
+                except EOFError:
+                    return
+
+    def close(self) -> None:
+        if self.file:
+            self.file.close()
+            self.file = None
+
+    def delete(self) -> None:
+        self.close()
+        self.records = []
+        if self.file_path:
+            os.remove(self.file_path)
+            self.file_path = None
+
+
+class ParentRecordCache:
+    """
+    Keeps the records of the parent streams shared by the substreams of a source so that a parent stream slice is read once per sync rather
+    than once per substream.
+
+    A slice is cached the first time it is fully read and replayed for the other substreams. Records are kept in memory up to
+    max_records_in_memory and written to temporary files beyond that. The records of a parent stream are evicted once all the substreams
+    depending on it finished reading their slices.
+
+    Parent streams with a single dependent substream are not cached as their records would never be read again. Once the streams being read
+    are known, substreams that are not read can be ignored with select_dependents so that they are not waited for.
+    """
+
+    def __init__(self, max_records_in_memory: int = DEFAULT_MAX_RECORDS_IN_MEMORY):
+        self._max_records_in_memory = max_records_in_memory
+        self._records_in_memory = 0
+        self._dependents: Dict[str, Set[str]] = defaultdict(set)
+        self._finished_dependents: Dict[str, Set[str]] = defaultdict(set)
+        self._slices: Dict[str, Dict[str, _CachedSlice]] = defaultdict(dict)
+        self._selected_dependents: Optional[Set[str]] = None
+        self._spill_directory: Optional[tempfile.TemporaryDirectory] = None  # type: ignore # the directory is only used for its path
+        self._spilled_slices = 0
+        self._lock = threading.Lock()
+
+    def register_dependent(self, parent_key: str, dependent: str) -> None:
+        """
+        Declare that the dependent substream reads the slices of the parent stream.
+        """
+        with self._lock:
+            if self._selected_dependents is None or dependent in self._selected_dependents:
+                self._dependents[parent_key].add(dependent)
+
+    def select_dependents(self, dependents: Iterable[str]) -> None:
+        """
+        Ignore the substreams that are not part of the given dependents, for instance because they are not read during the sync.
+        """
+        with self._lock:
+            self._selected_dependents = set(dependents)
+            for parent_dependents in self._dependents.values():
+                parent_dependents &= self._selected_dependents
+
+    def read_records(
+        self, parent_key: str, stream_slice: Optional[StreamSlice], read_records: Callable[[], Iterable[Mapping[str, Any]]]
+    ) -> Iterable[Mapping[str, Any]]:
+        """
+        Return the records of the parent stream slice from the cache, or read them and cache them if the slice was not fully read yet.
+
+        :param parent_key: The key identifying the parent stream
+        :param stream_slice: The parent stream slice
+        :param read_records: Function reading the records of the parent stream slice
+        """
+        slice_key = json.dumps(stream_slice, sort_keys=True, default=str)
+        with self._lock:
+            if len(self._dependents[parent_key]) < 2:
+                cached_slice = None
+            elif slice_key in self._slices[parent_key]:
+                cached_slice = self._slices[parent_key][slice_key]
+                if cached_slice.is_complete:
+                    return cached_slice.read()
+                # The slice is being read for another substream, it is read again rather than waiting for it
+                cached_slice = None
+            else:
+                cached_slice = _CachedSlice()
+                self._slices[parent_key][slice_key] = cached_slice
+        if cached_slice is None:
+            return read_records()
+        return self._read_and_cache(parent_key, slice_key, cached_slice, read_records)
+
+    def release(self, parent_key: str, dependent: str) -> None:
+        """
+        Declare that the dependent substream finished reading its slices. The records of the parent stream are evicted once all its
+        dependents finished.
+        """
+        with self._lock:
+            if dependent not in self._dependents[parent_key]:
+                return
+            self._finished_dependents[parent_key].add(dependent)
+            if self._finished_dependents[parent_key] >= self._dependents[parent_key]:
+                self._finished_dependents.pop(parent_key)
+                for cached_slice in self._slices.pop(parent_key, {}).values():
+                    self._delete(cached_slice)
+
+    def _read_and_cache(
+        self, parent_key: str, slice_key: str, cached_slice: _CachedSlice, read_records: Callable[[], Iterable[Mapping[str, Any]]]
+    ) -> Iterable[Mapping[str, Any]]:
+        is_complete = False
+        try:
+            for record in read_records():
+                self._add_record(cached_slice, record)
+                yield record
+            is_complete = True
+        finally:
+            with self._lock:
+                cached_slice.close()
+                if is_complete and self._slices[parent_key].get(slice_key) is cached_slice:
+                    cached_slice.is_complete = True
+                else:
+                    # Slices that were not fully read or were evicted in the meantime are not kept
+                    if self._slices[parent_key].get(slice_key) is cached_slice:
+                        del self._slices[parent_key][slice_key]
+                    self._delete(cached_slice)
+
+    def _add_record(self, cached_slice: _CachedSlice, record: Mapping[str, Any]) -> None:
+        with self._lock:
+            if cached_slice.file:
+                pickle.dump(record, cached_slice.file)
+            elif self._records_in_memory < self._max_records_in_memory:
+                cached_slice.records.append(record)
+                self._records_in_memory += 1
+            else:
+                self._records_in_memory -= len(cached_slice.records)
+                file = cached_slice.spill(self._get_spill_directory())
+                self._spilled_slices += 1
+                pickle.dump(record, file)
+
+    def _delete(self, cached_slice: _CachedSlice) -> None:
+        """
+        Delete the records of the slice and remove the spill directory once no slice has records in it. Must be called with the lock held.
+        """
+        self._records_in_memory -= len(cached_slice.records)
+        if cached_slice.file_path:
+            self._spilled_slices -= 1
+        cached_slice.delete()
+        if self._spilled_slices == 0 and self._spill_directory is not None:
+            self._spill_directory.cleanup()
+            self._spill_directory = None
+
+    def _get_spill_directory(self) -> str:
+        if self._spill_directory is None:
+            self._spill_directory = tempfile.TemporaryDirectory(prefix="airbyte-parent-records-")
+        return self._spill_directory.name
@@ -2,12 +2,16 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import InitVar, dataclass
-from typing import Any, Iterable, List, Mapping, Optional, Union
+from queue import Queue
+from typing import Any, Callable, Deque, Iterable, List, Mapping, Optional, Tuple, Union
 
 import dpath.util
 from airbyte_cdk.models import AirbyteMessage, SyncMode, Type
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import ParentRecordCache
 from airbyte_cdk.sources.declarative.requesters.request_option import RequestOption, RequestOptionType
 from airbyte_cdk.sources.declarative.stream_slicers.stream_slicer import StreamSlicer
 from airbyte_cdk.sources.declarative.types import Config, Record, StreamSlice, StreamState
@@ -23,6 +27,9 @@ class ParentStreamConfig:
     parent_key: The key of the parent stream's records that will be the stream slice key
     partition_field: The partition key
     request_option: How to inject the slice value on an outgoing HTTP request
+    cache_key: The key identifying the parent stream in the parent record cache
+    concurrent_slices: The number of parent stream slices read at the same time
+    stream_factory: Creates the additional parent streams used to read the parent stream slices concurrently
     """
 
     stream: Stream
@@ -31,6 +38,9 @@ class ParentStreamConfig:
     config: Config
     parameters: InitVar[Mapping[str, Any]]
     request_option: Optional[RequestOption] = None
+    cache_key: Optional[str] = None
+    concurrent_slices: int = 1
+    stream_factory: Optional[Callable[[], Stream]] = None
 
     def __post_init__(self, parameters: Mapping[str, Any]):
         self.parent_key = InterpolatedString.create(self.parent_key, parameters=parameters)
@@ -55,6 +65,21 @@ class SubstreamPartitionRouter(StreamSlicer):
         if not self.parent_stream_configs:
             raise ValueError("SubstreamPartitionRouter needs at least 1 parent stream")
         self._parameters = parameters
+        self._parent_record_cache: Optional[ParentRecordCache] = None
+        self._stream_name: Optional[str] = None
+
+    def share_parent_records(self, parent_record_cache: ParentRecordCache, stream_name: str) -> None:
+        """
+        Read the records of the parent streams through a cache shared with the other substreams of the source.
+
+        :param parent_record_cache: The cache of the parent records
+        :param stream_name: The name of the stream the partition router belongs to
+        """
+        self._parent_record_cache = parent_record_cache
+        self._stream_name = stream_name
+        for parent_stream_config in self.parent_stream_configs:
+            if parent_stream_config.cache_key:
+                parent_record_cache.register_dependent(parent_stream_config.cache_key, stream_name)
 
     def get_request_params(
         self,
@@ -121,34 +146,99 @@ class SubstreamPartitionRouter(StreamSlicer):
         if not self.parent_stream_configs:
             yield from []
         else:
-            for parent_stream_config in self.parent_stream_configs:
-                parent_stream = parent_stream_config.stream
-                parent_field = parent_stream_config.parent_key.eval(self.config)
-                stream_state_field = parent_stream_config.partition_field.eval(self.config)
-                for parent_stream_slice in parent_stream.stream_slices(
-                    sync_mode=SyncMode.full_refresh, cursor_field=None, stream_state=None
-                ):
-                    empty_parent_slice = True
-                    parent_slice = parent_stream_slice
-
-                    for parent_record in parent_stream.read_records(
-                        sync_mode=SyncMode.full_refresh, cursor_field=None, stream_slice=parent_stream_slice, stream_state=None
-                    ):
-                        # Skip non-records (eg AirbyteLogMessage)
-                        if isinstance(parent_record, AirbyteMessage):
-                            if parent_record.type == Type.RECORD:
-                                parent_record = parent_record.record.data
-                            else:
-                                continue
-                        elif isinstance(parent_record, Record):
-                            parent_record = parent_record.data
-                        try:
-                            stream_state_value = dpath.util.get(parent_record, parent_field)
-                        except KeyError:
-                            pass
-                        else:
-                            empty_parent_slice = False
+            try:
+                for parent_stream_config in self.parent_stream_configs:
+                    parent_field = parent_stream_config.parent_key.eval(self.config)
+                    stream_state_field = parent_stream_config.partition_field.eval(self.config)
+                    for parent_slice, partition_values in self._read_parent_slices(parent_stream_config, parent_field):
+                        for stream_state_value in partition_values:
                             yield {stream_state_field: stream_state_value, "parent_slice": parent_slice}
-                    # If the parent slice contains no records,
-                    if empty_parent_slice:
-                        yield from []
+            finally:
+                # The parent records are released even if the slices were not all read, e.g. because reading the substream failed
+                if self._parent_record_cache and self._stream_name:
+                    for parent_stream_config in self.parent_stream_configs:
+                        if parent_stream_config.cache_key:
+                            self._parent_record_cache.release(parent_stream_config.cache_key, self._stream_name)
+
+    def _read_parent_slices(
+        self, parent_stream_config: ParentStreamConfig, parent_field: str
+    ) -> Iterable[Tuple[Optional[StreamSlice], Iterable[Any]]]:
+        """
+        Yield the slices of the parent stream with the values of the parent key of their records.
+
+        The slices are read one after the other unless the parent stream config allows reading them concurrently. In that case, the next
+        slices are read ahead on a thread pool while the values of the current slice are used.
+        """
+        parent_stream = parent_stream_config.stream
+        parent_stream_slices = parent_stream.stream_slices(sync_mode=SyncMode.full_refresh, cursor_field=None, stream_state=None)
+        if parent_stream_config.concurrent_slices <= 1 or not parent_stream_config.stream_factory:
+            for parent_stream_slice in parent_stream_slices:
+                partition_values = self._read_partition_values(parent_stream_config, parent_stream, parent_stream_slice, parent_field)
+                yield parent_stream_slice, partition_values
+            return
+
+        # A stream can only be used by one thread at a time. The parent stream generates the slices on this thread so each thread reading
+        # slices uses a stream of its own
+        parent_streams: Queue[Stream] = Queue()
+        for _ in range(parent_stream_config.concurrent_slices):
+            parent_streams.put(parent_stream_config.stream_factory())
+
+        def read_partition_values(parent_stream_slice: Optional[StreamSlice]) -> List[Any]:
+            stream = parent_streams.get()
+            try:
+                return list(self._read_partition_values(parent_stream_config, stream, parent_stream_slice, parent_field))
+            finally:
+                parent_streams.put(stream)
+
+        pending_slices: Deque[Tuple[Optional[StreamSlice], Future[List[Any]]]] = deque()
+        threadpool = ThreadPoolExecutor(max_workers=parent_stream_config.concurrent_slices, thread_name_prefix="parentslice")
+        try:
+            for parent_stream_slice in parent_stream_slices:
+                if len(pending_slices) == parent_stream_config.concurrent_slices:
+                    pending_slice, future = pending_slices.popleft()
+                    yield pending_slice, future.result()
+                pending_slices.append((parent_stream_slice, threadpool.submit(read_partition_values, parent_stream_slice)))
+            while pending_slices:
+                pending_slice, future = pending_slices.popleft()
+                yield pending_slice, future.result()
+        finally:
+            for _, future in pending_slices:
+                future.cancel()
+            threadpool.shutdown(wait=True)
+
+    def _read_partition_values(
+        self, parent_stream_config: ParentStreamConfig, parent_stream: Stream, parent_stream_slice: Optional[StreamSlice], parent_field: str
+    ) -> Iterable[Any]:
+        for parent_record in self._read_parent_records(parent_stream_config, parent_stream, parent_stream_slice):
+            try:
+                yield dpath.util.get(parent_record, parent_field)
+            except KeyError:
+                pass
+
+    def _read_parent_records(
+        self, parent_stream_config: ParentStreamConfig, parent_stream: Stream, parent_stream_slice: Optional[StreamSlice]
+    ) -> Iterable[Mapping[str, Any]]:
+        """
+        Return the data of the records of the parent stream slice, from the parent record cache if the parent stream is cached.
+        """
+        if self._parent_record_cache and parent_stream_config.cache_key:
+            return self._parent_record_cache.read_records(
+                parent_stream_config.cache_key,
+                parent_stream_slice,
+                lambda: self._read_parent_records_from_stream(parent_stream, parent_stream_slice),
+            )
+        return self._read_parent_records_from_stream(parent_stream, parent_stream_slice)
+
+    @staticmethod
+    def _read_parent_records_from_stream(parent_stream: Stream, parent_stream_slice: Optional[StreamSlice]) -> Iterable[Mapping[str, Any]]:
+        for parent_record in parent_stream.read_records(
+            sync_mode=SyncMode.full_refresh, cursor_field=None, stream_slice=parent_stream_slice, stream_state=None
+        ):
+            # Skip non-records (eg AirbyteLogMessage)
+            if isinstance(parent_record, AirbyteMessage):
+                if parent_record.type == Type.RECORD:
+                    yield parent_record.record.data
+            elif isinstance(parent_record, Record):
+                yield parent_record.data
+            else:
+                yield parent_record
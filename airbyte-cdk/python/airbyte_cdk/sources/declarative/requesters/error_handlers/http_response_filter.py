@@ -6,6 +6,7 @@ from dataclasses import InitVar, dataclass
 from typing import Any, Mapping, Optional, Set, Union
 
 import requests
+from airbyte_cdk.sources.declarative.decoders.json_decoder import decode_json_body
 from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
 from airbyte_cdk.sources.declarative.interpolation.interpolated_boolean import InterpolatedBoolean
 from airbyte_cdk.sources.declarative.requesters.error_handlers.response_action import ResponseAction
@@ -75,23 +76,16 @@ class HttpResponseFilter:
         else:
             return None
 
-    @staticmethod
-    def _safe_response_json(response: requests.Response) -> dict:
-        try:
-            return response.json()
-        except requests.exceptions.JSONDecodeError:
-            return {}
-
     def _create_error_message(self, response: requests.Response) -> str:
         """
         Construct an error message based on the specified message template of the filter.
         :param response: The HTTP response which can be used during interpolation
         :return: The evaluated error message string to be emitted
         """
-        return self.error_message.eval(self.config, response=self._safe_response_json(response), headers=response.headers)
+        return self.error_message.eval(self.config, response=decode_json_body(response), headers=response.headers)
 
     def _response_matches_predicate(self, response: requests.Response) -> bool:
-        return self.predicate and self.predicate.eval(None, response=self._safe_response_json(response), headers=response.headers)
+        return self.predicate and self.predicate.eval(None, response=decode_json_body(response), headers=response.headers)
 
     def _response_contains_error_message(self, response: requests.Response) -> bool:
         if not self.error_message_contains:
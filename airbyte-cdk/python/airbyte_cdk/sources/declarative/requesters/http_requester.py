@@ -13,7 +13,7 @@ from urllib.parse import urljoin
 import requests
 from airbyte_cdk.models import Level
 from airbyte_cdk.sources.declarative.auth.declarative_authenticator import DeclarativeAuthenticator, NoAuth
-from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder, decode_json_body
 from airbyte_cdk.sources.declarative.exceptions import ReadException
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
 from airbyte_cdk.sources.declarative.requesters.error_handlers.error_handler import ErrorHandler
@@ -47,6 +47,7 @@ class HttpRequester(Requester):
         authenticator (DeclarativeAuthenticator): Authenticator defining how to authenticate to the source
         error_handler (Optional[ErrorHandler]): Error handler defining how to detect and handle errors
         config (Config): The user-provided configuration as specified by the source's spec
+        stream_response (bool): Whether the content of the responses is downloaded as it is read instead of when they are received
     """
 
     name: str
@@ -60,6 +61,7 @@ class HttpRequester(Requester):
     error_handler: Optional[ErrorHandler] = None
     disable_retries: bool = False
     message_repository: MessageRepository = NoopMessageRepository()
+    stream_response: bool = False
 
     _DEFAULT_MAX_RETRY = 5
     _DEFAULT_RETRY_FACTOR = 5
@@ -483,8 +485,10 @@ class HttpRequester(Requester):
         self.logger.debug(
             "Making outbound API request", extra={"headers": request.headers, "url": request.url, "request_body": request.body}
         )
-        response: requests.Response = self._session.send(request)
-        self.logger.debug("Receiving response", extra={"headers": response.headers, "status": response.status_code, "body": response.text})
+        response: requests.Response = self._session.send(request, stream=self.stream_response)
+        # Logging the body of a streamed response would read all of its content
+        body = None if self.stream_response else response.text
+        self.logger.debug("Receiving response", extra={"headers": response.headers, "status": response.status_code, "body": body})
         if log_formatter:
             formatter = log_formatter
             self.message_repository.log_message(
@@ -554,9 +558,5 @@ class HttpRequester(Requester):
                 return _try_get_error(new_value)
             return None
 
-        try:
-            body = response.json()
-            error = _try_get_error(body)
-            return str(error) if error else None
-        except requests.exceptions.JSONDecodeError:
-            return None
+        error = _try_get_error(decode_json_body(response))
+        return str(error) if error else None
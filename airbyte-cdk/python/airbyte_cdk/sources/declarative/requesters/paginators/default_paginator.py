@@ -108,6 +108,14 @@ class DefaultPaginator(Paginator):
         else:
             return None
 
+    def get_next_page_tokens(self, response: requests.Response) -> Optional[List[Mapping[str, Any]]]:
+        tokens = self.pagination_strategy.get_next_page_tokens(response)
+        return [{"next_page_token": token} for token in tokens] if tokens is not None else None
+
+    def set_next_page_token(self, next_page_token: Mapping[str, Any]) -> None:
+        self._token = next_page_token["next_page_token"]
+        self.pagination_strategy.set_next_page_token(self._token)
+
     def path(self) -> Optional[str]:
         if self._token and self.page_token_option and isinstance(self.page_token_option, RequestPath):
             # Replace url base to only return the path
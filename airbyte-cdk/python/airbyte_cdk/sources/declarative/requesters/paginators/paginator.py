@@ -37,6 +37,26 @@ class Paginator(ABC, RequestOptionsProvider):
         """
         pass
 
+    def get_next_page_tokens(self, response: requests.Response) -> Optional[List[Mapping[str, Any]]]:
+        """
+        Returns the next_page_tokens of all the pages left to read when they can be known from the response, so that they can be requested
+        concurrently.
+
+        :param response: the last response, for which next_page_token was called
+        :return: The mappings {"next_page_token": <token>} of the pages left to read, starting with the current next_page_token. Returning
+        None means the pages have to be read one after the other.
+        """
+        return None
+
+    def set_next_page_token(self, next_page_token: Mapping[str, Any]) -> None:
+        """
+        Moves the paginator to the page of the next_page_token so that the request options and path are the ones of this page, and
+        next_page_token returns the token of the page following it.
+
+        :param next_page_token: one of the next_page_tokens returned by get_next_page_tokens
+        """
+        raise NotImplementedError(f"{type(self).__name__} doesn't return the next_page_tokens of the next pages")
+
     @abstractmethod
     def path(self) -> Optional[str]:
         """
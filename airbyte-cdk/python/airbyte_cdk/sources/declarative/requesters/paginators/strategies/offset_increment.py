@@ -32,8 +32,15 @@ class OffsetIncrement(PaginationStrategy):
           type: OffsetIncrement
           page_size: "{{ parameters['items_per_page'] }}"
 
+        # issue the requests of the next pages concurrently once the first response returned the total number of records
+        pagination_strategy:
+          type: OffsetIncrement
+          page_size: 100
+          total_records: "{{ response['meta']['total'] }}"
+
     Attributes:
         page_size (InterpolatedString): the number of records to request
+        total_records (Optional[InterpolatedString]): the total number of records, used to know the offsets of all the pages from a response
     """
 
     config: Config
@@ -41,6 +48,7 @@ class OffsetIncrement(PaginationStrategy):
     parameters: InitVar[Mapping[str, Any]]
     decoder: Decoder = JsonDecoder(parameters={})
     inject_on_first_request: bool = False
+    total_records: Optional[Union[InterpolatedString, str]] = None
 
     def __post_init__(self, parameters: Mapping[str, Any]):
         self._offset = 0
@@ -49,6 +57,7 @@ class OffsetIncrement(PaginationStrategy):
             self._page_size = InterpolatedString(page_size, parameters=parameters)
         else:
             self._page_size = None
+        self._total_records = InterpolatedString.create(self.total_records, parameters=parameters) if self.total_records else None
 
     @property
     def initial_token(self) -> Optional[Any]:
@@ -66,6 +75,17 @@ class OffsetIncrement(PaginationStrategy):
             self._offset += len(last_records)
             return self._offset
 
+    def get_next_page_tokens(self, response: requests.Response) -> Optional[List[Any]]:
+        if not self._page_size or not self._total_records:
+            return None
+        decoded_response = self.decoder.decode(response)
+        page_size = int(self._page_size.eval(self.config, response=decoded_response))
+        total_records = int(self._total_records.eval(self.config, response=decoded_response))
+        return list(range(self._offset, total_records, page_size))
+
+    def set_next_page_token(self, token: Any) -> None:
+        self._offset = token
+
     def reset(self):
         self._offset = 0
 
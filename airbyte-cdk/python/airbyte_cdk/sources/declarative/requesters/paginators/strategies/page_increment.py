@@ -2,11 +2,15 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from dataclasses import InitVar, dataclass
-from typing import Any, List, Mapping, Optional
+import math
+from dataclasses import InitVar, dataclass, field
+from typing import Any, List, Mapping, Optional, Union
 
 import requests
+from airbyte_cdk.sources.declarative.decoders import Decoder, JsonDecoder
+from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
 from airbyte_cdk.sources.declarative.requesters.paginators.strategies.pagination_strategy import PaginationStrategy
+from airbyte_cdk.sources.declarative.types import Config
 
 
 @dataclass
@@ -17,15 +21,20 @@ class PageIncrement(PaginationStrategy):
     Attributes:
         page_size (int): the number of records to request
         start_from_page (int): number of the initial page
+        total_records (Optional[InterpolatedString]): the total number of records, used to know the number of pages from a response
     """
 
     page_size: Optional[int]
     parameters: InitVar[Mapping[str, Any]]
     start_from_page: int = 0
     inject_on_first_request: bool = False
+    total_records: Optional[Union[InterpolatedString, str]] = None
+    config: Config = field(default_factory=dict)
+    decoder: Decoder = JsonDecoder(parameters={})
 
     def __post_init__(self, parameters: Mapping[str, Any]):
         self._page = self.start_from_page
+        self._total_records = InterpolatedString.create(self.total_records, parameters=parameters) if self.total_records else None
 
     @property
     def initial_token(self) -> Optional[Any]:
@@ -41,6 +50,15 @@ class PageIncrement(PaginationStrategy):
             self._page += 1
             return self._page
 
+    def get_next_page_tokens(self, response: requests.Response) -> Optional[List[Any]]:
+        if not self.page_size or not self._total_records:
+            return None
+        total_records = int(self._total_records.eval(self.config, response=self.decoder.decode(response)))
+        return list(range(self._page, self.start_from_page + math.ceil(total_records / self.page_size)))
+
+    def set_next_page_token(self, token: Any) -> None:
+        self._page = token
+
     def reset(self):
         self._page = self.start_from_page
 
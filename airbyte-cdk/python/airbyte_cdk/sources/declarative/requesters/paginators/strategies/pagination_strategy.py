@@ -43,3 +43,19 @@ class PaginationStrategy:
         """
         :return: page size: The number of records to fetch in a page. Returns None if unspecified
         """
+
+    def get_next_page_tokens(self, response: requests.Response) -> Optional[List[Any]]:
+        """
+        :param response: the last response, for which next_page_token was called
+        :return: the tokens of the pages left to read, starting with the current next page token, if they can be known from the response.
+        Returns None if the pages have to be read one after the other
+        """
+        return None
+
+    def set_next_page_token(self, token: Any) -> None:
+        """
+        Move the pagination to the page of the token as if the token had been returned by next_page_token
+
+        :param token: a token returned by get_next_page_tokens
+        """
+        raise NotImplementedError(f"{type(self).__name__} doesn't return the tokens of the next pages")
@@ -2,9 +2,11 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import InitVar, dataclass, field
 from itertools import islice
-from typing import Any, Callable, Iterable, List, Mapping, Optional, Set, Tuple, Union
+from typing import Any, Callable, Deque, Generator, Iterable, Iterator, List, Mapping, Optional, Set, Tuple, Union
 
 import requests
 from airbyte_cdk.models import AirbyteMessage
@@ -23,6 +25,39 @@ from airbyte_cdk.sources.streams.core import StreamData
 from airbyte_cdk.utils.mapping_helpers import combine_mappings
 
 
+class StreamedRecords:
+    """
+    The records of a page that were streamed from the response. Only the number of records and the last record are kept so that the memory
+    used doesn't depend on the size of the page. Paginators can still use `len(last_records)` and `last_records[-1]`, and iterating over
+    the records only returns the last record.
+    """
+
+    def __init__(self) -> None:
+        self._count = 0
+        self._last_record: Optional[Record] = None
+
+    def append(self, record: Record) -> None:
+        self._count += 1
+        self._last_record = record
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Record:
+        if not -self._count <= index < self._count:
+            raise IndexError(f"Index {index} is out of the {self._count} records of the page")
+        if index not in (-1, self._count - 1) or self._last_record is None:
+            raise ValueError(f"Only the last record of a page streamed from the response is kept, got index {index}")
+        return self._last_record
+
+    def __iter__(self) -> Iterator[Record]:
+        if self._last_record is not None:
+            yield self._last_record
+
+    def __reversed__(self) -> Iterator[Record]:
+        return iter(self)
+
+
 @dataclass
 class SimpleRetriever(Retriever):
     """
@@ -45,6 +80,7 @@ class SimpleRetriever(Retriever):
         stream_slicer (Optional[StreamSlicer]): The stream slicer
         cursor (Optional[cursor]): The cursor
         parameters (Mapping[str, Any]): Additional runtime parameters to be used for string interpolation
+        concurrent_pages (int): The number of pages requested at the same time when the paginator knows the next pages from a response
     """
 
     requester: Requester
@@ -58,11 +94,12 @@ class SimpleRetriever(Retriever):
     paginator: Optional[Paginator] = None
     stream_slicer: StreamSlicer = SinglePartitionRouter(parameters={})
     cursor: Optional[Cursor] = None
+    concurrent_pages: int = 1
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         self._paginator = self.paginator or NoPagination(parameters=parameters)
         self._last_response: Optional[requests.Response] = None
-        self._records_from_last_response: List[Record] = []
+        self._records_from_last_response: Union[List[Record], StreamedRecords] = []
         self._parameters = parameters
         self._name = InterpolatedString(self._name, parameters=parameters) if isinstance(self._name, str) else self._name
 
@@ -227,8 +264,17 @@ class SimpleRetriever(Retriever):
         records = self.record_selector.select_records(
             response=response, stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token
         )
-        self._records_from_last_response = records
-        return records
+        if isinstance(records, list):
+            self._records_from_last_response = records
+            return records
+        return self._read_streamed_records(records)
+
+    def _read_streamed_records(self, records: Iterable[Record]) -> Iterable[Record]:
+        streamed_records = StreamedRecords()
+        self._records_from_last_response = streamed_records
+        for record in records:
+            streamed_records.append(record)
+            yield record
 
     @property  # type: ignore
     def primary_key(self) -> Optional[Union[str, List[str], List[List[str]]]]:
@@ -248,12 +294,18 @@ class SimpleRetriever(Retriever):
 
         :return: The token for the next page from the input response object. Returning None means there are no more pages to read in this response.
         """
-        return self._paginator.next_page_token(response, self._records_from_last_response)
+        # Streamed records only give access to the number of records and to the last record, which is what paginators use
+        return self._paginator.next_page_token(response, self._records_from_last_response)  # type: ignore
 
     def _fetch_next_page(
         self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any], next_page_token: Optional[Mapping[str, Any]] = None
     ) -> Optional[requests.Response]:
-        return self.requester.send_request(
+        return self.requester.send_request(**self._get_request_arguments(stream_state, stream_slice, next_page_token))
+
+    def _get_request_arguments(
+        self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any], next_page_token: Optional[Mapping[str, Any]] = None
+    ) -> Mapping[str, Any]:
+        return dict(
             path=self._paginator_path(),
             stream_state=stream_state,
             stream_slice=stream_slice,
@@ -288,10 +340,53 @@ class SimpleRetriever(Retriever):
                 next_page_token = self._next_page_token(response)
                 if not next_page_token:
                     pagination_complete = True
+                elif self.concurrent_pages > 1 and (next_page_tokens := self._paginator.get_next_page_tokens(response)):
+                    next_page_token = yield from self._read_pages_concurrently(
+                        records_generator_fn, stream_state, stream_slice, next_page_tokens
+                    )
+                    pagination_complete = not next_page_token
 
         # Always return an empty generator just in case no records were ever yielded
         yield from []
 
+    def _read_pages_concurrently(
+        self,
+        records_generator_fn: Callable[[Optional[requests.Response], Mapping[str, Any], Mapping[str, Any]], Iterable[StreamData]],
+        stream_state: Mapping[str, Any],
+        stream_slice: Mapping[str, Any],
+        next_page_tokens: List[Mapping[str, Any]],
+    ) -> Generator[StreamData, None, Optional[Mapping[str, Any]]]:
+        """
+        Read the pages of the next_page_tokens, up to concurrent_pages of them being requested at the same time. The requests are prepared
+        in the main thread as the paginator defines the request options of its current page, and the records are read in page order.
+
+        :return: The next_page_token following the last page read, or None if the pagination is complete
+        """
+        page_tokens = iter(next_page_tokens)
+        next_page_token: Optional[Mapping[str, Any]] = next_page_tokens[0]
+        pending_pages: Deque[Tuple[Mapping[str, Any], Future[Optional[requests.Response]]]] = deque()
+        threadpool = ThreadPoolExecutor(max_workers=self.concurrent_pages, thread_name_prefix="page")
+        try:
+            while True:
+                while len(pending_pages) < self.concurrent_pages and (page_token := next(page_tokens, None)) is not None:
+                    self._paginator.set_next_page_token(page_token)
+                    request_arguments = self._get_request_arguments(stream_state, stream_slice, page_token)
+                    pending_pages.append((page_token, threadpool.submit(self.requester.send_request, **request_arguments)))
+                if not pending_pages:
+                    return next_page_token
+                page_token, pending_response = pending_pages.popleft()
+                response = pending_response.result()
+                # The paginator is moved back to the page that is read so that it decides if the pagination continues after it
+                self._paginator.set_next_page_token(page_token)
+                yield from records_generator_fn(response, stream_state, stream_slice)
+                next_page_token = self._next_page_token(response) if response else None
+                if not next_page_token:
+                    return None
+        finally:
+            for _, pending_response in pending_pages:
+                pending_response.cancel()
+            threadpool.shutdown(wait=True)
+
     def read_records(
         self,
         stream_slice: Optional[StreamSlice] = None,
@@ -3,29 +3,53 @@
 #
 
 import pkgutil
+from typing import Optional
 
 import yaml
 from airbyte_cdk.sources.declarative.manifest_declarative_source import ManifestDeclarativeSource
+from airbyte_cdk.sources.declarative.parsers.compiled_manifest import CompiledManifest
 from airbyte_cdk.sources.declarative.types import ConnectionDefinition
 
 
 class YamlDeclarativeSource(ManifestDeclarativeSource):
     """Declarative source defined by a yaml file"""
 
-    def __init__(self, path_to_yaml, debug: bool = False):
+    def __init__(self, path_to_yaml, debug: bool = False, compiled_manifest_path: Optional[str] = None):
         """
         :param path_to_yaml: Path to the yaml file describing the source
+        :param compiled_manifest_path: Optional path to the file written by compile_manifest. If it was compiled from the current yaml file
+        by the current CDK version, the yaml file is neither parsed nor validated and the source is created from the compiled manifest
         """
         self._path_to_yaml = path_to_yaml
-        source_config = self._read_and_parse_yaml_file(path_to_yaml)
-        super().__init__(source_config, debug)
+        if compiled_manifest_path is None:
+            self._manifest_hash = None
+            super().__init__(self._read_and_parse_yaml_file(path_to_yaml), debug)
+            return
 
-    def _read_and_parse_yaml_file(self, path_to_yaml_file) -> ConnectionDefinition:
+        decoded_yaml = self._read_yaml_file(path_to_yaml)
+        self._manifest_hash = CompiledManifest.hash_manifest(decoded_yaml)
+        compiled_manifest = CompiledManifest.load(compiled_manifest_path, self._manifest_hash)
+        if compiled_manifest:
+            super().__init__(compiled_manifest.resolved_manifest, debug, compiled_manifest=compiled_manifest)
+        else:
+            super().__init__(self._parse(decoded_yaml), debug)
+
+    def compile_manifest(self, compiled_manifest_path: str) -> None:
+        """
+        Writes the manifest resolved and validated when the source was created to compiled_manifest_path so that sources created with this
+        compiled_manifest_path can skip parsing, resolving and validating the yaml file
+        """
+        manifest_hash = self._manifest_hash or CompiledManifest.hash_manifest(self._read_yaml_file(self._path_to_yaml))
+        CompiledManifest.compile(manifest_hash, self.resolved_manifest).save(compiled_manifest_path)
+
+    def _read_yaml_file(self, path_to_yaml_file: str) -> str:
         package = self.__class__.__module__.split(".")[0]
 
         yaml_config = pkgutil.get_data(package, path_to_yaml_file)
-        decoded_yaml = yaml_config.decode()
-        return self._parse(decoded_yaml)
+        return yaml_config.decode()
+
+    def _read_and_parse_yaml_file(self, path_to_yaml_file) -> ConnectionDefinition:
+        return self._parse(self._read_yaml_file(path_to_yaml_file))
 
     def _emit_manifest_debug_message(self, extra_args: dict):
         extra_args["path_to_yaml"] = self._path_to_yaml
@@ -15,6 +15,11 @@ class InferenceType(Enum):
     PRIMITIVE_TYPES_ONLY = "Primitive Types Only"
 
 
+class CsvEngine(Enum):
+    PYTHON = "Python"
+    PYARROW = "PyArrow"
+
+
 class CsvHeaderDefinitionType(Enum):
     FROM_CSV = "From CSV"
     AUTOGENERATED = "Autogenerated"
@@ -148,6 +153,13 @@ class CsvFormat(BaseModel):
         airbyte_hidden=True,
     )
 
+    engine: CsvEngine = Field(
+        title="Parsing Engine",
+        default=CsvEngine.PYTHON,
+        description="The engine used to parse the CSV files. The PyArrow engine reads files in blocks and casts values column by column which is faster for large files.",
+        airbyte_hidden=True,
+    )
+
     @validator("delimiter")
     def validate_delimiter(cls, v: str) -> str:
         if len(v) != 1:
@@ -53,6 +53,12 @@ class FileBasedStreamConfig(BaseModel):
         description="When the state history of the file store is full, syncs will only read files that were last modified in the provided day range.",
         default=3,
     )
+    max_history_size: Optional[int] = Field(
+        title="Max History Size",
+        description="The maximum number of files kept in the state history. Files that are not in the history are synced based on the time window defined by days_to_sync_if_history_is_full. Defaults to 10,000 files.",
+        ge=1,
+        airbyte_hidden=True,
+    )
     format: Union[AvroFormat, CsvFormat, JsonlFormat, ParquetFormat, UnstructuredFormat] = Field(
         title="Format",
         description="The configuration options that are used to alter how to read incoming files that deviate from the standard formatting.",
@@ -62,6 +68,13 @@ class FileBasedStreamConfig(BaseModel):
         description="When enabled, syncs will not validate or structure records against the stream's schema.",
         default=False,
     )
+    max_concurrent_files: int = Field(
+        title="Max Concurrent Files",
+        description="The number of files parsed at the same time during a sync. Reading files concurrently reduces the time spent waiting for files to be opened when syncing many small files.",
+        default=1,
+        ge=1,
+        airbyte_hidden=True,
+    )
 
     @validator("input_schema", pre=True)
     def validate_input_schema(cls, v: Optional[str]) -> Optional[str]:
@@ -21,3 +21,10 @@ class ParquetFormat(BaseModel):
         description="Whether to convert decimal fields to floats. There is a loss of precision when converting decimals to floats, so this is not recommended.",
         default=False,
     )
+    batch_size: int = Field(
+        title="Record Batch Size",
+        description="The maximum number of rows read from a Parquet file at once. Lower values reduce memory usage for files with large row groups.",
+        default=64 * 1024,
+        gt=0,
+        airbyte_hidden=True,
+    )
@@ -3,6 +3,8 @@
 #
 
 import csv
+import io
+import itertools
 import json
 import logging
 from abc import ABC, abstractmethod
@@ -11,8 +13,16 @@ from functools import partial
 from io import IOBase
 from typing import Any, Callable, Dict, Generator, Iterable, List, Mapping, Optional, Set
 
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 from airbyte_cdk.models import FailureType
-from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat, CsvHeaderAutogenerated, CsvHeaderUserProvided, InferenceType
+from airbyte_cdk.sources.file_based.config.csv_format import (
+    CsvEngine,
+    CsvFormat,
+    CsvHeaderAutogenerated,
+    CsvHeaderUserProvided,
+    InferenceType,
+)
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.exceptions import FileBasedSourceError, RecordParseError
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
@@ -117,11 +127,129 @@ class _CsvReader:
             fp.readline()
 
 
+class _UnsupportedByPyArrow(Exception):
+    """
+    Raised when pyarrow can't parse rows the way the csv module does, e.g. rows that don't have as many values as there are headers.
+    """
+
+
+class _InvalidRowTracker:
+    """
+    Records if pyarrow found rows it could not parse.
+    """
+
+    def __init__(self) -> None:
+        self.found_invalid_row = False
+
+    def handle(self, row: pa_csv.InvalidRow) -> str:
+        self.found_invalid_row = True
+        return "skip"
+
+
+class _PyArrowCsvReader:
+    """
+    Reads CSV files in blocks with pyarrow. Values are read as strings so that they can be cast like the values read by _CsvReader, and
+    headers and skipped rows are handled like _CsvReader does.
+    """
+
+    _BLOCK_SIZE = 1 << 20
+
+    def __init__(self, csv_reader: Optional[_CsvReader] = None):
+        self._csv_reader = csv_reader if csv_reader else _CsvReader()
+
+    @staticmethod
+    def supports(config_format: CsvFormat) -> bool:
+        """
+        Rows are skipped on the binary file object so the encoding has to represent line breaks like ASCII does.
+        """
+        return "\n".encode(config_format.encoding or "utf8") == b"\n"
+
+    def read_columns(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+    ) -> Generator[Dict[str, List[str]], None, None]:
+        """
+        Yield the values of each block of rows by column name.
+
+        If pyarrow can't parse a block like the csv module would, _UnsupportedByPyArrow is raised before yielding it. The rows that
+        were not yielded yet should then be read with _CsvReader so that errors are reported the same way.
+        """
+        config_format = _extract_format(config)
+        encoding = config_format.encoding or "utf8"
+        with stream_reader.open_file(file, FileReadMode.READ_BINARY, None, logger) as fp:
+            headers = self._get_headers(fp, config, encoding)
+            if not headers:
+                raise _UnsupportedByPyArrow()
+
+            rows_to_skip = (
+                config_format.skip_rows_before_header
+                + (1 if config_format.header_definition.has_header_row() else 0)
+                + config_format.skip_rows_after_header
+            )
+            self._csv_reader._skip_rows(fp, rows_to_skip)
+
+            invalid_row_tracker = _InvalidRowTracker()
+            try:
+                reader = pa_csv.open_csv(
+                    fp,
+                    read_options=pa_csv.ReadOptions(column_names=headers, block_size=self._BLOCK_SIZE, use_threads=False, encoding=encoding),
+                    parse_options=pa_csv.ParseOptions(
+                        delimiter=config_format.delimiter,
+                        quote_char=config_format.quote_char,
+                        double_quote=config_format.double_quote,
+                        escape_char=config_format.escape_char or False,
+                        newlines_in_values=True,
+                        invalid_row_handler=invalid_row_tracker.handle,
+                    ),
+                    convert_options=pa_csv.ConvertOptions(
+                        column_types={header: pa.string() for header in headers}, strings_can_be_null=False, quoted_strings_can_be_null=False
+                    ),
+                )
+                for batch in reader:
+                    if invalid_row_tracker.found_invalid_row:
+                        raise _UnsupportedByPyArrow()
+                    # Converting through numpy is much faster than `to_pylist` for strings and there are no nulls to convert
+                    yield {header: column.to_numpy(zero_copy_only=False).tolist() for header, column in zip(headers, batch.columns)}
+                if invalid_row_tracker.found_invalid_row:
+                    raise _UnsupportedByPyArrow()
+            except pa.ArrowInvalid as exc:
+                raise _UnsupportedByPyArrow() from exc
+
+    def _get_headers(self, fp: IOBase, config: FileBasedStreamConfig, encoding: str) -> List[str]:
+        """
+        Read the headers with the csv module like _CsvReader does. The file object is reset to the beginning of the file.
+        """
+        config_format = _extract_format(config)
+        dialect_name = config.name + DIALECT_NAME
+        csv.register_dialect(
+            dialect_name,
+            delimiter=config_format.delimiter,
+            quotechar=config_format.quote_char,
+            escapechar=config_format.escape_char,
+            doublequote=config_format.double_quote,
+            quoting=csv.QUOTE_MINIMAL,
+        )
+        text_fp = io.TextIOWrapper(fp, encoding=encoding)  # type: ignore # the file object is a binary stream
+        try:
+            return self._csv_reader._get_headers(text_fp, config_format, dialect_name)
+        except StopIteration as exc:
+            # The file has no rows
+            raise _UnsupportedByPyArrow() from exc
+        finally:
+            text_fp.detach()
+            fp.seek(0)
+            csv.unregister_dialect(dialect_name)
+
+
 class CsvParser(FileTypeParser):
     _MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE = 1_000_000
 
-    def __init__(self, csv_reader: Optional[_CsvReader] = None):
+    def __init__(self, csv_reader: Optional[_CsvReader] = None, pyarrow_csv_reader: Optional[_PyArrowCsvReader] = None):
         self._csv_reader = csv_reader if csv_reader else _CsvReader()
+        self._pyarrow_csv_reader = pyarrow_csv_reader if pyarrow_csv_reader else _PyArrowCsvReader(self._csv_reader)
 
     async def infer_schema(
         self,
@@ -178,9 +306,19 @@ class CsvParser(FileTypeParser):
             deduped_property_types = CsvParser._pre_propcess_property_types(property_types)
         else:
             deduped_property_types = {}
+        number_of_rows_read = 0
+        if config_format.engine == CsvEngine.PYARROW and self._pyarrow_csv_reader.supports(config_format):
+            try:
+                for columns in self._pyarrow_csv_reader.read_columns(config, file, stream_reader, logger):
+                    yield from CsvParser._columns_to_records(columns, deduped_property_types, config_format, logger, config.schemaless)
+                    number_of_rows_read += len(next(iter(columns.values())))
+                return
+            except _UnsupportedByPyArrow:
+                # The remaining rows are read with the csv module
+                pass
         cast_fn = CsvParser._get_cast_function(deduped_property_types, config_format, logger, config.schemaless)
         data_generator = self._csv_reader.read_data(config, file, stream_reader, logger, self.file_read_mode)
-        for row in data_generator:
+        for row in itertools.islice(data_generator, number_of_rows_read, None):
             yield CsvParser._to_nullable(cast_fn(row), deduped_property_types, config_format.null_values, config_format.strings_can_be_null)
         data_generator.close()
 
@@ -199,6 +337,80 @@ class CsvParser(FileTypeParser):
             # If no schema is provided, yield the rows as they are
             return _no_cast
 
+    @staticmethod
+    def _columns_to_records(
+        columns: Dict[str, List[str]], deduped_property_types: Mapping[str, str], config_format: CsvFormat, logger: logging.Logger, schemaless: bool
+    ) -> Iterable[Dict[str, Any]]:
+        """
+        Build the records of a block of rows read by column. Values are cast and nulled column by column the same way `_cast_types` and
+        `_to_nullable` do for each row.
+        """
+        number_of_rows = len(next(iter(columns.values())))
+        warnings_by_row: Dict[int, List[str]] = defaultdict(list)
+        records_columns: Dict[str, List[Any]] = {}
+        if deduped_property_types and not schemaless:
+            for key, values in columns.items():
+                prop_type = deduped_property_types.get(key)
+                # Like when casting rows, columns that are not in the schema are dropped
+                if prop_type in TYPE_PYTHON_MAPPING and prop_type is not None:
+                    records_columns[key] = CsvParser._cast_column(key, values, prop_type, config_format, warnings_by_row)
+        else:
+            records_columns = dict(columns)
+
+        # Rows from which the records can't be built because a value could not be checked against the null values
+        error_row: Optional[int] = None
+        error: Optional[Exception] = None
+        null_values, strings_can_be_null = config_format.null_values, config_format.strings_can_be_null
+        for key, values in records_columns.items():
+            prop_type = deduped_property_types.get(key)
+            if prop_type == "string" and not strings_can_be_null:
+                continue
+            try:
+                records_columns[key] = [None if CsvParser._value_is_none(v, prop_type, null_values, strings_can_be_null) else v for v in values]
+            except TypeError:
+                nullable_values: List[Any] = []
+                for index, value in enumerate(values):
+                    try:
+                        nullable_values.append(None if CsvParser._value_is_none(value, prop_type, null_values, strings_can_be_null) else value)
+                    except TypeError as exc:
+                        if error_row is None or index < error_row:
+                            error_row, error = index, exc
+                        break
+                records_columns[key] = nullable_values
+
+        keys = list(records_columns)
+        rows = zip(*records_columns.values()) if keys else itertools.repeat((), number_of_rows)
+        for index in range(number_of_rows if error_row is None else error_row + 1):
+            if index in warnings_by_row:
+                logger.warning(f"{FileBasedSourceError.ERROR_CASTING_VALUE.value}: {','.join(warnings_by_row[index])}")
+            if index == error_row:
+                raise error  # type: ignore # error is set with error_row
+            yield dict(zip(keys, next(rows)))
+
+    @staticmethod
+    def _cast_column(
+        key: str, values: List[str], prop_type: str, config_format: CsvFormat, warnings_by_row: Dict[int, List[str]]
+    ) -> List[Any]:
+        """
+        Cast the values of a column. Values that can't be cast are kept as strings and a warning is added for their row.
+        """
+        cast_value = _get_value_caster(prop_type, config_format)
+        if cast_value is None:
+            return values
+        try:
+            # Most columns only have values of the expected type
+            return [cast_value(value) for value in values]
+        except ValueError:
+            pass
+        cast_values = []
+        for index, value in enumerate(values):
+            try:
+                cast_values.append(cast_value(value))
+            except ValueError:
+                warnings_by_row[index].append(_format_warning(key, value, prop_type))
+                cast_values.append(value)
+        return cast_values
+
     @staticmethod
     def _to_nullable(
         row: Mapping[str, str], deduped_property_types: Mapping[str, str], null_values: Set[str], strings_can_be_null: bool
@@ -413,6 +625,31 @@ def _value_to_python_type(value: str, python_type: type) -> Any:
     return python_type(value)
 
 
+def _value_to_none(value: str) -> None:
+    if value == "":
+        return None
+    raise ValueError(f"Value {value} is not a valid null value")
+
+
+def _get_value_caster(prop_type: str, config_format: CsvFormat) -> Optional[Callable[[str], Any]]:
+    """
+    Return the function casting a value to the given type or None if the value doesn't need to be cast. The function raises a ValueError
+    if the value can't be cast.
+    """
+    _, python_type = TYPE_PYTHON_MAPPING[prop_type]
+    if python_type is None:
+        return _value_to_none
+    elif python_type == bool:
+        return partial(_value_to_bool, true_values=config_format.true_values, false_values=config_format.false_values)
+    elif python_type == dict:
+        return json.loads
+    elif python_type == list:
+        return _value_to_list
+    elif python_type == str:
+        return None
+    return python_type
+
+
 def _format_warning(key: str, value: str, expected_type: Optional[Any]) -> str:
     return f"{key}: value={value},expected_type={expected_type}"
 
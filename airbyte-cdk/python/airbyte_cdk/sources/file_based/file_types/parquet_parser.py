@@ -9,6 +9,7 @@ from typing import Any, Dict, Iterable, List, Mapping, Optional
 from urllib.parse import unquote
 
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig, ParquetFormat
 from airbyte_cdk.sources.file_based.exceptions import ConfigValidationError, FileBasedSourceError
@@ -61,16 +62,15 @@ class ParquetParser(FileTypeParser):
         with stream_reader.open_file(file, self.file_read_mode, self.ENCODING, logger) as fp:
             reader = pq.ParquetFile(fp)
             partition_columns = {x.split("=")[0]: x.split("=")[1] for x in self._extract_partitions(file.uri)}
-            for row_group in range(reader.num_row_groups):
-                batch = reader.read_row_group(row_group)
-                for row in range(batch.num_rows):
-                    yield {
-                        **{
-                            column: ParquetParser._to_output_value(batch.column(column)[row], parquet_format)
-                            for column in batch.column_names
-                        },
-                        **partition_columns,
-                    }
+            for batch in reader.iter_batches(batch_size=parquet_format.batch_size):
+                # Values are converted a whole column at a time and then zipped into records, which is much cheaper than
+                # converting each cell as a pyarrow scalar
+                column_names = batch.schema.names
+                columns = [ParquetParser._to_output_values(column, parquet_format) for column in batch.columns]
+                for values in zip(*columns):
+                    record = dict(zip(column_names, values))
+                    record.update(partition_columns)
+                    yield record
 
     @staticmethod
     def _extract_partitions(filepath: str) -> List[str]:
@@ -80,6 +80,33 @@ class ParquetParser(FileTypeParser):
     def file_read_mode(self) -> FileReadMode:
         return FileReadMode.READ_BINARY
 
+    @staticmethod
+    def _to_output_values(parquet_column: pa.Array, parquet_format: ParquetFormat) -> List[Any]:
+        """
+        Convert a pyarrow array to a list of values that can be output by the source.
+
+        This is equivalent to calling `_to_output_value` on every scalar of the array.
+        """
+        parquet_type = parquet_column.type
+        if pa.types.is_time(parquet_type) or pa.types.is_timestamp(parquet_type) or pa.types.is_date(parquet_type):
+            return [value.isoformat() if value is not None else None for value in parquet_column.to_pylist()]
+        if pa.types.is_binary(parquet_type) or pa.types.is_large_binary(parquet_type):
+            return pc.cast(parquet_column, pa.large_string()).to_pylist()  # type: ignore[no-any-return]
+        if pa.types.is_fixed_size_binary(parquet_type):
+            return [value.decode("utf-8") if value is not None else None for value in parquet_column.to_pylist()]
+        if pa.types.is_decimal(parquet_type):
+            if parquet_format.decimal_as_float:
+                return parquet_column.to_pylist()  # type: ignore[no-any-return]
+            return [str(value) for value in parquet_column.to_pylist()]
+        if pa.types.is_map(parquet_type):
+            return [{k: v for k, v in value} if value is not None else None for value in parquet_column.to_pylist()]
+        if pa.types.is_null(parquet_type):
+            return [None] * len(parquet_column)
+        if pa.types.is_dictionary(parquet_type) or pa.types.is_duration(parquet_type) or parquet_type == pa.month_day_nano_interval():
+            # These types are rare enough that they go through the scalar conversion
+            return [ParquetParser._to_output_value(value, parquet_format) for value in parquet_column]
+        return parquet_column.to_pylist()  # type: ignore[no-any-return]
+
     @staticmethod
     def _to_output_value(parquet_value: Scalar, parquet_format: ParquetFormat) -> Any:
         """
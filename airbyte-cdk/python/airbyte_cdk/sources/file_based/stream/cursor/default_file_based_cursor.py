@@ -2,9 +2,10 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import heapq
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Iterable, MutableMapping, Optional
+from typing import Any, Dict, Iterable, List, MutableMapping, Optional, Tuple
 
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
@@ -21,6 +22,13 @@ class DefaultFileBasedCursor(AbstractFileBasedCursor):
     def __init__(self, stream_config: FileBasedStreamConfig, **_: Any):
         super().__init__(stream_config)
         self._file_to_datetime_history: MutableMapping[str, str] = {}
+        self._max_history_size = stream_config.max_history_size or self.DEFAULT_MAX_HISTORY_SIZE
+        # Indexes of the history so that it doesn't have to be scanned or parsed for each file. Entries are (last modified, uri) tuples
+        # which are ordered like the files are synced as the last modified dates are formatted with DATE_TIME_FORMAT.
+        self._file_to_parsed_datetime: Dict[str, datetime] = {}
+        # Min-heap of the history entries. Entries of files that were modified again or removed from the history are skipped lazily
+        self._history_heap: List[Tuple[str, str]] = []
+        self._latest_history_entry: Optional[Tuple[str, str]] = None
         self._time_window_if_history_is_full = timedelta(
             days=stream_config.days_to_sync_if_history_is_full or self.DEFAULT_DAYS_TO_SYNC_IF_HISTORY_IS_FULL
         )
@@ -33,16 +41,20 @@ class DefaultFileBasedCursor(AbstractFileBasedCursor):
 
     def set_initial_state(self, value: StreamState) -> None:
         self._file_to_datetime_history = value.get("history", {})
+        self._index_history()
         self._start_time = self._compute_start_time()
         self._initial_earliest_file_in_history = self._compute_earliest_file_in_history()
 
     def add_file(self, file: RemoteFile) -> None:
-        self._file_to_datetime_history[file.uri] = file.last_modified.strftime(self.DATE_TIME_FORMAT)
-        if len(self._file_to_datetime_history) > self.DEFAULT_MAX_HISTORY_SIZE:
+        last_modified = file.last_modified.strftime(self.DATE_TIME_FORMAT)
+        self._file_to_datetime_history[file.uri] = last_modified
+        self._file_to_parsed_datetime[file.uri] = file.last_modified
+        self._add_history_entry((last_modified, file.uri))
+        if len(self._file_to_datetime_history) > self._max_history_size:
             # Get the earliest file based on its last modified date and its uri
-            oldest_file = self._compute_earliest_file_in_history()
-            if oldest_file:
-                del self._file_to_datetime_history[oldest_file.uri]
+            oldest_entry = self._earliest_history_entry()
+            if oldest_entry:
+                self._remove_history_entry(oldest_entry)
             else:
                 raise Exception(
                     "The history is full but there is no files in the history. This should never happen and might be indicative of a bug in the CDK."
@@ -59,8 +71,8 @@ class DefaultFileBasedCursor(AbstractFileBasedCursor):
         Files are synced in order of last-modified with secondary sort on filename, so the cursor value is
         a string joining the last-modified timestamp of the last synced file and the name of the file.
         """
-        if self._file_to_datetime_history.items():
-            filename, timestamp = max(self._file_to_datetime_history.items(), key=lambda x: (x[1], x[0]))
+        if self._latest_history_entry:
+            timestamp, filename = self._latest_history_entry
             return f"{timestamp}_{filename}"
         return None
 
@@ -68,12 +80,12 @@ class DefaultFileBasedCursor(AbstractFileBasedCursor):
         """
         Returns true if the state's history is full, meaning new entries will start to replace old entries.
         """
-        return len(self._file_to_datetime_history) >= self.DEFAULT_MAX_HISTORY_SIZE
+        return len(self._file_to_datetime_history) >= self._max_history_size
 
     def _should_sync_file(self, file: RemoteFile, logger: logging.Logger) -> bool:
         if file.uri in self._file_to_datetime_history:
             # If the file's uri is in the history, we should sync the file if it has been modified since it was synced
-            updated_at_from_history = datetime.strptime(self._file_to_datetime_history[file.uri], self.DATE_TIME_FORMAT)
+            updated_at_from_history = self._file_to_parsed_datetime[file.uri]
             if file.last_modified < updated_at_from_history:
                 logger.warning(
                     f"The file {file.uri}'s last modified date is older than the last time it was synced. This is unexpected. Skipping the file."
@@ -114,18 +126,58 @@ class DefaultFileBasedCursor(AbstractFileBasedCursor):
         return self._start_time
 
     def _compute_earliest_file_in_history(self) -> Optional[RemoteFile]:
-        if self._file_to_datetime_history:
-            filename, last_modified = min(self._file_to_datetime_history.items(), key=lambda f: (f[1], f[0]))
-            return RemoteFile(uri=filename, last_modified=datetime.strptime(last_modified, self.DATE_TIME_FORMAT))
+        earliest_entry = self._earliest_history_entry()
+        if earliest_entry:
+            _, filename = earliest_entry
+            return RemoteFile(uri=filename, last_modified=self._file_to_parsed_datetime[filename])
         else:
             return None
 
+    def _index_history(self) -> None:
+        self._file_to_parsed_datetime = {
+            filename: datetime.strptime(last_modified, self.DATE_TIME_FORMAT) for filename, last_modified in self._file_to_datetime_history.items()
+        }
+        self._history_heap = [(last_modified, filename) for filename, last_modified in self._file_to_datetime_history.items()]
+        heapq.heapify(self._history_heap)
+        self._latest_history_entry = max(self._history_heap, default=None)
+
+    def _add_history_entry(self, entry: Tuple[str, str]) -> None:
+        heapq.heappush(self._history_heap, entry)
+        if self._latest_history_entry is None or entry > self._latest_history_entry:
+            self._latest_history_entry = entry
+        elif entry[1] == self._latest_history_entry[1]:
+            # The latest file was added again with an earlier date
+            self._latest_history_entry = self._compute_latest_history_entry()
+        if len(self._history_heap) > 2 * len(self._file_to_datetime_history):
+            # Drop the entries of files that were added again
+            self._history_heap = [(last_modified, filename) for filename, last_modified in self._file_to_datetime_history.items()]
+            heapq.heapify(self._history_heap)
+
+    def _remove_history_entry(self, entry: Tuple[str, str]) -> None:
+        _, filename = entry
+        del self._file_to_datetime_history[filename]
+        del self._file_to_parsed_datetime[filename]
+        if entry == self._latest_history_entry:
+            self._latest_history_entry = self._compute_latest_history_entry()
+
+    def _earliest_history_entry(self) -> Optional[Tuple[str, str]]:
+        while self._history_heap:
+            last_modified, filename = self._history_heap[0]
+            if self._file_to_datetime_history.get(filename) == last_modified:
+                return last_modified, filename
+            heapq.heappop(self._history_heap)
+        return None
+
+    def _compute_latest_history_entry(self) -> Optional[Tuple[str, str]]:
+        return max(((last_modified, filename) for filename, last_modified in self._file_to_datetime_history.items()), default=None)
+
     def _compute_start_time(self) -> datetime:
-        if not self._file_to_datetime_history:
+        earliest_entry = self._earliest_history_entry()
+        if not earliest_entry:
             return datetime.min
         else:
-            earliest = min(self._file_to_datetime_history.values())
-            earliest_dt = datetime.strptime(earliest, self.DATE_TIME_FORMAT)
+            _, filename = earliest_entry
+            earliest_dt = self._file_to_parsed_datetime[filename]
             if self._is_history_full():
                 time_window = datetime.now() - self._time_window_if_history_is_full
                 earliest_dt = min(earliest_dt, time_window)
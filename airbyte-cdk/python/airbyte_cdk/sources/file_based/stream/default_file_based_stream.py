@@ -7,7 +7,7 @@ import itertools
 import traceback
 from copy import deepcopy
 from functools import cache
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Set, Union
+from typing import Any, Callable, Dict, Generator, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Set, Tuple, Union
 
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, FailureType, Level
 from airbyte_cdk.models import Type as MessageType
@@ -21,14 +21,16 @@ from airbyte_cdk.sources.file_based.exceptions import (
     SchemaInferenceError,
     StopSyncPerValidationPolicy,
 )
+from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.schema_helpers import SchemaType, merge_schemas, schemaless_schema
 from airbyte_cdk.sources.file_based.stream import AbstractFileBasedStream
 from airbyte_cdk.sources.file_based.stream.cursor import AbstractFileBasedCursor
+from airbyte_cdk.sources.file_based.stream.file_prefetcher import FilePrefetcher
 from airbyte_cdk.sources.file_based.types import StreamSlice
 from airbyte_cdk.sources.streams import IncrementalMixin
 from airbyte_cdk.sources.streams.core import JsonSchema
-from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
+from airbyte_cdk.sources.utils.record_helper import RecordEmitter
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
 
@@ -46,6 +48,13 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
     def __init__(self, cursor: AbstractFileBasedCursor, **kwargs: Any):
         super().__init__(**kwargs)
         self._cursor = cursor
+        # The files of all the slices of the sync, in the order they are read
+        self._files_to_sync: List[RemoteFile] = []
+        # When parsing files concurrently, the prefetched files are kept from one slice to the next so that the files of the next slices
+        # are already being parsed while the end of a slice is read
+        self._files_to_prefetch: List[RemoteFile] = []
+        self._prefetched_files: Optional[Generator[Tuple[RemoteFile, Iterator[Dict[str, Any]]], None, None]] = None
+        self._next_prefetched_file_index = 0
 
     @property
     def state(self) -> MutableMapping[str, Any]:
@@ -66,6 +75,7 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
         files_to_read = self._cursor.get_files_to_sync(all_files, self.logger)
         sorted_files_to_read = sorted(files_to_read, key=lambda f: (f.last_modified, f.uri))
         slices = [{"files": list(group[1])} for group in itertools.groupby(sorted_files_to_read, lambda f: f.last_modified)]
+        self._files_to_sync = sorted_files_to_read
         return slices
 
     def read_records_from_slice(self, stream_slice: StreamSlice) -> Iterable[AirbyteMessage]:
@@ -81,13 +91,14 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
             raise MissingSchemaError(FileBasedSourceError.MISSING_SCHEMA, stream=self.name)
         # The stream only supports a single file type, so we can use the same parser for all files
         parser = self.get_parser()
-        for file in stream_slice["files"]:
+        record_emitter = RecordEmitter(self.name)
+        for file, records in self._parse_files(parser, stream_slice["files"], schema):
             # only serialize the datetime once
             file_datetime_string = file.last_modified.strftime(self.DATE_TIME_FORMAT)
             n_skipped = line_no = 0
 
             try:
-                for record in parser.parse_records(self.config, file, self.stream_reader, self.logger, schema):
+                for record in records:
                     line_no += 1
                     if self.config.schemaless:
                         record = {"data": record}
@@ -96,7 +107,7 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
                         continue
                     record[self.ab_last_mod_col] = file_datetime_string
                     record[self.ab_file_name_col] = file.uri
-                    yield stream_data_to_airbyte_message(self.name, record)
+                    yield record_emitter.to_message(record)
                 self._cursor.add_file(file)
 
             except StopSyncPerValidationPolicy:
@@ -141,6 +152,71 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
                         ),
                     )
 
+    def _parse_files(
+        self, parser: FileTypeParser, files: List[RemoteFile], schema: Mapping[str, Any]
+    ) -> Iterable[Tuple[RemoteFile, Iterable[Dict[str, Any]]]]:
+        """
+        Yield the files in order with their records. The records are lazily parsed unless the stream is configured to parse files
+        concurrently in which case the files following the one being read, including the files of the next slices, are parsed ahead of
+        time.
+        """
+
+        def parse_records(file: RemoteFile) -> Iterable[Dict[str, Any]]:
+            # Defined as a generator so that errors opening the file are raised while reading its records
+            yield from parser.parse_records(self.config, file, self.stream_reader, self.logger, schema)
+
+        if self.config.max_concurrent_files <= 1:
+            for file in files:
+                yield file, parse_records(file)
+            return
+
+        prefetched_files = self._get_prefetched_files(parse_records, files)
+        slice_read = False
+        try:
+            for _ in files:
+                file, records = next(prefetched_files)
+                self._next_prefetched_file_index += 1
+                yield file, records
+            slice_read = True
+        finally:
+            # Keep prefetching the files of the next slices unless the reader stopped or there are no files left to read
+            if not slice_read or self._next_prefetched_file_index == len(self._files_to_prefetch):
+                self._stop_prefetching()
+
+    def _get_prefetched_files(
+        self, parse_records: Callable[[RemoteFile], Iterable[Dict[str, Any]]], files: List[RemoteFile]
+    ) -> Generator[Tuple[RemoteFile, Iterator[Dict[str, Any]]], None, None]:
+        """
+        Return the prefetched files starting with the files of the slice. If the slice is not the one following the previous slice read,
+        the prefetching restarts from the slice, along with the files that follow it in the sync.
+
+        The files of the next slices are parsed with the parser and schema of the slice the prefetching started from, which is fine as
+        both are the same for all the slices of the stream.
+        """
+        next_files = self._files_to_prefetch[self._next_prefetched_file_index : self._next_prefetched_file_index + len(files)]
+        if self._prefetched_files is None or next_files != files:
+            self._stop_prefetching()
+            try:
+                start = self._files_to_sync.index(files[0])
+            except (IndexError, ValueError):
+                start = -1
+            if start >= 0 and self._files_to_sync[start : start + len(files)] == files:
+                self._files_to_prefetch = self._files_to_sync[start:]
+            else:
+                # The slice was not computed by this stream so only its own files are known
+                self._files_to_prefetch = files
+            self._prefetched_files = FilePrefetcher(parse_records, self.config.max_concurrent_files).prefetch(self._files_to_prefetch)
+            self._next_prefetched_file_index = 0
+        return self._prefetched_files
+
+    def _stop_prefetching(self) -> None:
+        if self._prefetched_files is not None:
+            # Closing the generator abandons the files being parsed and waits for the parsing threads to stop
+            self._prefetched_files.close()
+            self._prefetched_files = None
+        self._files_to_prefetch = []
+        self._next_prefetched_file_index = 0
+
     @property
     def cursor_field(self) -> Union[str, List[str]]:
         """
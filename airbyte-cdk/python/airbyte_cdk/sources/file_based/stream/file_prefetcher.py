@@ -0,0 +1,121 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from queue import Full, Queue
+from typing import Any, Callable, Deque, Dict, Generator, Iterable, Iterator, Tuple, Union
+
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+
+Record = Dict[str, Any]
+
+
+class _FileParsed:
+    """
+    Sentinel added to the queue of a file once all its records were added.
+    """
+
+
+class _PrefetchedFile:
+    """
+    The records parsed from a file that weren't read yet.
+    """
+
+    def __init__(self, file: RemoteFile, buffer_size: int):
+        self.file = file
+        self.records: Queue[Union[Record, _FileParsed, Exception]] = Queue(maxsize=buffer_size)
+        # Set once the records of the file won't be read anymore, either because they all were or because the reader moved on
+        self.abandoned = threading.Event()
+
+
+class FilePrefetcher:
+    """
+    Parses files in a thread pool ahead of their records being read so the latency of opening a file is not paid once per file.
+
+    Files are still returned in the order they are given and each file is returned with an iterator over its records. Parsing errors are
+    raised by that iterator so they can be handled like when the file is parsed by the reading thread.
+    """
+
+    # Time waited before checking if a file was abandoned when its buffer is full
+    _PUT_TIMEOUT_SECONDS = 0.1
+
+    def __init__(self, parse_records: Callable[[RemoteFile], Iterable[Record]], max_concurrent_files: int, buffer_size: int = 1000):
+        """
+        :param parse_records: Function parsing the records of a file. It is called from the threads of the pool
+        :param max_concurrent_files: The number of files parsed at the same time
+        :param buffer_size: The number of records of a file that can be parsed before they are read
+        """
+        self._parse_records = parse_records
+        self._max_concurrent_files = max_concurrent_files
+        self._buffer_size = buffer_size
+
+    def prefetch(self, files: Iterable[RemoteFile]) -> Generator[Tuple[RemoteFile, Iterator[Record]], None, None]:
+        """
+        Yield the files in order with an iterator over their records. The records of a file should be read before moving on to the next
+        file. Records that were not read are discarded when moving on.
+        """
+        files_to_parse = iter(files)
+        pending_files: Deque[_PrefetchedFile] = deque()
+        threadpool = ThreadPoolExecutor(max_workers=self._max_concurrent_files, thread_name_prefix="fileparser")
+        try:
+            # As there are never more files being parsed than there are threads, the file being read is always being parsed
+            for file in files_to_parse:
+                pending_files.append(self._submit(threadpool, file))
+                if len(pending_files) == self._max_concurrent_files:
+                    break
+            while pending_files:
+                # The file is only removed from the pending files once it was read so it is abandoned if the reader stops in the meantime
+                prefetched_file = pending_files[0]
+                yield prefetched_file.file, self._read_records(prefetched_file)
+                pending_files.popleft().abandoned.set()
+                next_file = next(files_to_parse, None)
+                if next_file is not None:
+                    pending_files.append(self._submit(threadpool, next_file))
+        finally:
+            for prefetched_file in pending_files:
+                prefetched_file.abandoned.set()
+            threadpool.shutdown(wait=True)
+
+    def _submit(self, threadpool: ThreadPoolExecutor, file: RemoteFile) -> _PrefetchedFile:
+        prefetched_file = _PrefetchedFile(file, self._buffer_size)
+        threadpool.submit(self._parse_file, prefetched_file)
+        return prefetched_file
+
+    def _parse_file(self, prefetched_file: _PrefetchedFile) -> None:
+        """
+        Put the records of the file in its queue followed by a _FileParsed sentinel, or the exception raised while parsing it.
+
+        This method is meant to be called from a thread.
+        """
+        try:
+            for record in self._parse_records(prefetched_file.file):
+                if not self._put(prefetched_file, record):
+                    return
+            self._put(prefetched_file, _FileParsed())
+        except Exception as e:
+            self._put(prefetched_file, e)
+
+    def _put(self, prefetched_file: _PrefetchedFile, item: Union[Record, _FileParsed, Exception]) -> bool:
+        """
+        Wait for room in the queue of the file to add the item. Return False if the file was abandoned in the meantime.
+        """
+        while not prefetched_file.abandoned.is_set():
+            try:
+                prefetched_file.records.put(item, timeout=self._PUT_TIMEOUT_SECONDS)
+                return True
+            except Full:
+                pass
+        return False
+
+    @staticmethod
+    def _read_records(prefetched_file: _PrefetchedFile) -> Iterator[Record]:
+        while True:
+            item = prefetched_file.records.get()
+            if isinstance(item, _FileParsed):
+                return
+            elif isinstance(item, Exception):
+                raise item
+            yield item
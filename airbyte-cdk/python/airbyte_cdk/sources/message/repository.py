@@ -84,8 +84,13 @@ class InMemoryMessageRepository(MessageRepository):
             )
 
     def consume_queue(self) -> Iterable[AirbyteMessage]:
-        while self._message_queue:
-            yield self._message_queue.popleft()
+        # The queue might be consumed by multiple threads so it can be emptied between a check for emptiness and popleft
+        while True:
+            try:
+                message = self._message_queue.popleft()
+            except IndexError:
+                return
+            yield message
 
 
 class LogAppenderMessageRepositoryDecorator(MessageRepository):
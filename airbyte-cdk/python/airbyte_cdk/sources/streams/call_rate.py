@@ -13,7 +13,6 @@ from typing import TYPE_CHECKING, Any, Mapping, Optional
 from urllib import parse
 
 import requests
-import requests_cache
 from pyrate_limiter import InMemoryBucket, Limiter
 from pyrate_limiter import Rate as PyRateRate
 from pyrate_limiter import RateItem, TimeClock
@@ -519,5 +518,23 @@ class LimiterSession(LimiterMixin, requests.Session):
     """Session that adds rate-limiting behavior to requests."""
 
 
-class CachedLimiterSession(requests_cache.CacheMixin, LimiterMixin, requests.Session):
-    """Session class with caching and rate-limiting behavior."""
+if TYPE_CHECKING:
+    import requests_cache
+
+    class CachedLimiterSession(requests_cache.CacheMixin, LimiterMixin, requests.Session):  # type: ignore # requests_cache is untyped
+        """Session class with caching and rate-limiting behavior."""
+
+
+def __getattr__(name: str) -> Any:
+    # requests_cache is slow to import, so the cached session class is only created when a stream enables caching
+    if name == "CachedLimiterSession":
+        import requests_cache
+
+        class _CachedLimiterSession(requests_cache.CacheMixin, LimiterMixin, requests.Session):  # type: ignore # requests_cache is untyped
+            """Session class with caching and rate-limiting behavior."""
+
+        _CachedLimiterSession.__name__ = _CachedLimiterSession.__qualname__ = name
+        # Later lookups find the class in the module without going through __getattr__
+        globals()[name] = _CachedLimiterSession
+        return _CachedLimiterSession
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
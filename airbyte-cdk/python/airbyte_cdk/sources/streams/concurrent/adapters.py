@@ -285,6 +285,7 @@ class StreamPartition(Partition):
             #  * parse_response
             #  Both are not used for Stripe so we should be good for the first iteration of Concurrent CDK. However, Stripe still do
             #  `if not stream_state` to know if it calls the Event stream or not
+            schema = self._stream.get_json_schema()
             for record_data in self._stream.read_records(
                 cursor_field=self._cursor_field,
                 sync_mode=SyncMode.full_refresh,
@@ -293,7 +294,7 @@ class StreamPartition(Partition):
             ):
                 if isinstance(record_data, Mapping):
                     data_to_return = dict(record_data)
-                    self._stream.transformer.transform(data_to_return, self._stream.get_json_schema())
+                    self._stream.transformer.transform(data_to_return, schema)
                     yield Record(data_to_return)
                 else:
                     self._message_repository.emit_message(record_data)
@@ -0,0 +1,64 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from queue import Queue
+from typing import Iterable, Union
+
+from airbyte_cdk.models import AirbyteMessage
+
+
+class StreamCompleteSentinel:
+    """
+    A sentinel object indicating all messages for a stream were produced.
+    Includes the name of the stream that was read.
+    """
+
+    def __init__(self, stream_name: str):
+        """
+        :param stream_name: The name of the stream that was read
+        """
+        self.stream_name = stream_name
+
+
+"""
+Typedef representing the items that can be added to the queue when reading streams concurrently
+"""
+StreamMessageQueueItem = Union[AirbyteMessage, StreamCompleteSentinel, Exception]
+
+
+class StreamMessageReader:
+    """
+    Reads the messages of a stream and puts them in a queue.
+    """
+
+    def __init__(self, queue: Queue[StreamMessageQueueItem], stop_event: threading.Event) -> None:
+        """
+        :param queue: The queue to put the messages in.
+        :param stop_event: Event set by the consumer of the queue when it won't read any more messages.
+        """
+        self._queue = queue
+        self._stop_event = stop_event
+
+    def read_stream(self, stream_name: str, messages: Iterable[AirbyteMessage]) -> None:
+        """
+        Read the messages of a stream and put them in the output queue.
+        When all the messages are added to the queue, a sentinel is added to the queue to indicate that the stream was fully read.
+
+        If an exception is encountered, the exception will be caught and put in the queue.
+        If the stop event is set, the stream stops being read and nothing else is added to the queue.
+
+        This method is meant to be called from a thread.
+        :param stream_name: The name of the stream being read
+        :param messages: The messages of the stream
+        :return: None
+        """
+        try:
+            for message in messages:
+                if self._stop_event.is_set():
+                    return
+                self._queue.put(message)
+            self._queue.put(StreamCompleteSentinel(stream_name))
+        except Exception as e:
+            self._queue.put(e)
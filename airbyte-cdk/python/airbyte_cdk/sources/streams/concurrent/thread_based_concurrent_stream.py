@@ -3,12 +3,12 @@
 #
 
 import concurrent
-import time
+import threading
 from concurrent.futures import Future
-from functools import lru_cache
+from functools import lru_cache, partial
 from logging import Logger
 from queue import Queue
-from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set
 
 from airbyte_cdk.models import AirbyteStream, SyncMode
 from airbyte_cdk.sources.message import MessageRepository
@@ -28,7 +28,6 @@ class ThreadBasedConcurrentStream(AbstractStream):
 
     DEFAULT_TIMEOUT_SECONDS = 900
     DEFAULT_MAX_QUEUE_SIZE = 10_000
-    DEFAULT_SLEEP_TIME = 0.1
 
     def __init__(
         self,
@@ -44,7 +43,6 @@ class ThreadBasedConcurrentStream(AbstractStream):
         message_repository: MessageRepository,
         timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
         max_concurrent_tasks: int = DEFAULT_MAX_QUEUE_SIZE,
-        sleep_time: float = DEFAULT_SLEEP_TIME,
         cursor: Cursor = NoopCursor(),
         namespace: Optional[str] = None,
     ):
@@ -61,7 +59,9 @@ class ThreadBasedConcurrentStream(AbstractStream):
         self._message_repository = message_repository
         self._timeout_seconds = timeout_seconds
         self._max_concurrent_tasks = max_concurrent_tasks
-        self._sleep_time = sleep_time
+        # A slot is acquired when a task is submitted and released when the task completes
+        self._task_slots = threading.Semaphore(max_concurrent_tasks)
+        self._futures_lock = threading.Lock()
         self._cursor = cursor
         self._namespace = namespace
 
@@ -78,22 +78,29 @@ class ThreadBasedConcurrentStream(AbstractStream):
           - If the next work item is a partition, submit a future to process it.
             - The future will add the records to emit on the work queue.
             - Add the partitions to the partitions_to_done dict so we know it needs to complete for the sync to succeed.
+            - Increment the number of pending partitions.
           - If the next work item is a record, yield the record.
           - If the next work item is PARTITIONS_GENERATED_SENTINEL, all the partitions were generated.
           - If the next work item is a PartitionCompleteSentinel, a partition is done processing.
             - Update the value in partitions_to_done to True so we know the partition is completed.
+            - Decrement the number of pending partitions.
+        3. Stop once all partitions were generated and no partition is pending.
+
+        The number of pending partitions is maintained incrementally so that the cost of processing a work item doesn't depend on the
+        number of partitions.
         """
         self._logger.debug(f"Processing stream slices for {self.name}")
-        futures: List[Future[Any]] = []
+        futures: Set[Future[Any]] = set()
         queue: Queue[QueueItem] = Queue()
         partition_generator = PartitionEnqueuer(queue, PARTITIONS_GENERATED_SENTINEL)
         partition_reader = PartitionReader(queue)
 
-        self._submit_task(futures, partition_generator.generate_partitions, self._stream_partition_generator)
+        self._submit_task(futures, queue, partition_generator.generate_partitions, self._stream_partition_generator)
 
         # True -> partition is done
         # False -> partition is not done
         partitions_to_done: Dict[Partition, bool] = {}
+        pending_partitions = 0
 
         finished_partitions = False
         while record_or_partition_or_exception := queue.get(block=True, timeout=self._timeout_seconds):
@@ -110,7 +117,9 @@ class ThreadBasedConcurrentStream(AbstractStream):
                     raise RuntimeError(
                         f"Received sentinel for partition {record_or_partition_or_exception.partition} that was not in partitions. This is indicative of a bug in the CDK. Please contact support.partitions:\n{partitions_to_done}"
                     )
-                partitions_to_done[record_or_partition_or_exception.partition] = True
+                if not partitions_to_done[record_or_partition_or_exception.partition]:
+                    partitions_to_done[record_or_partition_or_exception.partition] = True
+                    pending_partitions -= 1
                 self._cursor.close_partition(record_or_partition_or_exception.partition)
             elif isinstance(record_or_partition_or_exception, Record):
                 # Emit records
@@ -119,50 +128,45 @@ class ThreadBasedConcurrentStream(AbstractStream):
             elif isinstance(record_or_partition_or_exception, Partition):
                 # A new partition was generated and must be processed
                 partitions_to_done[record_or_partition_or_exception] = False
+                pending_partitions += 1
                 if self._slice_logger.should_log_slice_message(self._logger):
                     self._message_repository.emit_message(
                         self._slice_logger.create_slice_log_message(record_or_partition_or_exception.to_slice())
                     )
-                self._submit_task(futures, partition_reader.process_partition, record_or_partition_or_exception)
-            if finished_partitions and all(partitions_to_done.values()):
+                self._submit_task(futures, queue, partition_reader.process_partition, record_or_partition_or_exception)
+            if finished_partitions and pending_partitions == 0:
                 # All partitions were generated and process. We're done here
                 break
 
-        self._check_for_errors(futures)
+        with self._futures_lock:
+            remaining_futures = list(futures)
+        self._check_for_errors(remaining_futures)
 
-    def _submit_task(self, futures: List[Future[Any]], function: Callable[..., Any], *args: Any) -> None:
+    def _submit_task(self, futures: Set[Future[Any]], queue: Queue[QueueItem], function: Callable[..., Any], *args: Any) -> None:
         # Submit a task to the threadpool, waiting if there are too many pending tasks
-        self._wait_while_too_many_pending_futures(futures)
-        futures.append(self._threadpool.submit(function, *args))
-
-    def _wait_while_too_many_pending_futures(self, futures: List[Future[Any]]) -> None:
-        # Wait until the number of pending tasks is < self._max_concurrent_tasks
-        while True:
-            self._prune_futures(futures)
-            if len(futures) < self._max_concurrent_tasks:
-                break
-            self._logger.info("Main thread is sleeping because the task queue is full...")
-            time.sleep(self._sleep_time)
-
-    def _prune_futures(self, futures: List[Future[Any]]) -> None:
+        if not self._task_slots.acquire(blocking=False):
+            self._logger.info("Main thread is waiting because the task queue is full...")
+            self._task_slots.acquire()
+        future = self._threadpool.submit(function, *args)
+        with self._futures_lock:
+            futures.add(future)
+        future.add_done_callback(partial(self._on_task_done, futures, queue))
+
+    def _on_task_done(self, futures: Set[Future[Any]], queue: Queue[QueueItem], future: Future[Any]) -> None:
         """
-        Take a list in input and remove the futures that are completed. If a future has an exception, it'll raise and kill the stream
-        operation.
+        Release the slot of a completed task. If the task failed, the error is put on the queue so the main thread fails immediately.
 
-        Pruning this list safely relies on the assumptions that only the main thread can modify the list of futures.
-        """
-        if len(futures) < self._max_concurrent_tasks:
-            return
-
-        for index in reversed(range(len(futures))):
-            future = futures[index]
-            optional_exception = future.exception()
-            if optional_exception:
-                exception = RuntimeError(f"Failed reading from stream {self.name} with error: {optional_exception}")
-                self._stop_and_raise_exception(exception)
+        Futures that failed are kept in the set of futures so they are also reported by `_check_for_errors`.
 
-            if future.done():
-                futures.pop(index)
+        This method is called from the thread that completed the future, or from the main thread if the future is already done.
+        """
+        self._task_slots.release()
+        optional_exception = None if future.cancelled() else future.exception()
+        if optional_exception:
+            queue.put(RuntimeError(f"Failed reading from stream {self.name} with error: {optional_exception}"))
+        else:
+            with self._futures_lock:
+                futures.discard(future)
 
     def _check_for_errors(self, futures: List[Future[Any]]) -> None:
         exceptions_from_futures = [f for f in [future.exception() for future in futures] if f is not None]
@@ -2,8 +2,8 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-import datetime
-from typing import Any, Mapping
+import time
+from typing import Any, Mapping, Optional
 
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, AirbyteRecordMessage, AirbyteTraceMessage
 from airbyte_cdk.models import Type as MessageType
@@ -22,15 +22,57 @@ def stream_data_to_airbyte_message(
 
     if isinstance(data_or_message, Mapping):
         data = dict(data_or_message)
-        now_millis = int(datetime.datetime.now().timestamp() * 1000)
         # Transform object fields according to config. Most likely you will
         # need it to normalize values against json schema. By default no action
         # taken unless configured. See
         # docs/connector-development/cdk-python/schemas.md for details.
         transformer.transform(data, schema)  # type: ignore
-        message = AirbyteRecordMessage(stream=stream_name, data=data, emitted_at=now_millis)
-        return AirbyteMessage(type=MessageType.RECORD, record=message)
-    elif isinstance(data_or_message, AirbyteTraceMessage):
+        return _record_to_airbyte_message(stream_name, data)
+    return _log_or_trace_to_airbyte_message(data_or_message)
+
+
+class RecordEmitter:
+    """
+    Converts the data read from a stream into messages.
+
+    It is meant to be built once per stream read so that the schema and the transformer of the stream are only looked up once instead of
+    for every record.
+    """
+
+    def __init__(self, stream_name: str, transformer: Optional[TypeTransformer] = None, schema: Optional[Mapping[str, Any]] = None):
+        """
+        :param stream_name: The name of the stream the records belong to
+        :param transformer: The transformer applied to the records. No transformation is done if None
+        :param schema: The schema of the stream records are transformed with
+        """
+        self._stream_name = stream_name
+        self._transformer = transformer if transformer is not None and transformer.is_enabled else None
+        self._schema = schema if schema is not None else {}
+
+    def to_message(self, data_or_message: StreamData) -> AirbyteMessage:
+        """
+        Convert the data to a message. Records are only copied when they are transformed as the transformation modifies them in place.
+        """
+        if isinstance(data_or_message, dict) and self._transformer is None:
+            return _record_to_airbyte_message(self._stream_name, data_or_message)
+        elif isinstance(data_or_message, Mapping):
+            data = dict(data_or_message)
+            if self._transformer is not None:
+                self._transformer.transform(data, self._schema)
+            return _record_to_airbyte_message(self._stream_name, data)
+        return _log_or_trace_to_airbyte_message(data_or_message)
+
+
+def _record_to_airbyte_message(stream_name: str, data: Mapping[str, Any]) -> AirbyteMessage:
+    # time.time() is used over datetime.now() as building a datetime for each record is comparatively slow
+    now_millis = int(time.time() * 1000)
+    # The fields are known to be valid so pydantic validation, which copies the data, is skipped for records
+    message = AirbyteRecordMessage.construct(stream=stream_name, data=data, emitted_at=now_millis)
+    return AirbyteMessage.construct(type=MessageType.RECORD, record=message)
+
+
+def _log_or_trace_to_airbyte_message(data_or_message: StreamData) -> AirbyteMessage:
+    if isinstance(data_or_message, AirbyteTraceMessage):
         return AirbyteMessage(type=MessageType.TRACE, trace=data_or_message)
     elif isinstance(data_or_message, AirbyteLogMessage):
         return AirbyteMessage(type=MessageType.LOG, log=data_or_message)
@@ -2,19 +2,48 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import json
 import logging
-from distutils.util import strtobool
+import numbers
 from enum import Flag, auto
-from typing import Any, Callable, Dict, Mapping, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
-from jsonschema import Draft7Validator, ValidationError, validators
+from jsonschema import Draft7Validator, RefResolutionError, RefResolver, ValidationError, validators
 
 json_to_python_simple = {"string": str, "number": float, "integer": int, "boolean": bool, "null": type(None)}
 json_to_python = {**json_to_python_simple, **{"object": dict, "array": list}}
 python_to_json = {v: k for k, v in json_to_python.items()}
 
+# Python types accepted by the jsonschema type checker used for normalization for each json type
+_JSON_TYPE_TO_PYTHON_TYPES = {
+    "array": (list,),
+    "boolean": (bool,),
+    "integer": (int,),
+    "null": (type(None),),
+    "number": (numbers.Number,),
+    "object": (dict,),
+    "string": (str,),
+}
+
+# Truth values of the strings converted to booleans, as accepted by distutils.util.strtobool. Importing distutils is slow and it is
+# deprecated since Python 3.10
+_STRING_TO_BOOLEAN = {
+    **{value: True for value in ("y", "yes", "t", "true", "on", "1")},
+    **{value: False for value in ("n", "no", "f", "false", "off", "0")},
+}
+
 logger = logging.getLogger("airbyte")
 
+# A compiled schema node normalizes the values of an instance in place and logs the values that don't match their type. The path of the
+# instance is shared and mutated while traversing it.
+CompiledNode = Callable[[Any, List[Any]], None]
+
+
+class _UnsupportedSchema(Exception):
+    """
+    Raised when a schema uses constructs the compiler doesn't handle. These schemas are normalized by traversing them with jsonschema.
+    """
+
 
 class TransformConfig(Flag):
     """
@@ -42,6 +71,9 @@ class TypeTransformer:
 
     _custom_normalizer: Optional[Callable[[Any, Dict[str, Any]], Any]] = None
 
+    # Maximum number of compiled schemas kept by a transformer. Streams usually share one transformer and their schema doesn't change.
+    COMPILED_SCHEMA_CACHE_SIZE = 64
+
     def __init__(self, config: TransformConfig):
         """
         Initialize TypeTransformer instance.
@@ -57,6 +89,15 @@ class TypeTransformer:
             if key in ["type", "array", "$ref", "properties", "items"]
         }
         self._normalizer = validators.create(meta_schema=Draft7Validator.META_SCHEMA, validators=all_validators)
+        self._compiled_schemas: Dict[str, Optional[CompiledNode]] = {}
+        self._last_compiled_schema: Tuple[Optional[Mapping[str, Any]], Optional[CompiledNode]] = (None, None)
+
+    @property
+    def is_enabled(self) -> bool:
+        """
+        Whether records are transformed at all.
+        """
+        return TransformConfig.NoTransform not in self._config
 
     def registerCustomTransform(self, normalization_callback: Callable[[Any, Dict[str, Any]], Any]) -> Callable:
         """
@@ -70,6 +111,9 @@ class TypeTransformer:
         if TransformConfig.CustomSchemaNormalization not in self._config:
             raise Exception("Please set TransformConfig.CustomSchemaNormalization config before registering custom normalizer")
         self._custom_normalizer = normalization_callback
+        # Compiled schemas capture the normalizer so they have to be compiled again
+        self._compiled_schemas.clear()
+        self._last_compiled_schema = (None, None)
         return normalization_callback
 
     def __normalize(self, original_item: Any, subschema: Dict[str, Any]) -> Any:
@@ -116,13 +160,13 @@ class TypeTransformer:
                 return int(original_item)
             elif target_type == "boolean":
                 if isinstance(original_item, str):
-                    return strtobool(original_item) == 1
+                    return _STRING_TO_BOOLEAN[original_item.lower()]
                 return bool(original_item)
             elif target_type == "array":
                 item_types = set(subschema.get("items", {}).get("type", set()))
                 if item_types.issubset(json_to_python_simple) and type(original_item) in json_to_python_simple.values():
                     return [original_item]
-        except (ValueError, TypeError):
+        except (ValueError, TypeError, KeyError):
             return original_item
         return original_item
 
@@ -180,6 +224,13 @@ class TypeTransformer:
         """
         if TransformConfig.NoTransform in self._config:
             return
+        compiled_schema = self._get_compiled_schema(schema)
+        if compiled_schema is None:
+            self._transform_with_jsonschema(record, schema)
+            return
+        compiled_schema(record, [])
+
+    def _transform_with_jsonschema(self, record: Dict[str, Any], schema: Mapping[str, Any]) -> None:
         normalizer = self._normalizer(schema)
         for e in normalizer.iter_errors(record):
             """
@@ -188,9 +239,214 @@ class TypeTransformer:
             """
             logger.warning(self.get_error_message(e))
 
+    def _get_compiled_schema(self, schema: Mapping[str, Any]) -> Optional[CompiledNode]:
+        """
+        Return the schema compiled into normalization closures or None if the schema can only be normalized through jsonschema.
+
+        Compiled schemas are cached by content as some streams build a new schema object for every record. The last schema is also kept
+        so that streams passing the same schema object don't have to serialize it. Schemas are expected not to be mutated once they are
+        used to transform records.
+        """
+        last_schema, last_compiled_schema = self._last_compiled_schema
+        if last_schema is schema:
+            return last_compiled_schema
+
+        try:
+            key = json.dumps(schema)
+        except (TypeError, ValueError):
+            return None
+        if key in self._compiled_schemas:
+            compiled_schema = self._compiled_schemas[key]
+        else:
+            try:
+                compiled_schema = self._compile_schema(schema, RefResolver.from_schema(schema), {})
+            except (_UnsupportedSchema, RefResolutionError):
+                # Unresolvable references are only reported by jsonschema when a record has a value for them
+                compiled_schema = None
+            if len(self._compiled_schemas) >= self.COMPILED_SCHEMA_CACHE_SIZE:
+                self._compiled_schemas.clear()
+            self._compiled_schemas[key] = compiled_schema
+        self._last_compiled_schema = (schema, compiled_schema)
+        return compiled_schema
+
+    def _compile_schema(self, schema: Any, resolver: RefResolver, compiled: Dict[Tuple[int, str], CompiledNode]) -> CompiledNode:
+        """
+        Compile a schema into a closure that behaves like the jsonschema traversal done by `_transform_with_jsonschema`: values are
+        normalized by the "properties" and "items" keywords before the "type" keyword of their own schema is checked, and "$ref" are
+        resolved once here instead of for every record.
+
+        :param compiled: nodes already compiled, keyed by schema identity and resolution scope, so that recursive schemas terminate.
+        """
+        if not isinstance(schema, dict) or "$id" in schema:
+            raise _UnsupportedSchema()
+
+        key = (id(schema), resolver.resolution_scope)
+        if key in compiled:
+            return compiled[key]
+
+        steps: List[CompiledNode] = []
+
+        def node(instance: Any, path: List[Any]) -> None:
+            for step in steps:
+                step(instance, path)
+
+        compiled[key] = node
+
+        if "$ref" in schema:
+            # Like jsonschema, keywords next to a $ref are ignored
+            scope, resolved = resolver.resolve(schema["$ref"])
+            resolver.push_scope(scope)
+            try:
+                steps.append(self._compile_schema(resolved, resolver, compiled))
+            finally:
+                resolver.pop_scope()
+            return node
+
+        for keyword, value in schema.items():
+            if keyword == "type":
+                steps.append(self._compile_type(value))
+            elif keyword == "properties":
+                steps.append(self._compile_properties(value, resolver, compiled))
+            elif keyword == "items":
+                steps.append(self._compile_items(value, resolver, compiled))
+        return node
+
+    def _compile_type(self, types: Any) -> CompiledNode:
+        type_names = [types] if isinstance(types, str) else types
+        if not isinstance(type_names, list) or any(type_name not in _JSON_TYPE_TO_PYTHON_TYPES for type_name in type_names):
+            raise _UnsupportedSchema()
+        python_types = tuple(python_type for type_name in type_names for python_type in _JSON_TYPE_TO_PYTHON_TYPES[type_name])
+        accepts_bool = "boolean" in type_names
+
+        def check_type(instance: Any, path: List[Any]) -> None:
+            # Booleans are ints in python but only match the boolean json type
+            if accepts_bool if isinstance(instance, bool) else isinstance(instance, python_types):
+                return
+            # The message is built right away as the instance can still be modified by the normalization of the values it contains
+            error = ValidationError(_types_msg(instance, types), validator="type", validator_value=types, instance=instance, path=path)
+            logger.warning(self.get_error_message(error))
+
+        return check_type
+
+    def _compile_properties(
+        self, properties: Any, resolver: RefResolver, compiled: Dict[Tuple[int, str], CompiledNode]
+    ) -> CompiledNode:
+        if not isinstance(properties, dict):
+            raise _UnsupportedSchema()
+        compiled_properties = [
+            (name, self._compile_normalizer(self._resolve(subschema, resolver)), self._compile_schema(subschema, resolver, compiled))
+            for name, subschema in properties.items()
+        ]
+
+        def normalize_properties(instance: Any, path: List[Any]) -> None:
+            if not isinstance(instance, dict):
+                return
+            for name, normalize, _ in compiled_properties:
+                if name in instance:
+                    instance[name] = normalize(instance[name])
+            for name, _, property_node in compiled_properties:
+                if name in instance:
+                    path.append(name)
+                    property_node(instance[name], path)
+                    path.pop()
+
+        return normalize_properties
+
+    def _compile_items(self, items: Any, resolver: RefResolver, compiled: Dict[Tuple[int, str], CompiledNode]) -> CompiledNode:
+        normalize = self._compile_normalizer(self._resolve(items, resolver))
+        item_node = self._compile_schema(items, resolver, compiled)
+
+        def normalize_items(instance: Any, path: List[Any]) -> None:
+            if not isinstance(instance, list):
+                return
+            for index, item in enumerate(instance):
+                instance[index] = normalize(item)
+            for index, item in enumerate(instance):
+                path.append(index)
+                item_node(item, path)
+                path.pop()
+
+        return normalize_items
+
+    @staticmethod
+    def _resolve(subschema: Any, resolver: RefResolver) -> Any:
+        if not isinstance(subschema, dict):
+            raise _UnsupportedSchema()
+        if "$ref" in subschema:
+            _, resolved = resolver.resolve(subschema["$ref"])
+            return resolved
+        return subschema
+
+    def _compile_normalizer(self, subschema: Dict[str, Any]) -> Callable[[Any], Any]:
+        """
+        Compile the equivalent of `__normalize` for a given subschema.
+        """
+        default_convert: Optional[Callable[[Any], Any]] = None
+        if TransformConfig.DefaultSchemaNormalization in self._config:
+            if type(self).default_convert is TypeTransformer.default_convert:
+                default_convert = self._compile_default_convert(subschema)
+            else:
+                # default_convert is overridden so it can't be specialized
+                default_convert = lambda original_item: self.default_convert(original_item, subschema)  # noqa: E731
+        custom_normalizer = self._custom_normalizer
+
+        if default_convert and custom_normalizer:
+            return lambda original_item: custom_normalizer(default_convert(original_item), subschema)  # type: ignore
+        elif default_convert:
+            return default_convert
+        elif custom_normalizer:
+            return lambda original_item: custom_normalizer(original_item, subschema)  # type: ignore
+        return lambda original_item: original_item
+
+    @staticmethod
+    def _compile_default_convert(subschema: Dict[str, Any]) -> Callable[[Any], Any]:
+        """
+        Compile `default_convert` for a given subschema so the target type is only derived from the subschema once.
+        """
+        target_type = subschema.get("type", [])
+        nullable = "null" in target_type
+        if isinstance(target_type, list):
+            target_types = [t for t in target_type if t != "null"]
+            target_type = target_types[0] if len(target_types) == 1 else None
+
+        convert: Optional[Callable[[Any], Any]] = None
+        if target_type == "string":
+            convert = str
+        elif target_type == "number":
+            convert = float
+        elif target_type == "integer":
+            convert = int
+        elif target_type == "boolean":
+            convert = lambda original_item: _STRING_TO_BOOLEAN[original_item.lower()] if isinstance(original_item, str) else bool(original_item)  # noqa: E731
+        elif target_type == "array":
+            item_types = set(subschema.get("items", {}).get("type", set()))
+            if item_types.issubset(json_to_python_simple):
+                simple_python_types = set(json_to_python_simple.values())
+                convert = lambda original_item: [original_item] if type(original_item) in simple_python_types else original_item  # noqa: E731
+
+        def convert_value(original_item: Any) -> Any:
+            if original_item is None and nullable:
+                return None
+            if convert is None:
+                return original_item
+            try:
+                return convert(original_item)
+            except (ValueError, TypeError, KeyError):
+                return original_item
+
+        return convert_value
+
     def get_error_message(self, e: ValidationError) -> str:
         instance_json_type = python_to_json[type(e.instance)]
         key_path = "." + ".".join(map(str, e.path))
         return (
             f"Failed to transform value {repr(e.instance)} of type '{instance_json_type}' to '{e.validator_value}', key path: '{key_path}'"
         )
+
+
+def _types_msg(instance: Any, types: Any) -> str:
+    """
+    Same message as the one of the errors raised by jsonschema's type validator.
+    """
+    type_names = [types] if isinstance(types, str) else types
+    return f"{instance!r} is not of type {', '.join(repr(type_name) for type_name in type_names)}"
@@ -2,8 +2,15 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+from typing import TYPE_CHECKING
+
 from .is_cloud_environment import is_cloud_environment
-from .schema_inferrer import SchemaInferrer
-from .traced_exception import AirbyteTracedException
+from .lazy_imports import lazy_module_getattr
+
+if TYPE_CHECKING:
+    from .schema_inferrer import SchemaInferrer
+    from .traced_exception import AirbyteTracedException
+
+__getattr__ = lazy_module_getattr(__name__, {"AirbyteTracedException": ".traced_exception", "SchemaInferrer": ".schema_inferrer"})
 
 __all__ = ["AirbyteTracedException", "SchemaInferrer", "is_cloud_environment"]
@@ -0,0 +1,31 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import importlib
+import sys
+from typing import Any, Callable, Mapping
+
+
+def lazy_module_getattr(module_name: str, lazy_imports: Mapping[str, str]) -> Callable[[str], Any]:
+    """
+    Creates the module __getattr__ (PEP 562) of a package that exposes the names of its submodules without importing them when the package
+    is imported. A name is imported from its submodule the first time it is accessed and then set on the package so that __getattr__ is
+    not called for it anymore.
+
+    Names must not be the names of the submodules they are imported from since importing a submodule sets it on the package.
+
+    :param module_name: __name__ of the package
+    :param lazy_imports: the relative name of the submodule each name is imported from, e.g. {"AirbyteEntrypoint": ".entrypoint"}
+    :return: the __getattr__ function of the package
+    """
+
+    def __getattr__(name: str) -> Any:
+        submodule_name = lazy_imports.get(name)
+        if submodule_name is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(submodule_name, module_name), name)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    return __getattr__
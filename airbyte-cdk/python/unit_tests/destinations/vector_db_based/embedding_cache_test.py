@@ -0,0 +1,130 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from unittest.mock import MagicMock
+
+import pytest
+from airbyte_cdk.destinations.vector_db_based.config import (
+    CohereEmbeddingConfigModel,
+    FromFieldEmbeddingConfigModel,
+    OpenAICompatibleEmbeddingConfigModel,
+    OpenAIEmbeddingConfigModel,
+    ProcessingConfigModel,
+)
+from airbyte_cdk.destinations.vector_db_based.embedding_cache import EmbeddingCache, create_embedding_cache
+from airbyte_cdk.destinations.vector_db_based.writer import Writer
+from airbyte_cdk.models.airbyte_protocol import AirbyteMessage, AirbyteRecordMessage, ConfiguredAirbyteCatalog, Type
+
+EMBEDDING_SIZE = 8 * 3
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "embeddings.sqlite")
+
+
+def test_get_many_returns_stored_embeddings(cache_path):
+    cache = EmbeddingCache(cache_path, "fingerprint")
+    cache.put_many([("first text", [0.1, 0.2, 0.3]), ("second text", [0.4, 0.5, 0.6])])
+
+    assert cache.get_many(["second text", "unknown text", "first text"]) == [[0.4, 0.5, 0.6], None, [0.1, 0.2, 0.3]]
+
+
+def test_embeddings_are_persisted(cache_path):
+    cache = EmbeddingCache(cache_path, "fingerprint")
+    cache.put_many([("text", [0.1, 0.2, 0.3])])
+    cache.close()
+
+    assert EmbeddingCache(cache_path, "fingerprint").get_many(["text"]) == [[0.1, 0.2, 0.3]]
+
+
+def test_embeddings_of_other_fingerprints_are_not_returned(cache_path):
+    EmbeddingCache(cache_path, "fingerprint").put_many([("text", [0.1, 0.2, 0.3])])
+
+    assert EmbeddingCache(cache_path, "other fingerprint").get_many(["text"]) == [None]
+
+
+def test_least_recently_used_embeddings_are_evicted(cache_path):
+    cache = EmbeddingCache(cache_path, "fingerprint", max_size_bytes=3 * EMBEDDING_SIZE)
+    cache.put_many([("first text", [1.0, 1.0, 1.0])])
+    cache.put_many([("second text", [2.0, 2.0, 2.0])])
+    cache.put_many([("third text", [3.0, 3.0, 3.0])])
+    cache.get_many(["first text"])
+
+    cache.put_many([("fourth text", [4.0, 4.0, 4.0])])
+
+    assert cache.get_many(["first text", "second text", "third text", "fourth text"]) == [
+        [1.0, 1.0, 1.0],
+        None,
+        None,
+        [4.0, 4.0, 4.0],
+    ]
+
+
+def test_replaced_embeddings_do_not_count_twice(cache_path):
+    cache = EmbeddingCache(cache_path, "fingerprint", max_size_bytes=2 * EMBEDDING_SIZE)
+    cache.put_many([("first text", [1.0, 1.0, 1.0]), ("second text", [2.0, 2.0, 2.0])])
+
+    cache.put_many([("second text", [3.0, 3.0, 3.0])])
+
+    assert cache.get_many(["first text", "second text"]) == [[1.0, 1.0, 1.0], [3.0, 3.0, 3.0]]
+
+
+def test_fingerprint_ignores_secrets():
+    fingerprint = EmbeddingCache.create_fingerprint(OpenAIEmbeddingConfigModel(openai_key="a key"))
+
+    assert fingerprint == EmbeddingCache.create_fingerprint(OpenAIEmbeddingConfigModel(openai_key="another key"))
+    assert fingerprint != EmbeddingCache.create_fingerprint(CohereEmbeddingConfigModel(cohere_key="a key"))
+
+
+def test_fingerprint_depends_on_the_model():
+    config = {"base_url": "https://example.com", "dimensions": 3}
+
+    assert EmbeddingCache.create_fingerprint(
+        OpenAICompatibleEmbeddingConfigModel(model_name="a model", **config)
+    ) != EmbeddingCache.create_fingerprint(OpenAICompatibleEmbeddingConfigModel(model_name="another model", **config))
+
+
+def test_embeddings_from_field_are_not_cached(cache_path):
+    assert create_embedding_cache(cache_path, FromFieldEmbeddingConfigModel(field_name="embedding", dimensions=3)) is None
+
+
+def test_writer_only_embeds_texts_that_are_not_cached(cache_path):
+    config_model = ProcessingConfigModel(chunk_overlap=0, chunk_size=1000, metadata_fields=None, text_fields=["column_name"])
+    configured_catalog = ConfiguredAirbyteCatalog.parse_obj(
+        {
+            "streams": [
+                {
+                    "stream": {"name": "example_stream", "json_schema": {"type": "object"}, "supported_sync_modes": ["full_refresh"]},
+                    "sync_mode": "full_refresh",
+                    "destination_sync_mode": "append",
+                }
+            ]
+        }
+    )
+
+    def create_messages(values):
+        return [
+            AirbyteMessage(
+                type=Type.RECORD,
+                record=AirbyteRecordMessage(stream="example_stream", emitted_at=1234, data={"column_name": value}),
+            )
+            for value in values
+        ]
+
+    mock_embedder = MagicMock()
+    mock_embedder.embed_chunks.side_effect = lambda chunks: [[float(len(chunk.page_content))] for chunk in chunks]
+    cache = create_embedding_cache(cache_path, OpenAIEmbeddingConfigModel(openai_key="a key"))
+
+    writer = Writer(config_model, MagicMock(), mock_embedder, 10, embedding_cache=cache)
+    list(writer.write(configured_catalog, create_messages(["a", "bb"])))
+    mock_embedder.embed_chunks.reset_mock()
+    mock_indexer = MagicMock()
+    writer = Writer(config_model, mock_indexer, mock_embedder, 10, embedding_cache=cache)
+    list(writer.write(configured_catalog, create_messages(["bb", "ccc"])))
+
+    embedded_texts = [chunk.page_content for call in mock_embedder.embed_chunks.call_args_list for chunk in call.args[0]]
+    assert embedded_texts == ["column_name: ccc"]
+    indexed_chunks = mock_indexer.index.call_args.args[0]
+    assert [chunk.embedding for chunk in indexed_chunks] == [[float(len("column_name: bb"))], [float(len("column_name: ccc"))]]
@@ -3,7 +3,9 @@
 #
 
 from typing import Optional
-from unittest.mock import ANY, MagicMock, call
+from unittest.mock import ANY, MagicMock, call, patch
+
+import pytest
 
 from airbyte_cdk.destinations.vector_db_based import ProcessingConfigModel, Writer
 from airbyte_cdk.models.airbyte_protocol import (
@@ -29,6 +31,18 @@ def _generate_record_message(index: int, stream: str = "example_stream", namespa
 BATCH_SIZE = 32
 
 
+@pytest.fixture(autouse=True)
+def mock_tokenizer():
+    """
+    The document processor counts tokens with a tiktoken encoding that is downloaded the first time it is used. The encoding is stubbed so
+    that the tests don't need network access.
+    """
+    encoding = MagicMock()
+    encoding.encode.side_effect = lambda text, **kwargs: text.split()
+    with patch("tiktoken.get_encoding", return_value=encoding):
+        yield
+
+
 def generate_stream(name: str = "example_stream", namespace: Optional[str] = None):
     return {
         "stream": {
@@ -160,3 +174,45 @@ def test_write_stream_namespace_split():
         ]
     )
     assert mock_embedder.embed_chunks.call_count == 4
+
+
+def test_write_with_concurrent_embeddings_indexes_batches_in_order():
+    """
+    Test that batches embedded concurrently are still indexed in the order of the records and before the following state message is emitted
+    """
+    config_model = ProcessingConfigModel(chunk_overlap=0, chunk_size=1000, metadata_fields=None, text_fields=["column_name"])
+    configured_catalog: ConfiguredAirbyteCatalog = ConfiguredAirbyteCatalog.parse_obj({"streams": [generate_stream()]})
+
+    input_messages = [_generate_record_message(i) for i in range(BATCH_SIZE * 5)]
+    state_message = AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage())
+    input_messages.append(state_message)
+
+    mock_embedder = MagicMock()
+    mock_embedder.embed_chunks.side_effect = lambda chunks: [[float(chunk.record.data["id"])] for chunk in chunks]
+    indexed_ids = []
+    mock_indexer = MagicMock()
+    mock_indexer.index.side_effect = lambda chunks, namespace, stream: indexed_ids.extend(chunk.embedding[0] for chunk in chunks)
+    mock_indexer.post_sync.return_value = []
+
+    writer = Writer(config_model, mock_indexer, mock_embedder, BATCH_SIZE, max_concurrent_embeddings=3)
+    output_messages = writer.write(configured_catalog, input_messages)
+
+    assert next(output_messages) == state_message
+    assert indexed_ids == [float(i) for i in range(BATCH_SIZE * 5)]
+    assert mock_embedder.embed_chunks.call_count == 5
+
+
+def test_write_raises_embedding_errors():
+    config_model = ProcessingConfigModel(chunk_overlap=0, chunk_size=1000, metadata_fields=None, text_fields=["column_name"])
+    configured_catalog: ConfiguredAirbyteCatalog = ConfiguredAirbyteCatalog.parse_obj({"streams": [generate_stream()]})
+    input_messages = [_generate_record_message(i) for i in range(BATCH_SIZE * 2)]
+
+    mock_embedder = MagicMock()
+    mock_embedder.embed_chunks.side_effect = ValueError("Embedding failed")
+    mock_indexer = MagicMock()
+
+    writer = Writer(config_model, mock_indexer, mock_embedder, BATCH_SIZE)
+
+    with pytest.raises(ValueError):
+        list(writer.write(configured_catalog, input_messages))
+    mock_indexer.index.assert_not_called()
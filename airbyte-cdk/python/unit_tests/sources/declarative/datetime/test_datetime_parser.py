@@ -36,6 +36,27 @@ from airbyte_cdk.sources.declarative.datetime.datetime_parser import DatetimePar
             datetime.datetime(2021, 1, 1, 0, 0, 0, 1000, tzinfo=datetime.timezone.utc),
         ),
         ("test_parse_date_ms", "20210101", "%Y%m%d", datetime.datetime(2021, 1, 1, 0, 0, tzinfo=datetime.timezone.utc)),
+        (
+            "test_parse_date_iso_with_timezone_separator",
+            "2021-01-01T00:00:00.1-04:30",
+            "%Y-%m-%dT%H:%M:%S.%f%z",
+            datetime.datetime(2021, 1, 1, 0, 0, 0, 100000, tzinfo=datetime.timezone(-datetime.timedelta(hours=4, minutes=30))),
+        ),
+        (
+            "test_parse_date_rfc3339_utc",
+            "2021-01-01T10:20:30Z",
+            "%Y-%m-%dT%H:%M:%S%z",
+            datetime.datetime(2021, 1, 1, 10, 20, 30, tzinfo=datetime.timezone.utc),
+        ),
+        ("test_parse_date_not_zero_padded", "2021-1-1", "%Y-%m-%d", datetime.datetime(2021, 1, 1, 0, 0, tzinfo=datetime.timezone.utc)),
+        (
+            "test_parse_date_lower_case_literal",
+            "2021-01-01t10:20:30",
+            "%Y-%m-%dT%H:%M:%S",
+            datetime.datetime(2021, 1, 1, 10, 20, 30, tzinfo=datetime.timezone.utc),
+        ),
+        ("test_parse_date_whitespace", "2021-01-01  10", "%Y-%m-%d %H", datetime.datetime(2021, 1, 1, 10, tzinfo=datetime.timezone.utc)),
+        ("test_parse_date_with_other_directives", "Jan 01 2021", "%b %d %Y", datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc)),
     ],
 )
 def test_parse_date(test_name, input_date, date_format, expected_output_date):
@@ -44,6 +65,50 @@ def test_parse_date(test_name, input_date, date_format, expected_output_date):
     assert expected_output_date == output_date
 
 
+@pytest.mark.parametrize(
+    "input_date, date_format",
+    [
+        ("2021-02-30", "%Y-%m-%d"),
+        ("2021-01-01T00:00:60Z", "%Y-%m-%dT%H:%M:%SZ"),
+        ("2021-01-01T00:00:00", "%Y-%m-%dT%H:%M:%SZ"),
+        ("2021-01-01T00:00:00z", "%Y-%m-%dT%H:%M:%S%z"),
+    ],
+)
+def test_given_invalid_date_when_parse_then_raise_error(input_date, date_format):
+    with pytest.raises(ValueError):
+        DatetimeParser().parse(input_date, date_format)
+
+
+@pytest.mark.parametrize(
+    "date_format, expected_is_lexically_orderable",
+    [
+        ("%Y-%m-%dT%H:%M:%SZ", True),
+        ("%Y%m%d", True),
+        ("%Y-%m", True),
+        ("%Y-%m-%dT%H:%M:%S.%fZ", False),
+        ("%Y-%m-%dT%H:%M:%S%z", False),
+        ("%d/%m/%Y", False),
+        ("%Y-%m-%d %H:%M:%S", False),
+        ("%s", False),
+    ],
+)
+def test_is_lexically_orderable(date_format, expected_is_lexically_orderable):
+    assert DatetimeParser().is_lexically_orderable(date_format) == expected_is_lexically_orderable
+
+
+@pytest.mark.parametrize(
+    "input_date, expected_matches_exactly",
+    [
+        ("2021-01-01", True),
+        ("2021-1-01", False),
+        ("2021-13-01", False),
+        ("2021-01-01T", False),
+    ],
+)
+def test_matches_exactly(input_date, expected_matches_exactly):
+    assert DatetimeParser().matches_exactly(input_date, "%Y-%m-%d") == expected_matches_exactly
+
+
 @pytest.mark.parametrize(
     "test_name, input_dt, datetimeformat, expected_output",
     [
@@ -0,0 +1,51 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import json
+
+import pytest
+from airbyte_cdk.sources.declarative.decoders.incremental_json_parser import IncrementalJsonParser
+
+_DOCUMENT = json.dumps(
+    {
+        "data": [{"id": 1, "values": [1.5, -2e-3, 12345678901234567890]}, {"id": 2, "name": "a \"quoted\" \\u00e9 name"}, True, None],
+        "meta": {"next": "cursor", "count": 4},
+    },
+    indent=1,
+)
+
+
+def _chunks(text, chunk_size):
+    return [text[start : start + chunk_size] for start in range(0, len(text), chunk_size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1000])
+def test_records_are_parsed_whatever_the_chunk_boundaries(chunk_size):
+    parser = IncrementalJsonParser(_chunks(_DOCUMENT, chunk_size), ["data"])
+
+    assert list(parser) == json.loads(_DOCUMENT)["data"]
+    assert parser.body_without_records == {"data": [], "meta": {"next": "cursor", "count": 4}}
+
+
+@pytest.mark.parametrize(
+    "field_path, expected_records",
+    [
+        pytest.param(["meta"], [{"next": "cursor", "count": 4}], id="test_object_is_a_record"),
+        pytest.param(["meta", "count"], [4], id="test_truthy_scalar_is_a_record"),
+        pytest.param(["data", "3"], [], id="test_falsy_value_is_not_a_record"),
+        pytest.param(["data", "0", "values"], [1.5, -2e-3, 12345678901234567890], id="test_array_index"),
+        pytest.param(["data", "*", "id"], [1, 2], id="test_wildcard"),
+        pytest.param(["*"], [json.loads(_DOCUMENT)["data"], {"next": "cursor", "count": 4}], id="test_wildcard_values_are_not_flattened"),
+        pytest.param(["missing"], [], id="test_missing_field"),
+        pytest.param(["meta", "next", "field"], [], id="test_path_through_scalar"),
+    ],
+)
+def test_field_path(field_path, expected_records):
+    assert list(IncrementalJsonParser(_chunks(_DOCUMENT, 5), field_path)) == expected_records
+
+
+@pytest.mark.parametrize("document", ["", "{", '{"data": [1, 2}', '{"data": []} {}', "{'data': []}", "[1.]"])
+def test_given_invalid_json_when_parsing_then_raise_error(document):
+    with pytest.raises(json.JSONDecodeError):
+        list(IncrementalJsonParser(_chunks(document, 3), ["data"]))
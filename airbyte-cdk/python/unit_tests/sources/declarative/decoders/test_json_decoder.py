@@ -2,9 +2,15 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+from unittest.mock import patch
+
 import pytest
 import requests
 from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+from airbyte_cdk.sources.declarative.extractors.dpath_extractor import DpathExtractor
+from airbyte_cdk.sources.declarative.requesters.error_handlers.http_response_filter import HttpResponseFilter
+from airbyte_cdk.sources.declarative.requesters.error_handlers.response_action import ResponseAction
+from airbyte_cdk.sources.declarative.requesters.paginators.strategies.cursor_pagination_strategy import CursorPaginationStrategy
 
 
 @pytest.mark.parametrize(
@@ -14,3 +20,72 @@ def test_json_decoder(requests_mock, response_body, expected_json):
     requests_mock.register_uri("GET", "https://airbyte.io/", text=response_body)
     response = requests.get("https://airbyte.io/")
     assert JsonDecoder(parameters={}).decode(response) == expected_json
+
+
+def test_given_response_decoded_by_many_components_when_decode_then_content_is_decoded_once(
+    requests_mock,
+):
+    requests_mock.register_uri("GET", "https://airbyte.io/", text='{"data": [{"id": 1}, {"id": 2}], "next": "cursor"}')
+    response = requests.get("https://airbyte.io/")
+    response_filter = HttpResponseFilter(
+        action=ResponseAction.IGNORE, config={}, parameters={}, predicate="{{ 'error' in response }}", error_message=""
+    )
+    extractor = DpathExtractor(field_path=["data"], config={}, parameters={})
+    paginator = CursorPaginationStrategy(cursor_value="{{ response.next }}", config={}, parameters={})
+
+    with patch.object(requests.Response, "json", autospec=True, side_effect=requests.Response.json) as json_method:
+        assert response_filter.matches(response) is None
+        records = extractor.extract_records(response)
+        assert paginator.next_page_token(response, records) == "cursor"
+
+    assert records == [{"id": 1}, {"id": 2}]
+    assert json_method.call_count == 1
+
+
+def test_given_extracted_records_are_modified_when_decode_then_decoded_body_is_not_modified(requests_mock):
+    requests_mock.register_uri("GET", "https://airbyte.io/", text='{"data": [{"id": 1}]}')
+    response = requests.get("https://airbyte.io/")
+    decoder = JsonDecoder(parameters={})
+    assert decoder.decode(response) == {"data": [{"id": 1}]}
+
+    records = DpathExtractor(field_path=["data"], config={}, parameters={}).extract_records(response)
+    records[0]["id"] = 2
+
+    assert decoder.decode(response) == {"data": [{"id": 1}]}
+
+
+def test_given_path_with_wildcard_and_extracted_records_are_modified_when_decode_then_decoded_body_is_not_modified(requests_mock):
+    requests_mock.register_uri("GET", "https://airbyte.io/", text='{"data": [{"record": {"id": 1}}]}')
+    response = requests.get("https://airbyte.io/")
+    decoder = JsonDecoder(parameters={})
+
+    records = DpathExtractor(field_path=["data", "*", "record"], config={}, parameters={}).extract_records(response)
+    records[0]["id"] = 2
+
+    assert decoder.decode(response) == {"data": [{"record": {"id": 1}}]}
+
+
+def test_given_many_pages_when_extract_and_paginate_then_each_page_is_decoded_once(requests_mock):
+    requests_mock.register_uri(
+        "GET",
+        "https://airbyte.io/",
+        [{"text": '{"data": [{"id": 1}], "next": "page2"}'}, {"text": '{"data": [{"id": 2}], "next": null}'}],
+    )
+    extractor = DpathExtractor(field_path=["data"], config={}, parameters={})
+    paginator = CursorPaginationStrategy(cursor_value="{{ response.next }}", config={}, parameters={})
+
+    with patch.object(requests.Response, "json", autospec=True, side_effect=requests.Response.json) as json_method:
+        for _ in range(2):
+            response = requests.get("https://airbyte.io/")
+            records = extractor.extract_records(response)
+            paginator.next_page_token(response, records)
+
+    assert json_method.call_count == 2
+
+
+def test_given_different_responses_when_decode_then_each_response_is_decoded(requests_mock):
+    requests_mock.register_uri("GET", "https://airbyte.io/", [{"text": '{"page": 1}'}, {"text": '{"page": 2}'}])
+    decoder = JsonDecoder(parameters={})
+
+    assert decoder.decode(requests.get("https://airbyte.io/")) == {"page": 1}
+    assert decoder.decode(requests.get("https://airbyte.io/")) == {"page": 2}
@@ -53,3 +53,48 @@ def create_response(body):
     response = requests.Response()
     response._content = json.dumps(body).encode("utf-8")
     return response
+
+
+@pytest.mark.parametrize(
+    "test_name, field_path, body, expected_records, expected_body_without_records",
+    [
+        (
+            "test_extract_from_array",
+            ["data"],
+            {"data": [{"id": 1}, {"id": 2}], "next": "cursor"},
+            [{"id": 1}, {"id": 2}],
+            {"data": [], "next": "cursor"},
+        ),
+        ("test_extract_single_record", ["data"], {"data": {"id": 1}}, [{"id": 1}], {"data": {"id": 1}}),
+        ("test_extract_from_root_array", [], [{"id": 1}, {"id": 2}], [{"id": 1}, {"id": 2}], []),
+        ("test_field_in_config", ["{{ config['field'] }}"], {"record_array": [{"id": 1}]}, [{"id": 1}], {"record_array": []}),
+        ("test_field_does_not_exist", ["record"], {"id": 1}, [], {"id": 1}),
+        (
+            "test_complex_nested_list",
+            ["data", "*", "list", "data2", "*"],
+            {"data": [{"list": {"data2": [{"id": 1}, {"id": 2}]}}, {"list": {"data2": [{"id": 3}]}}], "total": 3},
+            [{"id": 1}, {"id": 2}, {"id": 3}],
+            {"data": [], "total": 3},
+        ),
+    ],
+)
+def test_dpath_extractor_streaming_records(requests_mock, test_name, field_path, body, expected_records, expected_body_without_records):
+    requests_mock.get("https://airbyte.io/", text=json.dumps(body))
+    response = requests.get("https://airbyte.io/", stream=True)
+    extractor = DpathExtractor(field_path=field_path, config=config, decoder=decoder, parameters=parameters, stream_records=True)
+
+    actual_records = list(extractor.extract_records(response))
+
+    assert actual_records == expected_records
+    assert decoder.decode(response) == expected_body_without_records
+
+
+@pytest.mark.parametrize("content", ["", "not json", '{"data": [{"id": 1}'])
+def test_given_invalid_json_when_streaming_records_then_decoded_body_is_empty(requests_mock, content):
+    requests_mock.get("https://airbyte.io/", text=content)
+    response = requests.get("https://airbyte.io/", stream=True)
+    extractor = DpathExtractor(field_path=["data"], config=config, decoder=decoder, parameters=parameters, stream_records=True)
+
+    list(extractor.extract_records(response))
+
+    assert decoder.decode(response) == {}
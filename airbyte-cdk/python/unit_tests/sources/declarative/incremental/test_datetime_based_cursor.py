@@ -772,5 +772,44 @@ def test_given_no_cursor_value_for_first_than_second_then_return_false():
     assert not cursor.is_greater_than_or_equal(Record({}, {}), Record({"cursor_field": "2021-01-01"}, {}))
 
 
+
+def test_given_cursor_values_not_zero_padded_when_is_greater_than_or_equal_then_compare_datetimes():
+    cursor = DatetimeBasedCursor(
+        start_datetime=MinMaxDatetime("3000-01-01", parameters={}),
+        cursor_field="cursor_field",
+        datetime_format="%Y-%m-%d",
+        config=config,
+        parameters={},
+    )
+    assert not cursor.is_greater_than_or_equal(Record({"cursor_field": "2023-1-5"}, {}), Record({"cursor_field": "2023-01-10"}, {}))
+
+
+def test_given_cursor_values_with_different_timezones_when_is_greater_than_or_equal_then_compare_datetimes():
+    cursor = DatetimeBasedCursor(
+        start_datetime=MinMaxDatetime("3000-01-01T00:00:00+0000", parameters={}),
+        cursor_field="cursor_field",
+        datetime_format="%Y-%m-%dT%H:%M:%S%z",
+        config=config,
+        parameters={},
+    )
+    assert cursor.is_greater_than_or_equal(
+        Record({"cursor_field": "2023-01-01T08:00:00+0000"}, {}), Record({"cursor_field": "2023-01-01T10:00:00+0400"}, {})
+    )
+
+
+def test_given_cursor_values_of_alternating_formats_when_parse_date_then_parse_with_matching_format():
+    cursor = DatetimeBasedCursor(
+        start_datetime=MinMaxDatetime("2021-01-01", parameters={}),
+        cursor_field="cursor_field",
+        datetime_format="%Y-%m-%d",
+        cursor_datetime_formats=["%Y-%m-%d", "%s"],
+        config=config,
+        parameters={},
+    )
+    assert cursor.parse_date("1609459200") == datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc)
+    assert cursor.parse_date("2021-01-02") == datetime.datetime(2021, 1, 2, tzinfo=datetime.timezone.utc)
+    assert cursor.parse_date("1609545600") == datetime.datetime(2021, 1, 2, tzinfo=datetime.timezone.utc)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -8,6 +8,7 @@ from unittest.mock import Mock
 import pytest
 from airbyte_cdk.sources.declarative.incremental.cursor import Cursor
 from airbyte_cdk.sources.declarative.incremental.per_partition_cursor import (
+    CursorFactory,
     PerPartitionCursor,
     PerPartitionKeySerializer,
     PerPartitionStreamSlice,
@@ -290,3 +291,136 @@ def test_when_is_greater_than_or_equal_then_return_underlying_cursor_response(mo
 
     assert result == underlying_cursor.is_greater_than_or_equal.return_value
     underlying_cursor.is_greater_than_or_equal.assert_called_once_with(first_record, second_record)
+
+
+class IntegerCursor:
+    """
+    Cursor whose state is the highest integer value of the cursor field of the records
+    """
+
+    def __init__(self):
+        self._state = {}
+
+    def set_initial_state(self, stream_state):
+        self._state = dict(stream_state)
+
+    def stream_slices(self):
+        return [{}]
+
+    def close_slice(self, stream_slice, most_recent_record):
+        if most_recent_record and most_recent_record[CURSOR_STATE_KEY] > self._state.get(CURSOR_STATE_KEY, -1):
+            self._state = {CURSOR_STATE_KEY: most_recent_record[CURSOR_STATE_KEY]}
+
+    def get_stream_state(self):
+        return dict(self._state)
+
+    def should_be_synced(self, record):
+        return record[CURSOR_STATE_KEY] >= self._state.get(CURSOR_STATE_KEY, -1)
+
+    def is_greater_than_or_equal(self, first, second):
+        return first[CURSOR_STATE_KEY] >= second[CURSOR_STATE_KEY]
+
+
+def _create_integer_cursor(partitions, max_partitions_in_state=None):
+    partition_router = Mock(spec=StreamSlicer)
+    partition_router.stream_slices.return_value = partitions
+    return PerPartitionCursor(CursorFactory(IntegerCursor), partition_router, max_partitions_in_state)
+
+
+def _close_slice(cursor, stream_slice, cursor_value):
+    cursor.close_slice(stream_slice, Record({CURSOR_STATE_KEY: cursor_value}, stream_slice))
+
+
+def test_given_slice_closed_when_get_stream_state_then_only_request_state_of_updated_partition(mocked_cursor_factory, mocked_partition_router):
+    first_cursor = MockedCursorBuilder().with_stream_slices([{}]).with_stream_state({CURSOR_STATE_KEY: 1}).build()
+    second_cursor = MockedCursorBuilder().with_stream_slices([{}]).with_stream_state({CURSOR_STATE_KEY: 2}).build()
+    mocked_cursor_factory.create.side_effect = [first_cursor, second_cursor]
+    mocked_partition_router.stream_slices.return_value = [{"partition key": "first partition"}, {"partition key": "second partition"}]
+    cursor = PerPartitionCursor(mocked_cursor_factory, mocked_partition_router)
+    slices = list(cursor.stream_slices())
+    cursor.get_stream_state()
+    first_cursor.get_stream_state.reset_mock()
+    second_cursor.get_stream_state.reset_mock()
+
+    cursor.close_slice(slices[1], None)
+    state = cursor.get_stream_state()
+
+    first_cursor.get_stream_state.assert_not_called()
+    second_cursor.get_stream_state.assert_called_once()
+    assert state == {
+        "states": [
+            {"partition": {"partition key": "first partition"}, "cursor": {CURSOR_STATE_KEY: 1}},
+            {"partition": {"partition key": "second partition"}, "cursor": {CURSOR_STATE_KEY: 2}},
+        ]
+    }
+
+
+def test_given_slices_when_close_slice_then_partition_is_not_serialized_again():
+    cursor = _create_integer_cursor([{"partition key": "first partition"}])
+    cursor._partition_serializer = Mock(wraps=PerPartitionKeySerializer())
+    stream_slice = list(cursor.stream_slices())[0]
+
+    _close_slice(cursor, stream_slice, 1)
+    cursor.should_be_synced(Record({CURSOR_STATE_KEY: 1}, stream_slice))
+
+    cursor._partition_serializer.to_partition_key.assert_called_once()
+
+
+def test_given_more_partitions_than_maximum_when_get_stream_state_then_collapse_state_into_oldest_state():
+    partitions = [{"partition key": index} for index in range(4)]
+    cursor = _create_integer_cursor(partitions, max_partitions_in_state=2)
+    for index, stream_slice in enumerate(cursor.stream_slices()):
+        _close_slice(cursor, stream_slice, 10 - index)
+
+    assert cursor.get_stream_state() == {"state": {CURSOR_STATE_KEY: 7}, "states": []}
+
+
+def test_given_partitions_without_state_when_get_stream_state_then_list_them_in_collapsed_state():
+    partitions = [{"partition key": index} for index in range(4)]
+    cursor = _create_integer_cursor(partitions, max_partitions_in_state=2)
+    for stream_slice in list(cursor.stream_slices())[:3]:
+        _close_slice(cursor, stream_slice, 10)
+
+    assert cursor.get_stream_state() == {"state": {CURSOR_STATE_KEY: 10}, "states": [{"partition": {"partition key": 3}, "cursor": {}}]}
+
+
+def test_given_partitions_are_not_all_known_when_get_stream_state_then_do_not_collapse_state():
+    partitions = [{"partition key": index} for index in range(4)]
+    cursor = _create_integer_cursor(partitions, max_partitions_in_state=2)
+    slices = cursor.stream_slices()
+    for _ in range(3):
+        _close_slice(cursor, next(slices), 10)
+
+    assert cursor.get_stream_state() == {
+        "states": [{"partition": {"partition key": index}, "cursor": {CURSOR_STATE_KEY: 10}} for index in range(3)]
+    }
+
+
+def test_given_more_partitions_without_state_than_maximum_when_get_stream_state_then_do_not_collapse_state():
+    partitions = [{"partition key": index} for index in range(4)]
+    cursor = _create_integer_cursor(partitions, max_partitions_in_state=2)
+    stream_slice = list(cursor.stream_slices())[0]
+    _close_slice(cursor, stream_slice, 10)
+
+    assert cursor.get_stream_state() == {"states": [{"partition": {"partition key": 0}, "cursor": {CURSOR_STATE_KEY: 10}}]}
+
+
+def test_given_collapsed_state_when_stream_slices_then_partitions_not_in_state_start_from_global_state():
+    cursor = _create_integer_cursor([{"partition key": 0}, {"partition key": 1}], max_partitions_in_state=2)
+    cursor.set_initial_state({"state": {CURSOR_STATE_KEY: 5}, "states": [{"partition": {"partition key": 1}, "cursor": {}}]})
+
+    slices = cursor.stream_slices()
+    _close_slice(cursor, next(slices), 3)
+
+    assert cursor.get_stream_state() == {
+        "state": {CURSOR_STATE_KEY: 5},
+        "states": [{"partition": {"partition key": 0}, "cursor": {CURSOR_STATE_KEY: 5}}],
+    }
+    _close_slice(cursor, next(slices), 3)
+    next(slices, None)
+    assert cursor.get_stream_state() == {
+        "states": [
+            {"partition": {"partition key": 1}, "cursor": {CURSOR_STATE_KEY: 3}},
+            {"partition": {"partition key": 0}, "cursor": {CURSOR_STATE_KEY: 5}},
+        ]
+    }
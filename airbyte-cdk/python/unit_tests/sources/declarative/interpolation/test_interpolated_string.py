@@ -14,6 +14,7 @@ kwargs = {"c": "airbyte"}
     "test_name, input_string, expected_value",
     [
         ("test_static_value", "HELLO WORLD", "HELLO WORLD"),
+        ("test_static_value_literal", "10", 10),
         ("test_eval_from_parameters", "{{ parameters['hello'] }}", "world"),
         ("test_eval_from_config", "{{ config['field'] }}", "value"),
         ("test_eval_from_kwargs", "{{ kwargs['c'] }}", "airbyte"),
@@ -23,3 +24,11 @@ kwargs = {"c": "airbyte"}
 def test_interpolated_string(test_name, input_string, expected_value):
     s = InterpolatedString.create(input_string, parameters=parameters)
     assert s.eval(config, **{"kwargs": kwargs}) == expected_value
+
+
+def test_static_string_does_not_use_template_engine(mocker):
+    s = InterpolatedString.create("HELLO WORLD", parameters=parameters)
+    eval_mock = mocker.patch.object(s._interpolation, "eval")
+
+    assert s.eval(config) == "HELLO WORLD"
+    eval_mock.assert_not_called()
@@ -5,6 +5,7 @@
 import datetime
 
 import pytest
+from airbyte_cdk.sources.declarative.interpolation import jinja
 from airbyte_cdk.sources.declarative.interpolation.jinja import JinjaInterpolation
 from freezegun import freeze_time
 from jinja2.exceptions import TemplateSyntaxError
@@ -238,3 +239,32 @@ def test_macros_examples(template_string, expected_value):
     # If you change the expected output, you must also change the expected output in declarative_component_schema.yaml
     now_utc = interpolation.eval(template_string, {})
     assert now_utc == expected_value
+
+
+def test_template_is_compiled_once_for_all_interpolations():
+    template_string = "{{ config['key'] }} compiled once"
+    compile_misses = jinja._compile.cache_info().misses
+    parse_misses = jinja._find_undeclared_variables.cache_info().misses
+
+    assert JinjaInterpolation().eval(template_string, {"key": "first"}) == "first compiled once"
+    assert JinjaInterpolation().eval(template_string, {"key": "second"}) == "second compiled once"
+    assert jinja._compile.cache_info().misses == compile_misses + 1
+    assert jinja._find_undeclared_variables.cache_info().misses == parse_misses + 1
+
+
+@pytest.mark.parametrize(
+    "s, expected_is_static",
+    [
+        pytest.param("hello world", True, id="test_raw_string_is_static"),
+        pytest.param("{ 'a': 1 }", True, id="test_single_brace_is_static"),
+        pytest.param("{{ config['key'] }}", False, id="test_expression_is_not_static"),
+        pytest.param("{% if True %}a{% endif %}", False, id="test_statement_is_not_static"),
+        pytest.param("a{# comment #}", False, id="test_comment_is_not_static"),
+        pytest.param("hello\n", False, id="test_trailing_newline_is_not_static"),
+        pytest.param("hello\r\nworld", False, id="test_carriage_return_is_not_static"),
+        pytest.param("", False, id="test_empty_string_is_not_static"),
+        pytest.param(None, False, id="test_none_is_not_static"),
+    ],
+)
+def test_is_static(s, expected_is_static):
+    assert JinjaInterpolation.is_static(s) == expected_is_static
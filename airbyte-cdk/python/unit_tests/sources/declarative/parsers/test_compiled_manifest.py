@@ -0,0 +1,52 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import datetime
+
+import pytest
+from airbyte_cdk.sources.declarative.parsers.compiled_manifest import CompiledManifest
+
+RESOLVED_MANIFEST = {"type": "DeclarativeSource", "version": "0.29.3", "streams": [{"type": "DeclarativeStream", "name": "lists"}]}
+
+
+def test_hash_manifest():
+    assert CompiledManifest.hash_manifest("version: 0.29.3") == CompiledManifest.hash_manifest(b"version: 0.29.3")
+    assert CompiledManifest.hash_manifest("version: 0.29.3") != CompiledManifest.hash_manifest("version: 0.29.4")
+    assert CompiledManifest.hash_manifest({"a": 1, "b": 2}) == CompiledManifest.hash_manifest({"b": 2, "a": 1})
+
+
+def test_save_and_load(tmp_path):
+    path = str(tmp_path / "manifest.json")
+    CompiledManifest.compile("hash", RESOLVED_MANIFEST).save(path)
+
+    compiled_manifest = CompiledManifest.load(path, "hash")
+
+    assert compiled_manifest == CompiledManifest("hash", CompiledManifest.get_cdk_version(), RESOLVED_MANIFEST)
+    assert CompiledManifest.load(path, "another hash") is None
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        pytest.param("not json", id="test_invalid_json"),
+        pytest.param("[]", id="test_not_a_compiled_manifest"),
+        pytest.param('{"format_version": 0, "manifest_hash": "hash"}', id="test_unsupported_format_version"),
+    ],
+)
+def test_load_invalid_compiled_manifest(tmp_path, content):
+    path = tmp_path / "manifest.json"
+    path.write_text(content)
+
+    assert CompiledManifest.load(str(path), "hash") is None
+
+
+def test_load_missing_compiled_manifest(tmp_path):
+    assert CompiledManifest.load(str(tmp_path / "missing.json"), "hash") is None
+
+
+def test_compile_manifest_that_is_not_json_serializable():
+    with pytest.raises(TypeError):
+        CompiledManifest.compile("hash", {**RESOLVED_MANIFEST, "start_date": datetime.date(2021, 1, 1)})
+    with pytest.raises(ValueError):
+        CompiledManifest.compile("hash", {**RESOLVED_MANIFEST, "http_codes": {404: "IGNORE"}})
@@ -465,6 +465,7 @@ def test_create_substream_partition_router():
         - stream: "#/stream_B"
           parent_key: someid
           partition_field: word_id
+          concurrent_slices: 4
     """
     parsed_manifest = YamlDeclarativeSource._parse(content)
     resolved_manifest = resolver.preprocess_manifest(parsed_manifest)
@@ -484,12 +485,72 @@ def test_create_substream_partition_router():
     assert partition_router.parent_stream_configs[0].partition_field.eval({}) == "repository_id"
     assert partition_router.parent_stream_configs[0].request_option.inject_into == RequestOptionType.request_parameter
     assert partition_router.parent_stream_configs[0].request_option.field_name == "repository_id"
+    assert partition_router.parent_stream_configs[0].concurrent_slices == 1
+    assert partition_router.parent_stream_configs[0].stream_factory is None
 
     assert partition_router.parent_stream_configs[1].parent_key.eval({}) == "someid"
     assert partition_router.parent_stream_configs[1].partition_field.eval({}) == "word_id"
     assert partition_router.parent_stream_configs[1].request_option is None
+    assert partition_router.parent_stream_configs[1].concurrent_slices == 4
+    assert isinstance(partition_router.parent_stream_configs[1].stream_factory(), DeclarativeStream)
 
 
+def test_given_substreams_with_the_same_parent_when_create_component_then_parent_records_are_shared():
+    content = """
+    parent_stream:
+      type: DeclarativeStream
+      name: "parent"
+      primary_key: "id"
+      schema_loader:
+        file_path: "./source_sendgrid/schemas/{{ parameters['name'] }}.yaml"
+        name: "{{ parameters['stream_name'] }}"
+      retriever:
+        requester:
+          type: "HttpRequester"
+          url_base: "https://airbyte.io"
+          path: "parents"
+        record_selector:
+          extractor:
+            field_path: []
+    substream:
+      type: DeclarativeStream
+      primary_key: "id"
+      schema_loader:
+        file_path: "./source_sendgrid/schemas/{{ parameters['name'] }}.yaml"
+        name: "{{ parameters['stream_name'] }}"
+      retriever:
+        requester:
+          type: "HttpRequester"
+          url_base: "https://airbyte.io"
+          path: "children"
+        record_selector:
+          extractor:
+            field_path: []
+        partition_router:
+          type: SubstreamPartitionRouter
+          parent_stream_configs:
+            - stream: "#/parent_stream"
+              parent_key: id
+              partition_field: parent_id
+    """
+    parsed_manifest = YamlDeclarativeSource._parse(content)
+    resolved_manifest = resolver.preprocess_manifest(parsed_manifest)
+    component_factory = ModelToComponentFactory()
+
+    partition_routers = []
+    for stream_name in ["first_substream", "second_substream"]:
+        stream_manifest = transformer.propagate_types_and_parameters("", {**resolved_manifest["substream"], "name": stream_name}, {})
+        stream = component_factory.create_component(
+            model_type=DeclarativeStreamModel, component_definition=stream_manifest, config=input_config
+        )
+        partition_routers.append(stream.retriever.stream_slicer)
+
+    parent_record_cache = component_factory.get_parent_record_cache()
+    cache_keys = [partition_router.parent_stream_configs[0].cache_key for partition_router in partition_routers]
+    assert all(partition_router._parent_record_cache is parent_record_cache for partition_router in partition_routers)
+    assert cache_keys[0] == cache_keys[1]
+    assert parent_record_cache._dependents[cache_keys[0]] == {"first_substream", "second_substream"}
+
 def test_datetime_based_cursor():
     content = """
     incremental:
@@ -1044,6 +1105,38 @@ def test_config_with_defaults():
     assert stream.retriever.paginator.pagination_strategy.get_page_size() == 10
 
 
+@pytest.mark.parametrize("stream_records", [True, False])
+def test_given_extractor_streams_records_when_create_stream_then_requester_streams_responses(stream_records):
+    content = f"""
+    lists_stream:
+      type: "DeclarativeStream"
+      name: "lists"
+      schema_loader:
+        type: InlineSchemaLoader
+        schema: {{}}
+      retriever:
+        type: SimpleRetriever
+        requester:
+          type: HttpRequester
+          url_base: "https://api.sendgrid.com"
+          path: "/v3/marketing/lists"
+        record_selector:
+          type: RecordSelector
+          extractor:
+            type: DpathExtractor
+            field_path: ["result"]
+            stream_records: {str(stream_records).lower()}
+    """
+    parsed_manifest = YamlDeclarativeSource._parse(content)
+    resolved_manifest = resolver.preprocess_manifest(parsed_manifest)
+    stream_manifest = transformer.propagate_types_and_parameters("", resolved_manifest["lists_stream"], {})
+
+    stream = factory.create_component(model_type=DeclarativeStreamModel, component_definition=stream_manifest, config=input_config)
+
+    assert stream.retriever.record_selector.extractor.stream_records is stream_records
+    assert stream.retriever.requester.stream_response is stream_records
+
+
 def test_create_default_paginator():
     content = """
       paginator:
@@ -1726,6 +1819,48 @@ def test_create_page_increment():
     assert strategy.inject_on_first_request == expected_strategy.inject_on_first_request
 
 
+def test_given_concurrent_pages_when_create_component_then_retriever_requests_pages_concurrently():
+    content = """
+    stream:
+      type: DeclarativeStream
+      name: "items"
+      primary_key: "id"
+      schema_loader:
+        file_path: "./source_sendgrid/schemas/{{ parameters['name'] }}.yaml"
+        name: "{{ parameters['stream_name'] }}"
+      retriever:
+        requester:
+          type: "HttpRequester"
+          url_base: "https://airbyte.io"
+          path: "items"
+        record_selector:
+          extractor:
+            field_path: ["data"]
+        paginator:
+          type: DefaultPaginator
+          concurrent_pages: 4
+          pagination_strategy:
+            type: OffsetIncrement
+            page_size: 100
+            total_records: "{{ response['meta']['total'] }}"
+          page_token_option:
+            type: RequestOption
+            inject_into: request_parameter
+            field_name: offset
+    """
+    parsed_manifest = YamlDeclarativeSource._parse(content)
+    resolved_manifest = resolver.preprocess_manifest(parsed_manifest)
+    stream_manifest = transformer.propagate_types_and_parameters("", resolved_manifest["stream"], {})
+
+    stream = factory.create_component(model_type=DeclarativeStreamModel, component_definition=stream_manifest, config=input_config)
+
+    assert isinstance(stream.retriever, SimpleRetriever)
+    assert stream.retriever.concurrent_pages == 4
+    pagination_strategy = stream.retriever.paginator.pagination_strategy
+    assert isinstance(pagination_strategy, OffsetIncrement)
+    assert pagination_strategy.total_records == "{{ response['meta']['total'] }}"
+
+
 def test_create_offset_increment():
     model = OffsetIncrementModel(
         type="OffsetIncrement",
@@ -0,0 +1,122 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import os
+from unittest.mock import Mock
+
+import pytest
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import ParentRecordCache
+
+_PARENT_KEY = "parent"
+_RECORDS = [{"id": index, "name": f"record {index}"} for index in range(10)]
+
+
+def _create_cache(max_records_in_memory: int = 100) -> ParentRecordCache:
+    cache = ParentRecordCache(max_records_in_memory=max_records_in_memory)
+    cache.register_dependent(_PARENT_KEY, "first_substream")
+    cache.register_dependent(_PARENT_KEY, "second_substream")
+    return cache
+
+
+@pytest.mark.parametrize("max_records_in_memory", [100, 3, 0])
+def test_given_slice_was_read_when_read_records_then_return_cached_records(max_records_in_memory):
+    cache = _create_cache(max_records_in_memory)
+    read_records = Mock(return_value=_RECORDS)
+
+    assert list(cache.read_records(_PARENT_KEY, {"slice": 1}, read_records)) == _RECORDS
+    assert list(cache.read_records(_PARENT_KEY, {"slice": 1}, read_records)) == _RECORDS
+    assert read_records.call_count == 1
+
+
+def test_given_records_do_not_fit_in_memory_when_read_records_then_records_are_spilled_to_disk():
+    cache = _create_cache(max_records_in_memory=3)
+
+    list(cache.read_records(_PARENT_KEY, {"slice": 1}, lambda: _RECORDS))
+
+    spill_directory = cache._get_spill_directory()
+    assert len(os.listdir(spill_directory)) == 1
+    cache.release(_PARENT_KEY, "first_substream")
+    cache.release(_PARENT_KEY, "second_substream")
+    assert not os.path.exists(spill_directory)
+
+
+def test_given_spilled_slice_was_partially_read_when_read_records_then_spill_directory_is_removed():
+    cache = _create_cache(max_records_in_memory=3)
+
+    records = iter(cache.read_records(_PARENT_KEY, {"slice": 1}, lambda: _RECORDS))
+    for _ in range(5):
+        next(records)
+    spill_directory = cache._get_spill_directory()
+    records.close()
+
+    assert not os.path.exists(spill_directory)
+
+
+def test_given_different_slices_when_read_records_then_each_slice_is_read():
+    cache = _create_cache()
+
+    assert list(cache.read_records(_PARENT_KEY, {"slice": 1}, lambda: _RECORDS[:5])) == _RECORDS[:5]
+    assert list(cache.read_records(_PARENT_KEY, {"slice": 2}, lambda: _RECORDS[5:])) == _RECORDS[5:]
+
+
+def test_given_slice_was_partially_read_when_read_records_then_read_slice_again():
+    cache = _create_cache()
+    read_records = Mock(return_value=_RECORDS)
+
+    records = iter(cache.read_records(_PARENT_KEY, {"slice": 1}, read_records))
+    next(records)
+    records.close()
+
+    assert list(cache.read_records(_PARENT_KEY, {"slice": 1}, read_records)) == _RECORDS
+    assert read_records.call_count == 2
+
+
+def test_given_slice_is_being_read_when_read_records_then_read_slice_without_waiting():
+    cache = _create_cache()
+    read_records = Mock(return_value=_RECORDS)
+
+    records_being_read = iter(cache.read_records(_PARENT_KEY, {"slice": 1}, read_records))
+    next(records_being_read)
+
+    assert list(cache.read_records(_PARENT_KEY, {"slice": 1}, read_records)) == _RECORDS
+    assert read_records.call_count == 2
+
+
+def test_given_single_dependent_when_read_records_then_records_are_not_cached():
+    cache = ParentRecordCache()
+    cache.register_dependent(_PARENT_KEY, "substream")
+    read_records = Mock(return_value=_RECORDS)
+
+    list(cache.read_records(_PARENT_KEY, {"slice": 1}, read_records))
+    list(cache.read_records(_PARENT_KEY, {"slice": 1}, read_records))
+
+    assert read_records.call_count == 2
+
+
+def test_given_all_dependents_released_when_read_records_then_records_were_evicted():
+    cache = _create_cache()
+    read_records = Mock(return_value=_RECORDS)
+    list(cache.read_records(_PARENT_KEY, {"slice": 1}, read_records))
+
+    cache.release(_PARENT_KEY, "first_substream")
+    list(cache.read_records(_PARENT_KEY, {"slice": 1}, read_records))
+    assert read_records.call_count == 1
+
+    cache.release(_PARENT_KEY, "second_substream")
+    list(cache.read_records(_PARENT_KEY, {"slice": 1}, read_records))
+    assert read_records.call_count == 2
+
+
+def test_given_dependent_is_not_selected_when_release_then_it_is_not_waited_for():
+    cache = ParentRecordCache()
+    cache.select_dependents(["first_substream", "second_substream"])
+    for dependent in ["first_substream", "second_substream", "unselected_substream"]:
+        cache.register_dependent(_PARENT_KEY, dependent)
+    read_records = Mock(return_value=_RECORDS)
+    list(cache.read_records(_PARENT_KEY, {"slice": 1}, read_records))
+
+    cache.release(_PARENT_KEY, "first_substream")
+    cache.release(_PARENT_KEY, "second_substream")
+
+    assert cache._slices[_PARENT_KEY] == {}
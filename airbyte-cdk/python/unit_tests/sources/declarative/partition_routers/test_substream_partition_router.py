@@ -3,9 +3,11 @@
 #
 
 from typing import Any, Iterable, List, Mapping, Optional, Union
+from unittest.mock import Mock
 
 import pytest as pytest
 from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, SyncMode, Type
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import ParentRecordCache
 from airbyte_cdk.sources.declarative.partition_routers.substream_partition_router import ParentStreamConfig, SubstreamPartitionRouter
 from airbyte_cdk.sources.declarative.requesters.request_option import RequestOption, RequestOptionType
 from airbyte_cdk.sources.declarative.types import Record
@@ -321,3 +323,134 @@ def test_given_record_is_record_object_when_stream_slices_then_use_record_data()
 
     slices = list(partition_router.stream_slices())
     assert slices == [{"partition_field": "record value", "parent_slice": parent_slice}]
+
+
+def test_given_parent_records_are_shared_when_stream_slices_then_parent_stream_is_read_once():
+    parent_stream = MockStream(parent_slices, all_parent_data, "first_stream")
+    parent_stream.read_records = Mock(wraps=parent_stream.read_records)
+    parent_record_cache = ParentRecordCache()
+    partition_routers = []
+    for stream_name in ["first_substream", "second_substream"]:
+        partition_router = SubstreamPartitionRouter(
+            parent_stream_configs=[
+                ParentStreamConfig(
+                    stream=parent_stream,
+                    parent_key="id",
+                    partition_field="first_stream_id",
+                    parameters={},
+                    config={},
+                    cache_key="first_stream",
+                )
+            ],
+            parameters={},
+            config={},
+        )
+        partition_router.share_parent_records(parent_record_cache, stream_name)
+        partition_routers.append(partition_router)
+
+    expected_slices = [
+        {"parent_slice": {"slice": "first"}, "first_stream_id": 0},
+        {"parent_slice": {"slice": "first"}, "first_stream_id": 1},
+        {"parent_slice": {"slice": "second"}, "first_stream_id": 2},
+    ]
+    assert [list(partition_router.stream_slices()) for partition_router in partition_routers] == [expected_slices, expected_slices]
+    assert parent_stream.read_records.call_count == len(parent_slices)
+
+
+def test_given_parent_stream_fails_when_stream_slices_then_parent_records_are_released():
+    class FailingStream(MockStream):
+        def read_records(self, sync_mode, cursor_field=None, stream_slice=None, stream_state=None):
+            if stream_slice["slice"] == "second":
+                raise ValueError("An error")
+            yield from super().read_records(sync_mode, cursor_field, stream_slice, stream_state)
+
+    parent_record_cache = ParentRecordCache()
+    parent_record_cache.release = Mock(wraps=parent_record_cache.release)
+    partition_router = SubstreamPartitionRouter(
+        parent_stream_configs=[
+            ParentStreamConfig(
+                stream=FailingStream(parent_slices, all_parent_data, "first_stream"),
+                parent_key="id",
+                partition_field="first_stream_id",
+                parameters={},
+                config={},
+                cache_key="first_stream",
+            )
+        ],
+        parameters={},
+        config={},
+    )
+    partition_router.share_parent_records(parent_record_cache, "first_substream")
+
+    with pytest.raises(ValueError):
+        list(partition_router.stream_slices())
+
+    parent_record_cache.release.assert_called_once_with("first_stream", "first_substream")
+
+
+@pytest.mark.parametrize("concurrent_slices", [2, 5])
+def test_given_concurrent_slices_when_stream_slices_then_slices_are_returned_in_order(concurrent_slices):
+    parent_streams = []
+
+    def create_parent_stream() -> Stream:
+        parent_stream = MockStream(parent_slices, all_parent_data, "first_stream")
+        parent_stream.read_records = Mock(wraps=parent_stream.read_records)
+        parent_streams.append(parent_stream)
+        return parent_stream
+
+    slicing_parent_stream = create_parent_stream()
+    partition_router = SubstreamPartitionRouter(
+        parent_stream_configs=[
+            ParentStreamConfig(
+                stream=slicing_parent_stream,
+                parent_key="id",
+                partition_field="first_stream_id",
+                parameters={},
+                config={},
+                concurrent_slices=concurrent_slices,
+                stream_factory=create_parent_stream,
+            )
+        ],
+        parameters={},
+        config={},
+    )
+
+    assert list(partition_router.stream_slices()) == [
+        {"parent_slice": {"slice": "first"}, "first_stream_id": 0},
+        {"parent_slice": {"slice": "first"}, "first_stream_id": 1},
+        {"parent_slice": {"slice": "second"}, "first_stream_id": 2},
+    ]
+    # The stream generating the slices on the main thread is never shared with the threads reading them
+    assert len(parent_streams) == concurrent_slices + 1
+    assert slicing_parent_stream.read_records.call_count == 0
+    assert sum(parent_stream.read_records.call_count for parent_stream in parent_streams) == len(parent_slices)
+
+
+def test_given_concurrent_slices_and_parent_stream_fails_when_stream_slices_then_raise_error():
+    class FailingStream(MockStream):
+        def read_records(self, sync_mode, cursor_field=None, stream_slice=None, stream_state=None):
+            if stream_slice["slice"] == "second":
+                raise ValueError("An error")
+            yield from super().read_records(sync_mode, cursor_field, stream_slice, stream_state)
+
+    partition_router = SubstreamPartitionRouter(
+        parent_stream_configs=[
+            ParentStreamConfig(
+                stream=FailingStream(parent_slices, all_parent_data, "first_stream"),
+                parent_key="id",
+                partition_field="first_stream_id",
+                parameters={},
+                config={},
+                concurrent_slices=3,
+                stream_factory=lambda: FailingStream(parent_slices, all_parent_data, "first_stream"),
+            )
+        ],
+        parameters={},
+        config={},
+    )
+
+    slices = partition_router.stream_slices()
+    assert next(slices) == {"parent_slice": {"slice": "first"}, "first_stream_id": 0}
+    assert next(slices) == {"parent_slice": {"slice": "first"}, "first_stream_id": 1}
+    with pytest.raises(ValueError):
+        next(slices)
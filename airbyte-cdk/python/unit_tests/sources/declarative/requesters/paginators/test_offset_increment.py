@@ -56,3 +56,25 @@ def test_offset_increment_paginator_strategy_initial_token(inject_on_first_reque
     paginator_strategy = OffsetIncrement(page_size=20, parameters={}, config={}, inject_on_first_request=inject_on_first_request)
 
     assert paginator_strategy.initial_token == expected_initial_token
+
+
+@pytest.mark.parametrize(
+    "page_size, total_records, offset, expected_next_page_tokens",
+    [
+        pytest.param(2, "{{ response['total'] }}", 2, [2, 4, 6], id="test_total_records_from_response"),
+        pytest.param(2, "6", 2, [2, 4], id="test_total_records_multiple_of_page_size"),
+        pytest.param("{{ response['limit'] }}", "{{ response['total'] }}", 3, [3, 6], id="test_page_size_from_response"),
+        pytest.param(2, "{{ response['total'] }}", 8, [], id="test_no_pages_left"),
+        pytest.param(2, None, 2, None, id="test_no_total_records"),
+        pytest.param(None, "{{ response['total'] }}", 2, None, id="test_no_page_size"),
+    ],
+)
+def test_offset_increment_next_page_tokens(page_size, total_records, offset, expected_next_page_tokens):
+    paginator_strategy = OffsetIncrement(page_size=page_size, total_records=total_records, parameters={}, config={})
+    paginator_strategy.set_next_page_token(offset)
+
+    response = requests.Response()
+    response._content = json.dumps({"total": 7, "limit": 3}).encode("utf-8")
+
+    assert paginator_strategy.get_next_page_tokens(response) == expected_next_page_tokens
+    assert paginator_strategy._offset == offset
@@ -54,3 +54,27 @@ def test_page_increment_paginator_strategy_initial_token(
     )
 
     assert paginator_strategy.initial_token == expected_initial_token
+
+
+@pytest.mark.parametrize(
+    "page_size, start_from_page, total_records, page, expected_next_page_tokens",
+    [
+        pytest.param(2, 0, "{{ response['total'] }}", 1, [1, 2, 3], id="test_start_from_page_0"),
+        pytest.param(2, 1, "{{ response['total'] }}", 2, [2, 3, 4], id="test_start_from_page_1"),
+        pytest.param(2, 0, "{{ config['total'] }}", 1, [1, 2], id="test_total_records_from_config"),
+        pytest.param(2, 0, "{{ response['total'] }}", 4, [], id="test_no_pages_left"),
+        pytest.param(2, 0, None, 1, None, id="test_no_total_records"),
+        pytest.param(None, 0, "{{ response['total'] }}", 1, None, id="test_no_page_size"),
+    ],
+)
+def test_page_increment_next_page_tokens(page_size, start_from_page, total_records, page, expected_next_page_tokens):
+    paginator_strategy = PageIncrement(
+        page_size, parameters={}, start_from_page=start_from_page, total_records=total_records, config={"total": 6}
+    )
+    paginator_strategy.set_next_page_token(page)
+
+    response = requests.Response()
+    response._content = json.dumps({"total": 7}).encode("utf-8")
+
+    assert paginator_strategy.get_next_page_tokens(response) == expected_next_page_tokens
+    assert paginator_strategy._page == page
@@ -2,18 +2,25 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import json
+import threading
+import time
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 import requests
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level, SyncMode, Type
 from airbyte_cdk.sources.declarative.auth.declarative_authenticator import NoAuth
+from airbyte_cdk.sources.declarative.extractors import DpathExtractor, RecordSelector
 from airbyte_cdk.sources.declarative.incremental import Cursor, DatetimeBasedCursor
 from airbyte_cdk.sources.declarative.partition_routers import SinglePartitionRouter
 from airbyte_cdk.sources.declarative.requesters.error_handlers.response_status import ResponseStatus
-from airbyte_cdk.sources.declarative.requesters.request_option import RequestOptionType
+from airbyte_cdk.sources.declarative.requesters.paginators import DefaultPaginator
+from airbyte_cdk.sources.declarative.requesters.paginators.strategies import CursorPaginationStrategy, OffsetIncrement
+from airbyte_cdk.sources.declarative.requesters.request_option import RequestOption, RequestOptionType
 from airbyte_cdk.sources.declarative.requesters.requester import HttpMethod
 from airbyte_cdk.sources.declarative.retrievers.simple_retriever import SimpleRetriever, SimpleRetrieverTestReadDecorator
+from airbyte_cdk.sources.declarative.transformations import RemoveFields
 from airbyte_cdk.sources.declarative.types import Record
 
 A_SLICE_STATE = {"slice_state": "slice state value"}
@@ -493,3 +500,177 @@ def test_emit_log_request_response_messages(mocker):
 
     assert requester.send_request.call_args_list[0][1]["log_formatter"] is not None
     assert requester.send_request.call_args_list[0][1]["log_formatter"](response) == format_http_message_mock.return_value
+
+
+def test_given_streamed_records_when_read_records_then_paginator_gets_number_of_records_and_last_record():
+    streamed_records = [Record({"id": 1}, {}), Record({"id": 2}, {})]
+    record_selector = MagicMock()
+    record_selector.select_records.side_effect = lambda **kwargs: iter(streamed_records)
+    response = requests.Response()
+    response.status_code = 200
+    requester = MagicMock()
+    requester.send_request.return_value = response
+    paginator = MagicMock()
+    paginator.next_page_token.return_value = None
+    retriever = SimpleRetriever(
+        name="stream_name",
+        primary_key=primary_key,
+        requester=requester,
+        paginator=paginator,
+        record_selector=record_selector,
+        parameters={},
+        config={},
+    )
+
+    assert list(retriever.read_records(stream_slice=A_STREAM_SLICE)) == streamed_records
+
+    last_records = paginator.next_page_token.call_args[0][1]
+    assert len(last_records) == 2
+    assert last_records[-1] == last_records[1] == streamed_records[1]
+    with pytest.raises(ValueError):
+        last_records[0]
+    with pytest.raises(IndexError):
+        last_records[2]
+    assert list(last_records) == list(reversed(last_records)) == [streamed_records[1]]
+
+
+def test_given_transformed_records_when_read_records_then_paginator_reads_response_as_returned_by_api():
+    pages = [{"data": [{"id": 7, "name": "seven"}]}, {"data": []}]
+    responses = []
+    for page in pages:
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(page).encode()
+        responses.append(response)
+    requester = MagicMock()
+    requester.send_request.side_effect = responses
+    record_selector = RecordSelector(
+        extractor=DpathExtractor(field_path=["data"], config={}, parameters={}),
+        transformations=[RemoveFields(field_pointers=[["id"]], parameters={})],
+        config={},
+        parameters={},
+    )
+    paginator = DefaultPaginator(
+        pagination_strategy=CursorPaginationStrategy(
+            cursor_value="{{ response.data[-1].id }}", stop_condition="{{ not response.data }}", config={}, parameters={}
+        ),
+        page_token_option=RequestOption(inject_into=RequestOptionType.request_parameter, field_name="after", parameters={}),
+        url_base="https://airbyte.io",
+        config={},
+        parameters={},
+    )
+    retriever = SimpleRetriever(
+        name="stream_name",
+        primary_key=primary_key,
+        requester=requester,
+        paginator=paginator,
+        record_selector=record_selector,
+        parameters={},
+        config={},
+    )
+
+    read_records = []
+    for record in retriever.read_records(stream_slice=A_STREAM_SLICE):
+        read_records.append(dict(record))
+        # Records are also modified by the consumers of the stream, e.g. when they are normalized
+        record.data["name"] = record.data["name"].upper()
+
+    assert read_records == [{"name": "seven"}]
+    assert requester.send_request.call_args_list[1][1]["request_params"] == {"after": 7}
+
+
+class _OffsetApi:
+    """
+    Requester returning the records of an API paginated with an offset, the pages taking more time to be returned the earlier they are
+    """
+
+    def __init__(self, number_of_records, total_records, page_size):
+        self._number_of_records = number_of_records
+        self._total_records = total_records
+        self._page_size = page_size
+        self._lock = threading.Lock()
+        self.requested_offsets = []
+        self.running_requests = 0
+        self.max_running_requests = 0
+
+    def send_request(self, request_params, **kwargs):
+        offset = request_params.get("offset", 0)
+        with self._lock:
+            self.requested_offsets.append(offset)
+            self.running_requests += 1
+            self.max_running_requests = max(self.max_running_requests, self.running_requests)
+        time.sleep(0.05 / (1 + offset))
+        with self._lock:
+            self.running_requests -= 1
+        response = requests.Response()
+        response.status_code = 200
+        records = [{"id": record_id} for record_id in range(offset, min(offset + self._page_size, self._number_of_records))]
+        response._content = json.dumps({"total": self._total_records, "data": records}).encode()
+        return response
+
+
+def _create_retriever_with_offset_pagination(api, concurrent_pages):
+    record_selector = MagicMock()
+    record_selector.select_records.side_effect = lambda response, stream_slice, **kwargs: [
+        Record(record, stream_slice) for record in response.json()["data"]
+    ]
+    paginator = DefaultPaginator(
+        pagination_strategy=OffsetIncrement(page_size=2, total_records="{{ response['total'] }}", config={}, parameters={}),
+        page_size_option=RequestOption(inject_into=RequestOptionType.request_parameter, field_name="limit", parameters={}),
+        page_token_option=RequestOption(inject_into=RequestOptionType.request_parameter, field_name="offset", parameters={}),
+        url_base="https://airbyte.io",
+        config={},
+        parameters={},
+    )
+    return SimpleRetriever(
+        name="stream_name",
+        primary_key=primary_key,
+        requester=api,
+        paginator=paginator,
+        record_selector=record_selector,
+        concurrent_pages=concurrent_pages,
+        parameters={},
+        config={},
+    )
+
+
+@pytest.mark.parametrize(
+    "number_of_records, total_records, expected_requested_offsets",
+    [
+        pytest.param(9, 9, [0, 2, 4, 6, 8], id="test_total_records_known"),
+        pytest.param(10, 10, [0, 2, 4, 6, 8, 10], id="test_last_page_is_full"),
+        pytest.param(9, 5, [0, 2, 4, 6, 8], id="test_records_added_since_the_first_page"),
+    ],
+)
+def test_given_concurrent_pages_when_read_records_then_return_records_in_page_order(
+    number_of_records, total_records, expected_requested_offsets
+):
+    api = _OffsetApi(number_of_records=number_of_records, total_records=total_records, page_size=2)
+    retriever = _create_retriever_with_offset_pagination(api, concurrent_pages=3)
+
+    records = list(retriever.read_records(stream_slice=A_STREAM_SLICE))
+
+    assert [record["id"] for record in records] == list(range(number_of_records))
+    assert sorted(api.requested_offsets) == expected_requested_offsets
+    assert 1 < api.max_running_requests <= 3
+
+
+def test_given_page_with_less_records_than_page_size_when_read_records_concurrently_then_stop_reading_pages():
+    api = _OffsetApi(number_of_records=5, total_records=20, page_size=2)
+    retriever = _create_retriever_with_offset_pagination(api, concurrent_pages=2)
+
+    records = list(retriever.read_records(stream_slice=A_STREAM_SLICE))
+
+    assert [record["id"] for record in records] == [0, 1, 2, 3, 4]
+    assert max(api.requested_offsets) <= 6
+
+
+def test_given_one_concurrent_page_when_read_records_then_read_pages_one_after_the_other():
+    api = _OffsetApi(number_of_records=9, total_records=9, page_size=2)
+    retriever = _create_retriever_with_offset_pagination(api, concurrent_pages=1)
+
+    records = list(retriever.read_records(stream_slice=A_STREAM_SLICE))
+
+    assert [record["id"] for record in records] == list(range(9))
+    assert api.requested_offsets == [0, 2, 4, 6, 8]
+    assert api.max_running_requests == 1
@@ -2,9 +2,11 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import json
 import logging
 import os
 import tempfile
+from unittest.mock import patch
 
 import pytest
 from airbyte_cdk.sources.declarative.parsers.custom_exceptions import UndefinedReferenceException
@@ -41,6 +43,35 @@ class MockYamlDeclarativeSource(YamlDeclarativeSource):
             parsed_config = YamlDeclarativeSource._parse(config_content)
             return parsed_config
 
+    def _read_yaml_file(self, path_to_yaml_file):
+        with open(path_to_yaml_file, "r") as f:
+            return f.read()
+
+
+VALID_MANIFEST = """
+version: "0.29.3"
+definitions:
+  requester:
+    url_base: "https://api.sendgrid.com"
+    path: "/v3/marketing/lists"
+streams:
+  - type: DeclarativeStream
+    $parameters:
+      name: "lists"
+      primary_key: id
+    schema_loader:
+      type: InlineSchemaLoader
+      schema: {}
+    retriever:
+      requester: "#/definitions/requester"
+      record_selector:
+        extractor:
+          field_path: ["result"]
+check:
+  type: CheckStream
+  stream_names: ["lists"]
+"""
+
 
 class TestYamlDeclarativeSource:
     def test_source_is_created_if_toplevel_fields_are_known(self):
@@ -130,6 +161,54 @@ class TestYamlDeclarativeSource:
             MockYamlDeclarativeSource(temporary_file.filename)
 
 
+class TestCompiledManifest:
+    def test_source_is_created_from_compiled_manifest_without_validation(self, tmp_path):
+        compiled_manifest_path = str(tmp_path / "manifest.json")
+        with TestFileContent(VALID_MANIFEST) as temporary_file:
+            source = MockYamlDeclarativeSource(temporary_file.filename)
+            source.compile_manifest(compiled_manifest_path)
+
+            with patch.object(YamlDeclarativeSource, "_parse") as parse, patch.object(
+                YamlDeclarativeSource, "_validate_source"
+            ) as validate:
+                compiled_source = MockYamlDeclarativeSource(temporary_file.filename, compiled_manifest_path=compiled_manifest_path)
+
+        parse.assert_not_called()
+        validate.assert_not_called()
+        assert compiled_source.resolved_manifest == source.resolved_manifest
+        assert [stream.name for stream in compiled_source.streams({})] == ["lists"]
+
+    def test_compiled_manifest_of_another_manifest_is_ignored(self, tmp_path):
+        compiled_manifest_path = str(tmp_path / "manifest.json")
+        with TestFileContent(VALID_MANIFEST) as temporary_file:
+            MockYamlDeclarativeSource(temporary_file.filename).compile_manifest(compiled_manifest_path)
+        with TestFileContent(VALID_MANIFEST.replace("lists", "contacts")) as temporary_file:
+            source = MockYamlDeclarativeSource(temporary_file.filename, compiled_manifest_path=compiled_manifest_path)
+
+        assert [stream.name for stream in source.streams({})] == ["contacts"]
+
+    def test_compiled_manifest_of_another_cdk_version_is_ignored(self, tmp_path):
+        compiled_manifest_path = str(tmp_path / "manifest.json")
+        with TestFileContent(VALID_MANIFEST) as temporary_file:
+            MockYamlDeclarativeSource(temporary_file.filename).compile_manifest(compiled_manifest_path)
+            with open(compiled_manifest_path) as compiled_manifest_file:
+                compiled_manifest = json.load(compiled_manifest_file)
+            compiled_manifest["cdk_version"] = "0.0.0"
+            compiled_manifest["resolved_manifest"]["streams"] = []
+            with open(compiled_manifest_path, "w") as compiled_manifest_file:
+                json.dump(compiled_manifest, compiled_manifest_file)
+
+            source = MockYamlDeclarativeSource(temporary_file.filename, compiled_manifest_path=compiled_manifest_path)
+
+        assert [stream.name for stream in source.streams({})] == ["lists"]
+
+    def test_source_is_created_if_compiled_manifest_does_not_exist(self, tmp_path):
+        with TestFileContent(VALID_MANIFEST) as temporary_file:
+            source = MockYamlDeclarativeSource(temporary_file.filename, compiled_manifest_path=str(tmp_path / "missing.json"))
+
+        assert [stream.name for stream in source.streams({})] == ["lists"]
+
+
 class TestFileContent:
     def __init__(self, content):
         self.file = tempfile.NamedTemporaryFile(mode="w", delete=False)
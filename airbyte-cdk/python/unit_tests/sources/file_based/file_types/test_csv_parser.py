@@ -17,6 +17,7 @@ from airbyte_cdk.models import FailureType
 from airbyte_cdk.sources.file_based.config.csv_format import (
     DEFAULT_FALSE_VALUES,
     DEFAULT_TRUE_VALUES,
+    CsvEngine,
     CsvFormat,
     CsvHeaderAutogenerated,
     CsvHeaderUserProvided,
@@ -538,3 +539,59 @@ def test_encoding_is_passed_to_stream_reader() -> None:
             mock.call().__exit__(None, None, None),
         ]
     )
+
+
+def _stream_reader_for(content: str) -> Mock:
+    stream_reader = Mock()
+    stream_reader.open_file.side_effect = lambda file, mode, encoding, logger: (
+        io.BytesIO(content.encode("utf8")) if mode == FileReadMode.READ_BINARY else io.StringIO(content)
+    )
+    return stream_reader
+
+
+def _parse_records(content: str, engine: CsvEngine, schema: Dict[str, Any], **format_options: Any) -> List[Dict[str, Any]]:
+    config = FileBasedStreamConfig(
+        name="test", validation_policy="Emit Record", file_type="csv", format=CsvFormat(engine=engine, **format_options)
+    )
+    file = RemoteFile(uri="s3://bucket/key.csv", last_modified=datetime.now())
+    return list(CsvParser().parse_records(config, file, _stream_reader_for(content), logger, schema))
+
+
+_ENGINE_SCHEMA = {
+    "properties": {
+        "id": {"type": "integer"},
+        "price": {"type": ["null", "number"]},
+        "active": {"type": "boolean"},
+        "name": {"type": "string"},
+        "tags": {"type": "array"},
+    }
+}
+
+
+@pytest.mark.parametrize(
+    "content, format_options",
+    [
+        pytest.param('id,price,active,name,tags\n1,1.5,true,a,"[1, 2]"\n2,,false,"b,c",[]\n', {}, id="test_cast_and_null_values"),
+        pytest.param("id,price,active,name,tags\n1,not a number,yes,a,[]\n", {}, id="test_value_that_cant_be_cast_is_kept"),
+        pytest.param("skipped\nid,price,active,name,tags\n1,2,true,\"multi\nline\",[]\n", {"skip_rows_before_header": 1}, id="test_skip_rows"),
+        pytest.param("id;price;active;name\n1;NA;false;a\n", {"delimiter": ";", "null_values": ["NA"]}, id="test_format_options"),
+        pytest.param("id,price,active,name,tags\n", {}, id="test_no_rows"),
+    ],
+)
+def test_pyarrow_engine_parses_records_like_python_engine(content: str, format_options: Dict[str, Any]) -> None:
+    python_records = _parse_records(content, CsvEngine.PYTHON, _ENGINE_SCHEMA, **format_options)
+    pyarrow_records = _parse_records(content, CsvEngine.PYARROW, _ENGINE_SCHEMA, **format_options)
+
+    assert pyarrow_records == python_records
+
+
+def test_given_rows_with_too_many_values_when_parse_records_with_pyarrow_engine_then_fallback_to_python_engine() -> None:
+    config = FileBasedStreamConfig(
+        name="test", validation_policy="Emit Record", file_type="csv", format=CsvFormat(engine=CsvEngine.PYARROW)
+    )
+    file = RemoteFile(uri="s3://bucket/key.csv", last_modified=datetime.now())
+    records = CsvParser().parse_records(config, file, _stream_reader_for("id,name\n1,a\n2,b,extra\n"), logger, _ENGINE_SCHEMA)
+
+    assert next(records) == {"id": 1, "name": "a"}
+    with pytest.raises(RecordParseError):
+        next(records)
@@ -4,11 +4,13 @@
 
 import asyncio
 import datetime
+import io
 import math
 from typing import Any, Mapping, Union
 from unittest.mock import Mock
 
 import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig, ValidationPolicy
@@ -173,12 +175,14 @@ def test_type_mapping(parquet_type: pa.DataType, expected_type: Mapping[str, str
 def test_value_transformation(
     pyarrow_type: pa.DataType, parquet_format: ParquetFormat, parquet_object: Scalar, expected_value: Any
 ) -> None:
-    pyarrow_value = pa.array([parquet_object], type=pyarrow_type)[0]
-    py_value = ParquetParser._to_output_value(pyarrow_value, parquet_format)
+    pyarrow_array = pa.array([parquet_object], type=pyarrow_type)
+    py_value = ParquetParser._to_output_value(pyarrow_array[0], parquet_format)
+    py_values = ParquetParser._to_output_values(pyarrow_array, parquet_format)
     if isinstance(py_value, float):
         assert math.isclose(py_value, expected_value, abs_tol=0.01)
     else:
         assert py_value == expected_value
+    assert py_values == [py_value]
 
 
 def test_value_dictionary() -> None:
@@ -199,6 +203,41 @@ def test_value_none_binary() -> None:
         assert False, "`None` type binary should be handled properly"
 
 
+def test_none_values_are_converted_like_scalars() -> None:
+    for pyarrow_type in [pa.binary(), pa.large_binary(), pa.string(), pa.int64(), pa.decimal128(5, 3), pa.list_(pa.int32())]:
+        pyarrow_array = pa.array([None], type=pyarrow_type)
+        assert ParquetParser._to_output_values(pyarrow_array, _default_parquet_format) == [
+            ParquetParser._to_output_value(pyarrow_array[0], _default_parquet_format)
+        ]
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 1000])
+def test_parse_records_in_batches(batch_size: int) -> None:
+    table = pa.table({"id": [1, 2, 3], "name": [b"a", b"b", None]})
+    buffer = io.BytesIO()
+    pq.write_table(table, buffer)
+    buffer.seek(0)
+
+    config = FileBasedStreamConfig(
+        name="test.parquet",
+        file_type="parquet",
+        format=ParquetFormat(batch_size=batch_size),
+        validation_policy=ValidationPolicy.emit_record,
+    )
+    file = RemoteFile(uri="s3://mybucket/year=2023/test.parquet", last_modified=datetime.datetime.now())
+    stream_reader = Mock()
+    stream_reader.open_file.return_value.__enter__ = Mock(return_value=buffer)
+    stream_reader.open_file.return_value.__exit__ = Mock(return_value=None)
+
+    records = list(ParquetParser().parse_records(config, file, stream_reader, Mock(), None))
+
+    assert records == [
+        {"id": 1, "name": "a", "year": "2023"},
+        {"id": 2, "name": "b", "year": "2023"},
+        {"id": 3, "name": None, "year": "2023"},
+    ]
+
+
 @pytest.mark.parametrize(
     "file_format",
     [
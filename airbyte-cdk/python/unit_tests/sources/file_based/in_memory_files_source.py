@@ -102,7 +102,10 @@ class InMemoryFilesStreamReader(AbstractFileBasedStreamReader):
 
     def open_file(self, file: RemoteFile, mode: FileReadMode, encoding: Optional[str], logger: logging.Logger) -> IOBase:
         if self.file_type == "csv":
-            return self._make_csv_file_contents(file.uri)
+            csv_file = self._make_csv_file_contents(file.uri)
+            if mode == FileReadMode.READ_BINARY:
+                return io.BytesIO(csv_file.read().encode(encoding or "utf8"))  # type: ignore # the csv file is a StringIO
+            return csv_file
         elif self.file_type == "jsonl":
             return self._make_jsonl_file_contents(file.uri)
         elif self.file_type == "unstructured":
@@ -107,6 +107,13 @@ single_csv_scenario: TestScenario[InMemoryFilesSource] = (
                                     "default": 3,
                                     "type": "integer",
                                 },
+                                "max_history_size": {
+                                    "title": "Max History Size",
+                                    "description": "The maximum number of files kept in the state history. Files that are not in the history are synced based on the time window defined by days_to_sync_if_history_is_full. Defaults to 10,000 files.",
+                                    "minimum": 1,
+                                    "airbyte_hidden": True,
+                                    "type": "integer",
+                                },
                                 "format": {
                                     "title": "Format",
                                     "description": "The configuration options that are used to alter how to read incoming files that deviate from the standard formatting.",
@@ -262,6 +269,13 @@ single_csv_scenario: TestScenario[InMemoryFilesSource] = (
                                                     "airbyte_hidden": True,
                                                     "enum": ["None", "Primitive Types Only"],
                                                 },
+                                                "engine": {
+                                                    "title": "Parsing Engine",
+                                                    "description": "The engine used to parse the CSV files. The PyArrow engine reads files in blocks and casts values column by column which is faster for large files.",
+                                                    "default": "Python",
+                                                    "airbyte_hidden": True,
+                                                    "enum": ["Python", "PyArrow"],
+                                                },
                                             },
                                             "required": ["filetype"],
                                         },
@@ -289,6 +303,14 @@ single_csv_scenario: TestScenario[InMemoryFilesSource] = (
                                                     "default": False,
                                                     "type": "boolean",
                                                 },
+                                                "batch_size": {
+                                                    "title": "Record Batch Size",
+                                                    "description": "The maximum number of rows read from a Parquet file at once. Lower values reduce memory usage for files with large row groups.",
+                                                    "default": 65536,
+                                                    "exclusiveMinimum": 0,
+                                                    "airbyte_hidden": True,
+                                                    "type": "integer",
+                                                },
                                             },
                                             "required": ["filetype"],
                                         },
@@ -321,6 +343,14 @@ single_csv_scenario: TestScenario[InMemoryFilesSource] = (
                                     "default": False,
                                     "type": "boolean",
                                 },
+                                "max_concurrent_files": {
+                                    "title": "Max Concurrent Files",
+                                    "description": "The number of files parsed at the same time during a sync. Reading files concurrently reduces the time spent waiting for files to be opened when syncing many small files.",
+                                    "default": 1,
+                                    "minimum": 1,
+                                    "airbyte_hidden": True,
+                                    "type": "integer",
+                                },
                             },
                             "required": ["name", "format"],
                         },
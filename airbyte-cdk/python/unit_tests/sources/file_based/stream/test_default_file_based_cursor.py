@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import random
 from datetime import datetime, timedelta
 from typing import Any, List, Mapping
 from unittest.mock import MagicMock
@@ -298,6 +299,39 @@ def test_set_initial_state_no_history() -> None:
     cursor.set_initial_state({})
 
 
+def test_history_size_is_read_from_config() -> None:
+    config = FileBasedStreamConfig(format=CsvFormat(), name="test", validation_policy=ValidationPolicy.emit_record, max_history_size=2)
+    cursor = DefaultFileBasedCursor(config)
+    for day in range(1, 5):
+        cursor.add_file(RemoteFile(uri=f"{day}.csv", last_modified=datetime(2021, 1, day), file_type="csv"))
+
+    assert cursor.get_state() == {
+        "history": {"3.csv": "2021-01-03T00:00:00.000000Z", "4.csv": "2021-01-04T00:00:00.000000Z"},
+        "_ab_source_file_last_modified": "2021-01-04T00:00:00.000000Z_4.csv",
+    }
+    assert cursor._is_history_full()
+
+
+def test_history_indexes_match_history() -> None:
+    random_generator = random.Random(0)
+    cursor = get_cursor(20, 3)
+    cursor.set_initial_state(
+        {"history": {f"initial_{index}.csv": datetime(2021, 1, 1 + index).strftime(DefaultFileBasedCursor.DATE_TIME_FORMAT) for index in range(10)}}
+    )
+
+    for _ in range(500):
+        # Files are added again with random dates to exercise files being modified after they were synced
+        uri = f"{random_generator.randrange(40)}.csv"
+        cursor.add_file(RemoteFile(uri=uri, last_modified=datetime(2021, 1, 1) + timedelta(hours=random_generator.randrange(2000)), file_type="csv"))
+
+        history = cursor.get_state()["history"]
+        earliest_filename, earliest_last_modified = min(history.items(), key=lambda f: (f[1], f[0]))
+        latest_filename, latest_last_modified = max(history.items(), key=lambda f: (f[1], f[0]))
+        assert len(history) <= 20
+        assert cursor._compute_earliest_file_in_history().uri == earliest_filename
+        assert cursor.get_state()["_ab_source_file_last_modified"] == f"{latest_last_modified}_{latest_filename}"
+
+
 def get_cursor(max_history_size: int, days_to_sync_if_history_is_full: int) -> DefaultFileBasedCursor:
     cursor_cls = DefaultFileBasedCursor
     cursor_cls.DEFAULT_MAX_HISTORY_SIZE = max_history_size
@@ -2,8 +2,9 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import threading
 import unittest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any, Iterable, Iterator, Mapping
 from unittest.mock import Mock
 
@@ -71,6 +72,7 @@ class DefaultFileBasedStreamTest(unittest.TestCase):
         self._stream_config = Mock()
         self._stream_config.format = MockFormat()
         self._stream_config.name = "a stream name"
+        self._stream_config.max_concurrent_files = 1
         self._catalog_schema = Mock()
         self._stream_reader = Mock(spec=AbstractFileBasedStreamReader)
         self._availability_strategy = Mock(spec=AbstractFileBasedAvailabilityStrategy)
@@ -138,6 +140,69 @@ class DefaultFileBasedStreamTest(unittest.TestCase):
         assert messages[0].log.level == Level.ERROR
         assert messages[1].log.level == Level.WARN
 
+    def test_given_max_concurrent_files_when_read_records_from_slice_then_return_records_in_file_order(self) -> None:
+        self._stream_config.max_concurrent_files = 3
+        files = [RemoteFile(uri=f"file{i}", last_modified=self._NOW) for i in range(5)]
+        self._parser.parse_records.side_effect = lambda config, file, stream_reader, logger, schema: [
+            {"uri": file.uri, "index": index} for index in range(10)
+        ]
+
+        messages = list(self._stream.read_records_from_slice({"files": files}))
+
+        assert [message.record.data["data"] for message in messages] == [
+            {"uri": file.uri, "index": index} for file in files for index in range(10)
+        ]
+        assert [call.args[0] for call in self._cursor.add_file.call_args_list] == files
+
+    def test_given_max_concurrent_files_and_exception_when_read_records_from_slice_then_do_process_other_files(self) -> None:
+        self._stream_config.max_concurrent_files = 2
+        self._parser.parse_records.side_effect = lambda config, file, stream_reader, logger, schema: self._iter(
+            [ValueError("An error")] if file.uri == "invalid_file" else [self._A_RECORD]
+        )
+
+        messages = list(
+            self._stream.read_records_from_slice(
+                {
+                    "files": [
+                        RemoteFile(uri="invalid_file", last_modified=self._NOW),
+                        RemoteFile(uri="valid_file", last_modified=self._NOW),
+                    ]
+                }
+            )
+        )
+
+        assert messages[0].log.level == Level.ERROR
+        assert messages[1].record.data["data"] == self._A_RECORD
+        self._cursor.add_file.assert_called_once_with(RemoteFile(uri="valid_file", last_modified=self._NOW))
+
+    def test_given_max_concurrent_files_and_one_file_per_slice_when_read_records_then_prefetch_files_of_next_slices(self) -> None:
+        self._stream_config.max_concurrent_files = 3
+        files = [RemoteFile(uri=f"file{i}", last_modified=self._NOW + timedelta(seconds=i)) for i in range(5)]
+        self._stream_reader.get_matching_files.return_value = files
+        self._cursor.get_files_to_sync.side_effect = lambda all_files, logger: all_files
+        parsing_started = {file.uri: threading.Event() for file in files}
+        next_slice_parsed_while_reading_file = {}
+
+        def parse_records(config: Any, file: RemoteFile, stream_reader: Any, logger: Any, schema: Any) -> Iterator[Mapping[str, Any]]:
+            parsing_started[file.uri].set()
+            if file != files[-1]:
+                next_file = files[files.index(file) + 1]
+                next_slice_parsed_while_reading_file[file.uri] = parsing_started[next_file.uri].wait(timeout=5)
+            yield {"uri": file.uri}
+
+        self._parser.parse_records.side_effect = parse_records
+        events = []
+        self._cursor.add_file.side_effect = lambda file: events.append(("add_file", file.uri))
+
+        slices = list(self._stream.stream_slices(sync_mode=Mock()))
+        for stream_slice in slices:
+            for message in self._stream.read_records_from_slice(stream_slice):
+                events.append(("record", message.record.data["data"]["uri"]))
+
+        assert len(slices) == len(files)
+        assert next_slice_parsed_while_reading_file == {file.uri: True for file in files[:-1]}
+        assert events == [event for file in files for event in [("record", file.uri), ("add_file", file.uri)]]
+
     def test_override_max_n_files_for_schema_inference_is_respected(self) -> None:
         self._discovery_policy.n_concurrent_requests = 1
         self._discovery_policy.get_max_n_files_for_schema_inference.return_value = 3
@@ -0,0 +1,62 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from datetime import datetime
+from typing import Any, Dict, Iterable
+
+import pytest
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from airbyte_cdk.sources.file_based.stream.file_prefetcher import FilePrefetcher
+
+_FILES = [RemoteFile(uri=f"file{i}", last_modified=datetime(2023, 1, 1)) for i in range(6)]
+_RECORDS_PER_FILE = 20
+
+
+def _parse_records(file: RemoteFile) -> Iterable[Dict[str, Any]]:
+    for index in range(_RECORDS_PER_FILE):
+        yield {"uri": file.uri, "index": index}
+
+
+@pytest.mark.parametrize("max_concurrent_files", [1, 2, 10])
+def test_files_are_returned_in_order(max_concurrent_files):
+    prefetcher = FilePrefetcher(_parse_records, max_concurrent_files, buffer_size=5)
+
+    records = [(file, list(records)) for file, records in prefetcher.prefetch(_FILES)]
+
+    assert records == [(file, list(_parse_records(file))) for file in _FILES]
+
+
+def test_parsing_error_is_raised_when_reading_the_records_of_the_file():
+    def parse_records(file: RemoteFile) -> Iterable[Dict[str, Any]]:
+        if file.uri == "file1":
+            raise ValueError("An error")
+        yield from _parse_records(file)
+
+    read_files = []
+    for file, records in FilePrefetcher(parse_records, 3).prefetch(_FILES):
+        if file.uri == "file1":
+            with pytest.raises(ValueError):
+                list(records)
+        else:
+            assert len(list(records)) == _RECORDS_PER_FILE
+        read_files.append(file)
+
+    assert read_files == _FILES
+
+
+def test_files_can_be_partially_read():
+    read_records = []
+    for file, records in FilePrefetcher(_parse_records, 2, buffer_size=1).prefetch(_FILES):
+        read_records.append(next(iter(records)))
+
+    assert read_records == [{"uri": file.uri, "index": 0} for file in _FILES]
+
+
+def test_reading_can_be_stopped_while_files_are_being_parsed():
+    prefetched_files = FilePrefetcher(_parse_records, 3, buffer_size=1).prefetch(_FILES)
+    file, records = next(prefetched_files)
+    next(iter(records))
+
+    # Closing must not wait for the parsers blocked on a full buffer
+    prefetched_files.close()
@@ -3,6 +3,8 @@
 #
 
 import unittest
+from concurrent.futures import Future
+from queue import Queue
 from unittest.mock import Mock, call
 
 import pytest
@@ -42,7 +44,6 @@ class ThreadBasedConcurrentStreamTest(unittest.TestCase):
             self._message_repository,
             1,
             _MAX_CONCURRENT_TASKS,
-            0,
             cursor=self._cursor,
         )
 
@@ -124,52 +125,56 @@ class ThreadBasedConcurrentStreamTest(unittest.TestCase):
 
         self._message_repository.emit_message.assert_called_once_with(slice_log_message)
 
-    def test_wait_while_task_queue_is_full(self):
-        f1 = Mock()
-        f2 = Mock()
-
-        # Verify that the done() method will be called until only one future is still running
-        f1.done.side_effect = [False, False]
-        f1.exception.return_value = None
-        f2.done.side_effect = [False, True]
-        f2.exception.return_value = None
-        futures = [f1, f2]
-        self._stream._wait_while_too_many_pending_futures(futures)
+    def test_read_many_partitions(self):
+        partitions = []
+        for i in range(1000):
+            partition = Mock(spec=Partition)
+            partition.read.return_value = [Record({"id": i})]
+            partitions.append(partition)
+        self._slice_logger.should_log_slice_message.return_value = False
 
-        f1.done.assert_has_calls([call(), call()])
-        f2.done.assert_has_calls([call(), call()])
+        self._partition_generator.generate.return_value = partitions
+        actual_records = list(self._stream.read())
 
-    def test_given_exception_then_fail_immediately(self):
-        f1 = Mock()
-        f2 = Mock()
+        assert sorted(record.data["id"] for record in actual_records) == list(range(1000))
+        assert self._cursor.close_partition.call_count == 1000
 
-        # Verify that the done() method will be called until only one future is still running
-        f1.done.return_value = True
-        f1.exception.return_value = None
-        f2.done.return_value = True
-        f2.exception.return_value = ValueError("ERROR")
-        futures = [f1, f2]
+    def test_given_task_raises_exception_when_read_then_fail_immediately(self):
+        self._partition_generator.generate.side_effect = ValueError("ERROR")
+        self._stream._threadpool.submit = Mock(side_effect=self._submit_failing_task)
 
         with pytest.raises(RuntimeError):
-            self._stream._wait_while_too_many_pending_futures(futures)
+            list(self._stream.read())
 
-    def test_given_removing_multiple_elements_when_pruning_then_fail_immediately(self):
-        # Verify that the done() method will be called until only one future is still running
-        futures = []
+    def test_task_slot_is_released_when_task_completes(self):
+        futures = set()
+        queue = Queue()
         for _ in range(_MAX_CONCURRENT_TASKS + 1):
-            future = Mock()
-            future.done.return_value = True
-            future.exception.return_value = None
-            futures.append(future)
+            self._stream._submit_task(futures, queue, lambda: None)
+        self._stream._threadpool.shutdown(wait=True)
 
-        pending_future = Mock()
-        pending_future.done.return_value = False
-        pending_future.exception.return_value = None
-        futures.append(pending_future)
+        assert not futures
+        for _ in range(_MAX_CONCURRENT_TASKS):
+            assert self._stream._task_slots.acquire(blocking=False)
+
+    def test_failed_task_is_kept_for_error_check(self):
+        futures = set()
+        queue = Queue()
+        self._stream._submit_task(futures, queue, self._raise_error)
+
+        assert isinstance(queue.get(timeout=1), RuntimeError)
+        with pytest.raises(RuntimeError):
+            self._stream._check_for_errors(list(futures))
 
-        self._stream._wait_while_too_many_pending_futures(futures)
+    @staticmethod
+    def _raise_error():
+        raise ValueError("ERROR")
 
-        assert futures == [pending_future]
+    @staticmethod
+    def _submit_failing_task(function, *args):
+        future = Future()
+        future.set_exception(ValueError("ERROR"))
+        return future
 
     def test_as_airbyte_stream(self):
         expected_airbyte_stream = AirbyteStream(
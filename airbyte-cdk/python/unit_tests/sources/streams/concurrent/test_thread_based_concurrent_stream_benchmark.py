@@ -0,0 +1,86 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Benchmark of ThreadBasedConcurrentStream.read throughput as the number of partitions grows.
+
+The cost of processing a record should not depend on the number of partitions so the number of records per second is expected to stay
+flat. This takes a while to run so it is deselected by default. Run it with:
+
+    python -m pytest -m benchmark unit_tests/sources/streams/concurrent/test_thread_based_concurrent_stream_benchmark.py
+"""
+
+import logging
+import time
+from typing import Any, Iterable, Mapping, Optional
+from unittest.mock import Mock
+
+import pytest
+from airbyte_cdk.sources.message import InMemoryMessageRepository
+from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.partitions.partition_generator import PartitionGenerator
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.streams.concurrent.thread_based_concurrent_stream import ThreadBasedConcurrentStream
+from airbyte_cdk.sources.utils.slice_logger import DebugSliceLogger
+
+_BASELINE_PARTITION_COUNT = 1_000
+_PARTITION_COUNTS = [10_000, 100_000]
+_RECORDS_PER_PARTITION = 10
+_MAX_WORKERS = 4
+# Throughput can vary from one run to the other so only a drop larger than this is considered a regression
+_MIN_THROUGHPUT_RATIO = 0.5
+
+
+class _InMemoryPartition(Partition):
+    def __init__(self, index: int):
+        self._index = index
+
+    def read(self) -> Iterable[Record]:
+        return [Record({"partition": self._index, "id": i}) for i in range(_RECORDS_PER_PARTITION)]
+
+    def to_slice(self) -> Optional[Mapping[str, Any]]:
+        return {"partition": self._index}
+
+    def __hash__(self) -> int:
+        return self._index
+
+
+class _InMemoryPartitionGenerator(PartitionGenerator):
+    def __init__(self, number_of_partitions: int):
+        self._number_of_partitions = number_of_partitions
+
+    def generate(self) -> Iterable[Partition]:
+        return (_InMemoryPartition(i) for i in range(self._number_of_partitions))
+
+
+def _records_per_second(number_of_partitions: int) -> float:
+    stream = ThreadBasedConcurrentStream(
+        partition_generator=_InMemoryPartitionGenerator(number_of_partitions),
+        max_workers=_MAX_WORKERS,
+        name="benchmark",
+        json_schema={},
+        availability_strategy=Mock(),
+        primary_key=[],
+        cursor_field=None,
+        slice_logger=DebugSliceLogger(),
+        logger=logging.getLogger("airbyte"),
+        message_repository=InMemoryMessageRepository(),
+    )
+    start = time.perf_counter()
+    number_of_records = sum(1 for _ in stream.read())
+    assert number_of_records == number_of_partitions * _RECORDS_PER_PARTITION
+    return number_of_records / (time.perf_counter() - start)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("number_of_partitions", _PARTITION_COUNTS)
+def test_read_throughput_does_not_depend_on_the_number_of_partitions(number_of_partitions: int) -> None:
+    baseline_throughput = _records_per_second(_BASELINE_PARTITION_COUNT)
+
+    throughput = _records_per_second(number_of_partitions)
+
+    assert throughput >= _MIN_THROUGHPUT_RATIO * baseline_throughput, (
+        f"{number_of_partitions} partitions: {throughput:.0f} records/s, "
+        f"{_BASELINE_PARTITION_COUNT} partitions: {baseline_throughput:.0f} records/s"
+    )
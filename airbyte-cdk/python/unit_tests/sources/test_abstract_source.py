@@ -5,6 +5,7 @@
 import copy
 import datetime
 import logging
+import sys
 from collections import defaultdict
 from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 from unittest.mock import Mock, call
@@ -54,12 +55,14 @@ class MockSource(AbstractSource):
         per_stream: bool = True,
         message_repository: MessageRepository = None,
         exception_on_missing_stream: bool = True,
+        max_concurrent_streams: int = 1,
     ):
         self._streams = streams
         self.check_lambda = check_lambda
         self.per_stream = per_stream
         self.exception_on_missing_stream = exception_on_missing_stream
         self._message_repository = message_repository
+        self._max_concurrent_streams = max_concurrent_streams
 
     def check_connection(self, logger: logging.Logger, config: Mapping[str, Any]) -> Tuple[bool, Optional[Any]]:
         if self.check_lambda:
@@ -83,6 +86,10 @@ class MockSource(AbstractSource):
     def message_repository(self):
         return self._message_repository
 
+    @property
+    def max_concurrent_streams(self) -> int:
+        return self._max_concurrent_streams
+
 
 class StreamNoStateMethod(Stream):
     name = "managers"
@@ -442,6 +449,132 @@ def test_valid_full_refresh_read_with_slices(mocker):
     assert expected == messages
 
 
+def _messages_by_stream(messages: List[AirbyteMessage]) -> Dict[str, List[AirbyteMessage]]:
+    messages_by_stream = defaultdict(list)
+    for message in messages:
+        if message.type == Type.RECORD:
+            messages_by_stream[message.record.stream].append(message)
+        elif message.type == Type.TRACE:
+            messages_by_stream[message.trace.stream_status.stream_descriptor.name].append(message)
+    return messages_by_stream
+
+
+def test_concurrent_full_refresh_read(mocker):
+    """Tests that reading streams concurrently produces the messages of each stream in order"""
+    stream_output = [{"k": i} for i in range(100)]
+    streams = [MockStream([({"sync_mode": SyncMode.full_refresh}, stream_output)], name=f"s{i}") for i in range(5)]
+
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+
+    src = MockSource(streams=streams, max_concurrent_streams=3)
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.full_refresh) for stream in streams])
+
+    messages = _fix_emitted_at(list(src.read(logger, {}, catalog)))
+
+    assert _messages_by_stream(messages) == {
+        stream.name: _fix_emitted_at(
+            [
+                _as_stream_status(stream.name, AirbyteStreamStatus.STARTED),
+                _as_stream_status(stream.name, AirbyteStreamStatus.RUNNING),
+                *_as_records(stream.name, stream_output),
+                _as_stream_status(stream.name, AirbyteStreamStatus.COMPLETE),
+            ]
+        )
+        for stream in streams
+    }
+
+
+class _ConcurrentIncrementalStream(Stream):
+    cursor_field = "k"
+    primary_key = "k"
+    state_checkpoint_interval = 1
+
+    def __init__(self, name: str, number_of_records: int):
+        self._name = name
+        self._number_of_records = number_of_records
+        self.read_stream_state: Optional[Mapping[str, Any]] = None
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def read_records(self, stream_state: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Mapping[str, Any]]:  # type: ignore
+        self.read_stream_state = stream_state
+        for index in range((stream_state or {}).get("k", -1) + 1, self._number_of_records):
+            yield {"k": index}
+
+    def get_updated_state(self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]) -> Mapping[str, Any]:
+        return {"k": latest_record["k"]}
+
+
+@pytest.mark.parametrize("per_stream", [pytest.param(True, id="test_per_stream_state"), pytest.param(False, id="test_legacy_state")])
+def test_concurrent_incremental_read_emits_consistent_state_messages(mocker, per_stream):
+    """Tests that the state messages of streams read concurrently hold the latest state of each stream"""
+    number_of_records = 200
+    streams = [_ConcurrentIncrementalStream(f"s{i}", number_of_records) for i in range(5)]
+    mocker.patch.object(_ConcurrentIncrementalStream, "get_json_schema", return_value={})
+
+    src = MockSource(streams=streams, max_concurrent_streams=5, per_stream=per_stream)
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.incremental) for stream in streams])
+
+    switch_interval = sys.getswitchinterval()
+    # Switching threads often interleaves the checkpoints of the streams
+    sys.setswitchinterval(1e-6)
+    try:
+        messages = list(src.read(logger, {}, catalog, state={"s0": {"k": 5}}))
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert streams[0].read_stream_state == {"k": 5}
+    state_messages = [message.state for message in messages if message.type == Type.STATE]
+    last_states: Dict[str, int] = {}
+    last_legacy_states: Dict[str, int] = {}
+    for state_message in state_messages:
+        if per_stream:
+            stream_name = state_message.stream.stream_descriptor.name
+            stream_state = state_message.stream.stream_state.dict()["k"]
+            # The states of a stream are emitted in order and the legacy state holds the state of the stream the message is for
+            assert stream_state >= last_states.get(stream_name, -1)
+            assert state_message.data[stream_name] == {"k": stream_state}
+            last_states[stream_name] = stream_state
+        else:
+            assert state_message.stream is None
+        # The legacy state is a snapshot of the latest states so the state of each stream never goes back from a message to the next
+        for legacy_stream_name, legacy_state in state_message.data.items():
+            assert legacy_state["k"] >= last_legacy_states.get(legacy_stream_name, -1)
+            last_legacy_states[legacy_stream_name] = legacy_state["k"]
+    if per_stream:
+        assert last_states == {stream.name: number_of_records - 1 for stream in streams}
+    assert state_messages[-1].data == {stream.name: {"k": number_of_records - 1} for stream in streams}
+    assert len([message for message in messages if message.type == Type.RECORD]) == len(streams) * number_of_records - 6
+
+
+def test_concurrent_read_raises_stream_exception(mocker):
+    """Tests that an exception raised while reading a stream concurrently stops the sync and marks the stream as incomplete"""
+    healthy_stream = MockStream([({"sync_mode": SyncMode.full_refresh}, [{"k": "v"}])], name="healthy")
+    failing_stream = MockStream(name="failing")
+
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    mocker.patch.object(failing_stream, "read_records", side_effect=AirbyteTracedException(internal_message="oh no!"))
+
+    src = MockSource(streams=[healthy_stream, failing_stream], max_concurrent_streams=2)
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[_configured_stream(healthy_stream, SyncMode.full_refresh), _configured_stream(failing_stream, SyncMode.full_refresh)]
+    )
+
+    messages = []
+    with pytest.raises(AirbyteTracedException, match="oh no!"):
+        for message in src.read(logger, {}, catalog):
+            messages.append(message)
+
+    assert _messages_by_stream(_fix_emitted_at(messages))["failing"] == _fix_emitted_at(
+        [
+            _as_stream_status("failing", AirbyteStreamStatus.STARTED),
+            _as_stream_status("failing", AirbyteStreamStatus.INCOMPLETE),
+        ]
+    )
+
+
 @pytest.mark.parametrize(
     "slices",
     [[{"1": "1"}, {"2": "2"}], [{"date": datetime.date(year=2023, month=1, day=1)}, {"date": datetime.date(year=2023, month=1, day=1)}]],
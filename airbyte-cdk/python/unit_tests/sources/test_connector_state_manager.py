@@ -2,6 +2,8 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import sys
+import threading
 from contextlib import nullcontext as does_not_raise
 from typing import Any, Iterable, List, Mapping
 
@@ -590,3 +592,65 @@ def test_do_not_set_stream_descriptor_namespace_when_none():
     actual_state_message = state_manager.create_state_message(stream_name="episodes", namespace=None, send_per_stream_state=True)
 
     assert actual_state_message.state.stream.stream_descriptor.dict(exclude_unset=True) == expected_stream_state_descriptor
+
+
+def test_state_messages_are_not_modified_by_later_updates():
+    state_manager = ConnectorStateManager({}, [])
+    stream_state = {"created_at": "2022_05_22", "partitions": {"season_1": "2022_05_01"}}
+    state_manager.update_state_for_stream("episodes", None, stream_state)
+    state_manager.update_state_for_stream("seasons", None, {"id": 1})
+
+    first_state_message = state_manager.create_state_message("episodes", None, send_per_stream_state=True)
+    stream_state["partitions"]["season_1"] = "2022_05_30"
+    state_manager.update_state_for_stream("seasons", None, {"id": 2})
+    second_state_message = state_manager.create_state_message("seasons", None, send_per_stream_state=True)
+
+    assert first_state_message.state.stream.stream_state == AirbyteStateBlob.parse_obj(
+        {"created_at": "2022_05_22", "partitions": {"season_1": "2022_05_01"}}
+    )
+    assert first_state_message.state.data == {
+        "episodes": {"created_at": "2022_05_22", "partitions": {"season_1": "2022_05_01"}},
+        "seasons": {"id": 1},
+    }
+    assert second_state_message.state.data == {
+        "episodes": {"created_at": "2022_05_22", "partitions": {"season_1": "2022_05_01"}},
+        "seasons": {"id": 2},
+    }
+    assert state_manager.get_stream_state("episodes", None) == {"created_at": "2022_05_22", "partitions": {"season_1": "2022_05_01"}}
+
+
+def test_given_states_updated_concurrently_when_create_state_message_then_legacy_state_is_consistent():
+    state_manager = ConnectorStateManager({}, [])
+    number_of_streams = 20000
+    errors = []
+    started = threading.Barrier(2)
+
+    def update_states():
+        started.wait()
+        for index in range(number_of_streams):
+            state_manager.update_state_for_stream(f"stream_{index}", None, {"id": index})
+
+    def create_state_messages():
+        started.wait()
+        try:
+            while updating_thread.is_alive():
+                state_message = state_manager.create_state_message("stream_0", None, send_per_stream_state=True)
+                assert all(state_value == {"id": int(name.split("_")[1])} for name, state_value in state_message.state.data.items())
+        except Exception as exception:
+            errors.append(exception)
+
+    switch_interval = sys.getswitchinterval()
+    # Switching threads often makes the updates happen while the legacy state is being built
+    sys.setswitchinterval(1e-6)
+    try:
+        updating_thread = threading.Thread(target=update_states)
+        creating_thread = threading.Thread(target=create_state_messages)
+        updating_thread.start()
+        creating_thread.start()
+        updating_thread.join()
+        creating_thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert errors == []
+    assert len(state_manager.create_state_message("stream_0", None, send_per_stream_state=False).state.data) == number_of_streams
@@ -16,7 +16,8 @@ from airbyte_cdk.models import (
     TraceType,
 )
 from airbyte_cdk.models import Type as MessageType
-from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
+from airbyte_cdk.sources.utils.record_helper import RecordEmitter, stream_data_to_airbyte_message
+from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 
 NOW = 1234567
 STREAM_NAME = "my_stream"
@@ -83,3 +84,48 @@ def test_state_message_to_message(test_name, data):
     schema = {}
     with pytest.raises(ValueError):
         stream_data_to_airbyte_message(STREAM_NAME, data, transformer, schema)
+
+
+def test_record_emitter_without_transformer_does_not_copy_records():
+    data = {"id": 0, "field_A": 1.0}
+    message = RecordEmitter(STREAM_NAME).to_message(data)
+
+    assert message.type == MessageType.RECORD
+    assert message.record.stream == STREAM_NAME
+    assert message.record.data is data
+    assert message.record.emitted_at > 0
+
+
+def test_record_emitter_transforms_a_copy_of_records():
+    schema = {"type": "object", "properties": {"id": {"type": "string"}}}
+    data = {"id": 0}
+    record_emitter = RecordEmitter(STREAM_NAME, TypeTransformer(TransformConfig.DefaultSchemaNormalization), schema)
+
+    message = record_emitter.to_message(data)
+
+    assert message.record.data == {"id": "0"}
+    assert data == {"id": 0}
+
+
+def test_record_emitter_ignores_no_transform_transformer():
+    transformer = TypeTransformer(TransformConfig.NoTransform)
+    data = {"id": 0}
+
+    assert RecordEmitter(STREAM_NAME, transformer, {}).to_message(data).record.data is data
+
+
+@pytest.mark.parametrize(
+    "data, expected_message",
+    [
+        (
+            AirbyteLogMessage(level=Level.INFO, message="Hello, this is a log message"),
+            AirbyteMessage(type=MessageType.LOG, log=AirbyteLogMessage(level=Level.INFO, message="Hello, this is a log message")),
+        ),
+        (
+            AirbyteTraceMessage(type=TraceType.ERROR, emitted_at=101),
+            AirbyteMessage(type=MessageType.TRACE, trace=AirbyteTraceMessage(type=TraceType.ERROR, emitted_at=101)),
+        ),
+    ],
+)
+def test_record_emitter_log_or_trace_to_message(data, expected_message):
+    assert RecordEmitter(STREAM_NAME).to_message(data) == expected_message
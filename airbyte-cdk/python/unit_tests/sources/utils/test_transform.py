@@ -2,7 +2,9 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import copy
 import json
+from unittest.mock import patch
 
 import pytest
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
@@ -203,6 +205,18 @@ VERY_NESTED_SCHEMA = {
             {"value": ["one", "two"]},
             "Failed to transform value 'one' of type 'string' to 'object', key path: '.value.0'",
         ),
+        (
+            {"type": "object", "properties": {"yes": {"type": "boolean"}, "no": {"type": ["null", "boolean"]}, "one": {"type": "boolean"}}},
+            {"yes": "true", "no": "Off", "one": 1},
+            {"yes": True, "no": False, "one": True},
+            None,
+        ),
+        (
+            {"type": "object", "properties": {"value": {"type": "boolean"}}},
+            {"value": "maybe"},
+            {"value": "maybe"},
+            "Failed to transform value 'maybe' of type 'string' to 'boolean', key path: '.value'",
+        ),
     ],
 )
 def test_transform(schema, actual, expected, expected_warns, caplog):
@@ -264,3 +278,69 @@ def test_custom_transform_with_default_normalization():
     obj = {"value": 12}
     s.transformer.transform(obj, SIMPLE_SCHEMA)
     assert obj == {"value": "transformed"}
+
+
+@pytest.mark.parametrize(
+    "schema, record",
+    [
+        (COMPLEX_SCHEMA, {"value": "false", "prop": 12, "number_prop": "45.5", "int_prop": "3", "too_many_types": 1, "array": [1, 2]}),
+        (COMPLEX_SCHEMA, {"nested": {"a": 1}, "list_of_lists": [[1, None], "not a list", 3]}),
+        (VERY_NESTED_SCHEMA, {"very_nested_value": {"very_nested_value": "not an object"}}),
+        (
+            {"type": "object", "properties": {"value": {"type": ["null", "integer", "array"], "properties": {"a": {"type": "string"}}}}},
+            {"value": {"a": 1, "b": True}},
+        ),
+        ({"type": "object", "properties": {"flag": {"type": "integer"}, "id": {"type": ["number"]}}}, {"flag": True, "id": "not a number"}),
+        ({"type": "object", "properties": {"a": {"type": "boolean"}, "b": {"type": "boolean"}}}, {"a": "Yes", "b": "not a boolean"}),
+    ],
+)
+def test_compiled_schema_transform_is_equivalent_to_jsonschema_transform(schema, record, caplog):
+    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    expected = copy.deepcopy(record)
+    t._transform_with_jsonschema(expected, schema)
+    expected_warns = [log_record.message for log_record in caplog.records]
+    caplog.clear()
+
+    t.transform(record, schema)
+
+    assert repr(record) == repr(expected)
+    assert [log_record.message for log_record in caplog.records] == expected_warns
+
+
+def test_schema_is_compiled_once():
+    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    with patch.object(TypeTransformer, "_compile_schema", side_effect=TypeTransformer._compile_schema, autospec=True) as compile_schema:
+        t.transform({"value": 0}, copy.deepcopy(SIMPLE_SCHEMA))
+        compile_schema.reset_mock()
+        for value in range(1, 3):
+            record = {"value": value}
+            t.transform(record, copy.deepcopy(SIMPLE_SCHEMA))
+            assert record == {"value": str(value)}
+    compile_schema.assert_not_called()
+
+
+def test_transform_recursive_schema():
+    schema = {
+        "type": "object",
+        "properties": {"root": {"$ref": "#/definitions/node"}},
+        "definitions": {
+            "node": {
+                "type": "object",
+                "properties": {"value": {"type": "integer"}, "children": {"type": "array", "items": {"$ref": "#/definitions/node"}}},
+            }
+        },
+    }
+    record = {"root": {"value": "1", "children": [{"value": "2", "children": [{"value": "3"}]}]}}
+    TypeTransformer(TransformConfig.DefaultSchemaNormalization).transform(record, schema)
+    assert record == {"root": {"value": 1, "children": [{"value": 2, "children": [{"value": 3}]}]}}
+
+
+def test_registering_custom_transform_after_transform():
+    t = TypeTransformer(TransformConfig.CustomSchemaNormalization)
+    record = {"value": 12}
+    t.transform(record, SIMPLE_SCHEMA)
+    assert record == {"value": 12}
+
+    t.registerCustomTransform(lambda instance, schema: "transformed")
+    t.transform(record, SIMPLE_SCHEMA)
+    assert record == {"value": "transformed"}
@@ -2,9 +2,11 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import datetime
 import os
 from argparse import Namespace
 from copy import deepcopy
+from decimal import Decimal
 from typing import Any, List, Mapping, MutableMapping, Union
 from unittest import mock
 from unittest.mock import MagicMock, patch
@@ -28,6 +30,7 @@ from airbyte_cdk.models import (
     Type,
 )
 from airbyte_cdk.sources import Source
+from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
 
 
 class MockSource(Source):
@@ -257,6 +260,50 @@ def test_run_read_with_exception(entrypoint: AirbyteEntrypoint, mocker, spec_moc
         assert [MESSAGE_FROM_REPOSITORY.json(exclude_unset=True)] == messages
 
 
+@pytest.mark.parametrize(
+    "message",
+    [
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data={"data": "stuff"}, emitted_at=1)),
+            id="test_record",
+        ),
+        pytest.param(
+            AirbyteMessage(
+                type=Type.RECORD,
+                record=AirbyteRecordMessage(
+                    namespace="namespace",
+                    stream="stream",
+                    data={"unicode": "caf\u00e9", "date": datetime.date(2023, 1, 1), "decimal": Decimal("1.5"), "nested": [{"a": None}]},
+                    emitted_at=1,
+                ),
+            ),
+            id="test_record_with_namespace_and_non_json_types",
+        ),
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data={}, emitted_at=1, extra_field="extra")),
+            id="test_record_with_extra_field",
+        ),
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data={}, emitted_at=1), log=None),
+            id="test_record_message_with_other_field_set",
+        ),
+        pytest.param(stream_data_to_airbyte_message("stream", {"data": "stuff"}), id="test_record_from_stream_data"),
+        pytest.param(MESSAGE_FROM_REPOSITORY, id="test_non_record_message"),
+    ],
+)
+def test_airbyte_message_to_string_matches_pydantic_serialization(message: AirbyteMessage):
+    assert AirbyteEntrypoint.airbyte_message_to_string(message) == message.json(exclude_unset=True)
+
+
+def test_launch_writes_messages_to_stdout(mocker, capsys):
+    messages = [_wrap_message(AirbyteRecordMessage(stream="stream", data={"id": i}, emitted_at=1)) for i in range(3)]
+    mocker.patch.object(AirbyteEntrypoint, "run", return_value=iter(messages))
+
+    entrypoint_module.launch(MockSource(), ["spec"])
+
+    assert capsys.readouterr().out.splitlines() == messages
+
+
 def test_invalid_command(entrypoint: AirbyteEntrypoint, config_mock):
     with pytest.raises(Exception):
         list(entrypoint.run(Namespace(command="invalid", config="conf")))
@@ -0,0 +1,142 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import subprocess
+import sys
+from typing import List, Set, Tuple
+
+import pytest
+
+# Budget for the time spent importing modules when running a plain Python HTTP source. It is set well above the import time measured
+# locally so that it only fails when a heavy dependency starts being imported eagerly. As it depends on the machine running the tests, it is
+# only checked when running the benchmarks.
+IMPORT_TIME_BUDGET_SECONDS = 2.0
+
+# Modules that are only needed by optional subsystems and must not be imported by sources that don't use them
+LAZY_MODULES = [
+    "airbyte_cdk.destinations.vector_db_based",
+    "airbyte_cdk.sources.declarative",
+    "airbyte_cdk.sources.file_based",
+    "distutils",
+    "jinja2",
+    "langchain",
+    "requests_cache",
+]
+
+SOURCE = """
+import sys
+from typing import Any, Iterable, List, Mapping, Optional, Tuple
+
+import requests
+from airbyte_cdk.entrypoint import launch
+from airbyte_cdk.sources import AbstractSource
+from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.streams.http import HttpStream
+
+
+class Customers(HttpStream):
+    url_base = "https://api.example.com/"
+    primary_key = "id"
+
+    def path(self, **kwargs: Any) -> str:
+        return "customers"
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        return None
+
+    def parse_response(self, response: requests.Response, **kwargs: Any) -> Iterable[Mapping[str, Any]]:
+        yield from response.json()
+
+    def read_records(self, *args: Any, **kwargs: Any) -> Iterable[Mapping[str, Any]]:
+        yield {"id": 1}
+
+    def get_json_schema(self) -> Mapping[str, Any]:
+        return {"type": "object", "properties": {"id": {"type": "integer"}}}
+
+
+class SourceExample(AbstractSource):
+    def check_connection(self, logger: Any, config: Mapping[str, Any]) -> Tuple[bool, Any]:
+        return True, None
+
+    def streams(self, config: Mapping[str, Any]) -> List[Stream]:
+        return [Customers()]
+
+    def spec(self, logger: Any) -> Any:
+        from airbyte_cdk.models import ConnectorSpecification
+
+        return ConnectorSpecification(connectionSpecification={"type": "object", "properties": {}})
+
+
+launch(SourceExample(), sys.argv[1:])
+"""
+
+
+def _run_with_import_time(tmp_path, args: List[str]) -> Tuple[float, Set[str]]:
+    script = tmp_path / "main.py"
+    script.write_text(SOURCE)
+    process = subprocess.run([sys.executable, "-X", "importtime", str(script), *args], capture_output=True, text=True, cwd=tmp_path)
+    assert process.returncode == 0, process.stderr
+    assert '"failure_type"' not in process.stdout, process.stdout
+
+    import_time_microseconds = 0
+    imported_modules = set()
+    # Lines look like "import time: <self us> | <cumulative us> | <module indented by its depth in the import tree>"
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_time, module = line.split("|")
+        imported_modules.add(module.strip())
+        if not module[2].isspace():
+            # Only top level imports are summed up since their cumulative time includes the time of the modules they import
+            import_time_microseconds += int(cumulative_time)
+    return import_time_microseconds / 1_000_000, imported_modules
+
+
+def _run_command(tmp_path, command: str) -> Tuple[float, Set[str]]:
+    config_path = tmp_path / "config.json"
+    config_path.write_text("{}")
+    catalog_path = tmp_path / "catalog.json"
+    catalog_path.write_text(
+        json.dumps(
+            {
+                "streams": [
+                    {
+                        "stream": {"name": "customers", "json_schema": {}, "supported_sync_modes": ["full_refresh"]},
+                        "sync_mode": "full_refresh",
+                        "destination_sync_mode": "overwrite",
+                    }
+                ]
+            }
+        )
+    )
+    args = [command] if command == "spec" else [command, "--config", str(config_path)]
+    if command == "read":
+        args += ["--catalog", str(catalog_path)]
+    return _run_with_import_time(tmp_path, args)
+
+
+COMMANDS = [
+    pytest.param("spec", id="test_spec"),
+    pytest.param("check", id="test_check"),
+    pytest.param("read", id="test_read"),
+]
+
+
+@pytest.mark.parametrize("command", COMMANDS)
+def test_http_source_does_not_import_lazy_modules(tmp_path, command):
+    _, imported_modules = _run_command(tmp_path, command)
+
+    eagerly_imported_modules = sorted(
+        module for module in imported_modules if any(module == lazy or module.startswith(f"{lazy}.") for lazy in LAZY_MODULES)
+    )
+    assert not eagerly_imported_modules
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("command", COMMANDS)
+def test_import_time_of_http_source(tmp_path, command):
+    import_time, _ = _run_command(tmp_path, command)
+
+    assert import_time < IMPORT_TIME_BUDGET_SECONDS
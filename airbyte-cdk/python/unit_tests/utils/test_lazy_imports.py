@@ -0,0 +1,34 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import collections
+import sys
+import types
+
+import pytest
+from airbyte_cdk.utils.lazy_imports import lazy_module_getattr
+
+
+def test_lazy_module_getattr_imports_name_on_first_access(monkeypatch):
+    package = types.ModuleType("lazy_package")
+    monkeypatch.setitem(sys.modules, "lazy_package", package)
+    package.__getattr__ = lazy_module_getattr("lazy_package", {"OrderedDict": "collections"})
+
+    assert package.OrderedDict is collections.OrderedDict
+    assert "OrderedDict" in vars(package)
+
+
+def test_lazy_module_getattr_raises_attribute_error_for_unknown_names():
+    with pytest.raises(AttributeError):
+        lazy_module_getattr("lazy_package", {})("Unknown")
+
+
+def test_public_names_are_lazily_importable():
+    from airbyte_cdk import AirbyteEntrypoint
+    from airbyte_cdk.entrypoint import AirbyteEntrypoint as EntrypointModuleAirbyteEntrypoint
+    from airbyte_cdk.sources import AbstractSource
+    from airbyte_cdk.sources.abstract_source import AbstractSource as AbstractSourceModuleAbstractSource
+
+    assert AirbyteEntrypoint is EntrypointModuleAirbyteEntrypoint
+    assert AbstractSource is AbstractSourceModuleAbstractSource
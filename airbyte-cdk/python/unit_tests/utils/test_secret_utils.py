@@ -121,3 +121,23 @@ def test_secret_filtering():
     update_secrets([SECRET_STRING_VALUE, SECRET_STRING_2_VALUE])
     filtered = filter_secrets(sensitive_str)
     assert filtered == f"**** {NOT_SECRET_VALUE} **** ****"
+
+
+@pytest.mark.parametrize(
+    ["secrets", "string", "expected"],
+    [
+        pytest.param(["x", "xk"], "xk", "****", id="test_secret_prefix_of_another_secret"),
+        pytest.param(["xk", "x"], "xk x", "**** ****", id="test_secret_prefix_of_another_secret_in_reverse_order"),
+        pytest.param(["abc", "bcdef"], "abcdefg", "****g", id="test_overlapping_secrets"),
+        pytest.param(["aa"], "aaa", "****", id="test_overlapping_occurrences_of_a_secret"),
+        pytest.param(["abc", "def"], "abcdef", "********", id="test_adjacent_secrets"),
+        pytest.param([SECRET_INT_VALUE, SECRET_INT_VALUE], f"value={SECRET_INT_VALUE}", "value=****", id="test_duplicated_int_secret"),
+        pytest.param([None, "secret"], "my secret", "my ****", id="test_none_secret"),
+    ],
+)
+def test_secret_filtering_obfuscates_all_occurrences(secrets, string, expected):
+    update_secrets(secrets)
+    try:
+        assert filter_secrets(string) == expected
+    finally:
+        update_secrets([])
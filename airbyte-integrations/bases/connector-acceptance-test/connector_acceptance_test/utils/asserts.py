@@ -3,10 +3,16 @@
 #
 
 import copy
+import datetime
+import json
 import logging
+import multiprocessing
+import os
 import re
 from collections import defaultdict
-from typing import Any, Dict, List, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping
 
 import dpath.util
 import pendulum
@@ -20,6 +26,14 @@ timestamp_regex = re.compile((r"^\d{4}-\d?\d-\d?\d"  # date
                               r".*$"))  # timezone
 # fmt: on
 
+# Datetimes in this subset of ISO 8601 are valid if and only if datetime.fromisoformat parses them, which is much faster than pendulum
+iso_timestamp_regex = re.compile(r"^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(\.\d{3}|\.\d{6})?(Z|[+-]\d{2}:\d{2})?$")
+
+# Records are validated in a process pool when there are at least this many of them. Below it, starting the pool costs more than it saves.
+PARALLEL_VALIDATION_MIN_RECORDS = 10_000
+# Number of records of a stream validated by each task of the process pool
+VALIDATION_CHUNK_SIZE = 5_000
+
 # In Json schema, numbers with a zero fractional part are considered integers. E.G. 1.0 is considered a valid integer
 # For stricter type validation we don't want to keep this behavior. We want to consider integers in the Pythonic way.
 strict_integer_type_checker = Draft7Validator.TYPE_CHECKER.redefine("integer", lambda _, value: isinstance(value, int))
@@ -30,6 +44,13 @@ class CustomFormatChecker(FormatChecker):
     @staticmethod
     def check_datetime(value: str) -> bool:
         valid_format = timestamp_regex.match(value)
+        if valid_format and iso_timestamp_regex.match(value):
+            try:
+                datetime.datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+                return True
+            except ValueError:
+                # e.g. the +24:00 offset is rejected by datetime but accepted by pendulum
+                pass
         try:
             pendulum.parse(value, strict=False)
         except ValueError:
@@ -57,29 +78,89 @@ def _enforce_no_additional_top_level_properties(json_schema: Dict[str, Any]):
     return enforced_schema
 
 
+def _create_validator(json_schema: Mapping[str, Any], fail_on_extra_columns: bool) -> Draft7Validator:
+    if fail_on_extra_columns:
+        json_schema = _enforce_no_additional_top_level_properties(json_schema)
+    return Draft7ValidatorWithStrictInteger(json_schema, format_checker=CustomFormatChecker())
+
+
+@lru_cache(maxsize=None)
+def _get_validator(serialized_json_schema: str, fail_on_extra_columns: bool) -> Draft7Validator:
+    """Create the validator of a stream once per process of the process pool."""
+    return _create_validator(json.loads(serialized_json_schema), fail_on_extra_columns)
+
+
+def _find_last_error_per_schema_path(validator: Draft7Validator, records_data: Iterable[Mapping[str, Any]]) -> Dict[str, int]:
+    """Return the index of the last record with an error for each schema path with errors, in the order the paths first failed."""
+    last_error_indexes = {}
+    for index, record_data in enumerate(records_data):
+        for error in validator.iter_errors(record_data):
+            last_error_indexes[str(error.schema_path)] = index
+    return last_error_indexes
+
+
+def _find_last_error_per_schema_path_in_chunk(
+    serialized_json_schema: str, fail_on_extra_columns: bool, records_data: List[Mapping[str, Any]]
+) -> Dict[str, int]:
+    return _find_last_error_per_schema_path(_get_validator(serialized_json_schema, fail_on_extra_columns), records_data)
+
+
 def verify_records_schema(
     records: List[AirbyteRecordMessage], catalog: ConfiguredAirbyteCatalog, fail_on_extra_columns: bool
 ) -> Mapping[str, Mapping[str, ValidationError]]:
     """Check records against their schemas from the catalog, yield error messages.
-    Only first record with error will be yielded for each stream.
+    Only the last error will be yielded for each stream and schema path.
+    Large numbers of records are split in chunks of records of the same stream that are validated in a process pool. The processes only
+    return the index of the last record with an error for each schema path: these records are validated again to get the errors.
     """
     stream_validators = {}
+    stream_schemas = {}
     for stream in catalog.streams:
-        schema_to_validate_against = stream.stream.json_schema
-        if fail_on_extra_columns:
-            schema_to_validate_against = _enforce_no_additional_top_level_properties(schema_to_validate_against)
-        stream_validators[stream.stream.name] = Draft7ValidatorWithStrictInteger(
-            schema_to_validate_against, format_checker=CustomFormatChecker()
-        )
-    stream_errors = defaultdict(dict)
+        stream_schemas[stream.stream.name] = stream.stream.json_schema
+        stream_validators[stream.stream.name] = _create_validator(stream.stream.json_schema, fail_on_extra_columns)
+
+    stream_records_data = defaultdict(list)
     for record in records:
-        validator = stream_validators.get(record.stream)
-        if not validator:
+        if record.stream not in stream_validators:
             logging.error(f"Received record from the `{record.stream}` stream, which is not in the catalog.")
             continue
+        stream_records_data[record.stream].append(record.data)
+
+    stream_last_error_indexes = {}
+    if sum(map(len, stream_records_data.values())) >= PARALLEL_VALIDATION_MIN_RECORDS:
+        # Processes are spawned rather than forked since the tests run alongside threads, e.g. the ones of the Dagger client
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn")) as executor:
+            stream_chunk_futures = {}
+            for stream_name, records_data in stream_records_data.items():
+                serialized_json_schema = json.dumps(stream_schemas[stream_name])
+                stream_chunk_futures[stream_name] = [
+                    (
+                        chunk_start,
+                        executor.submit(
+                            _find_last_error_per_schema_path_in_chunk,
+                            serialized_json_schema,
+                            fail_on_extra_columns,
+                            records_data[chunk_start : chunk_start + VALIDATION_CHUNK_SIZE],
+                        ),
+                    )
+                    for chunk_start in range(0, len(records_data), VALIDATION_CHUNK_SIZE)
+                ]
+            for stream_name, chunk_futures in stream_chunk_futures.items():
+                last_error_indexes = stream_last_error_indexes[stream_name] = {}
+                # Chunks are merged in order so that the last error of each schema path is kept
+                for chunk_start, future in chunk_futures:
+                    for schema_path, index in future.result().items():
+                        last_error_indexes[schema_path] = chunk_start + index
+    else:
+        for stream_name, records_data in stream_records_data.items():
+            stream_last_error_indexes[stream_name] = _find_last_error_per_schema_path(stream_validators[stream_name], records_data)
 
-        errors = list(validator.iter_errors(record.data))
-        for error in errors:
-            stream_errors[record.stream][str(error.schema_path)] = error
+    stream_errors = defaultdict(dict)
+    for stream_name, last_error_indexes in stream_last_error_indexes.items():
+        records_data = stream_records_data[stream_name]
+        for schema_path, index in last_error_indexes.items():
+            for error in stream_validators[stream_name].iter_errors(records_data[index]):
+                if str(error.schema_path) == schema_path:
+                    stream_errors[stream_name][schema_path] = error
 
     return stream_errors
@@ -7,9 +7,11 @@ import json
 import logging
 import os
 import uuid
+from collections import Counter
 from pathlib import Path
-from typing import Any, List, Mapping, Optional, Union
+from typing import Any, AsyncIterator, Iterable, Iterator, List, Mapping, Optional, Union
 
+import anyio
 import dagger
 import docker
 import pytest
@@ -173,14 +175,20 @@ class ConnectorRunner:
         )
 
     async def call_read(
-        self, config: SecretDict, catalog: ConfiguredAirbyteCatalog, raise_container_error: bool = False, enable_caching: bool = True
+        self,
+        config: SecretDict,
+        catalog: ConfiguredAirbyteCatalog,
+        raise_container_error: bool = False,
+        enable_caching: bool = True,
+        max_records_per_stream: Optional[int] = None,
     ) -> List[AirbyteMessage]:
         return await self._run(
-            ["read", "--config", self.IN_CONTAINER_CONFIG_PATH, "--catalog", self.IN_CONTAINER_CATALOG_PATH],
+            self._read_command(with_state=False),
             raise_container_error,
             config=config,
             catalog=catalog,
             enable_caching=enable_caching,
+            max_records_per_stream=max_records_per_stream,
         )
 
     async def call_read_with_state(
@@ -190,24 +198,51 @@ class ConnectorRunner:
         state: dict,
         raise_container_error: bool = False,
         enable_caching: bool = True,
+        max_records_per_stream: Optional[int] = None,
     ) -> List[AirbyteMessage]:
         return await self._run(
-            [
-                "read",
-                "--config",
-                self.IN_CONTAINER_CONFIG_PATH,
-                "--catalog",
-                self.IN_CONTAINER_CATALOG_PATH,
-                "--state",
-                self.IN_CONTAINER_STATE_PATH,
-            ],
+            self._read_command(with_state=True),
             raise_container_error,
             config=config,
             catalog=catalog,
             state=state,
             enable_caching=enable_caching,
+            max_records_per_stream=max_records_per_stream,
         )
 
+    async def stream_read(
+        self,
+        config: SecretDict,
+        catalog: ConfiguredAirbyteCatalog,
+        state: Optional[Union[dict, list]] = None,
+        enable_caching: bool = True,
+        max_records_per_stream: Optional[int] = None,
+    ) -> AsyncIterator[AirbyteMessage]:
+        """Run a read command and yield the AirbyteMessages emitted by the connector one at a time.
+        The connector's output is written to a file which is read line by line, so that the memory used doesn't grow with the number of
+        messages emitted by the connector.
+
+        Args:
+            config (SecretDict): The config to mount to the container.
+            catalog (ConfiguredAirbyteCatalog): The catalog to mount to the container.
+            state (Union[dict, list], optional): The state to mount to the container. Defaults to None.
+            enable_caching (bool, optional): Whether to enable command output caching. Defaults to True.
+            max_records_per_stream (int, optional): The number of records to yield per stream, the next records are skipped without being
+                parsed. All the other messages are yielded. Defaults to None to yield all the records.
+
+        Yields:
+            AirbyteMessage: The AirbyteMessages emitted by the connector.
+        """
+        container = self._prepare_container(config=config, catalog=catalog, state=state, enable_caching=enable_caching)
+        async for message in self._stream_output_from_file(self._read_command(with_state=bool(state)), container, max_records_per_stream):
+            yield message
+
+    def _read_command(self, with_state: bool) -> List[str]:
+        command = ["read", "--config", self.IN_CONTAINER_CONFIG_PATH, "--catalog", self.IN_CONTAINER_CATALOG_PATH]
+        if with_state:
+            command += ["--state", self.IN_CONTAINER_STATE_PATH]
+        return command
+
     async def get_container_env_variable_value(self, name: str) -> str:
         return await self._connector_under_test_container.env_variable(name)
 
@@ -226,6 +261,7 @@ class ConnectorRunner:
         catalog: dict = None,
         state: Union[dict, list] = None,
         enable_caching=True,
+        max_records_per_stream: Optional[int] = None,
     ) -> List[AirbyteMessage]:
         """Run a command in the connector container and return the list of AirbyteMessages emitted by the connector.
 
@@ -236,25 +272,21 @@ class ConnectorRunner:
             catalog (dict, optional): The catalog to mount to the container. Defaults to None.
             state (Union[dict, list], optional): The state to mount to the container. Defaults to None.
             enable_caching (bool, optional): Whether to enable command output caching. Defaults to True.
+            max_records_per_stream (int, optional): The number of records to keep per stream. When set, the output is read from a file
+                line by line instead of being loaded in memory at once. Defaults to None to keep all the records.
 
         Returns:
             List[AirbyteMessage]: The list of AirbyteMessages emitted by the connector.
         """
-        container = self._connector_under_test_container
-        if not enable_caching:
-            container = container.with_env_variable("CAT_CACHEBUSTER", str(uuid.uuid4()))
-        if config:
-            container = container.with_new_file(self.IN_CONTAINER_CONFIG_PATH, json.dumps(dict(config)))
-        if state:
-            container = container.with_new_file(self.IN_CONTAINER_STATE_PATH, json.dumps(state))
-        if catalog:
-            container = container.with_new_file(self.IN_CONTAINER_CATALOG_PATH, catalog.json())
+        container = self._prepare_container(config=config, catalog=catalog, state=state, enable_caching=enable_caching)
+        if max_records_per_stream is not None:
+            return [message async for message in self._stream_output_from_file(airbyte_command, container, max_records_per_stream)]
         try:
             output = await self._read_output_from_stdout(airbyte_command, container)
         except dagger.QueryError as e:
             output_too_big = bool([error for error in e.errors if error.message.startswith("file size")])
             if output_too_big:
-                output = await self._read_output_from_file(airbyte_command, container)
+                return [message async for message in self._stream_output_from_file(airbyte_command, container)]
             elif raise_container_error:
                 raise e
             else:
@@ -264,10 +296,28 @@ class ConnectorRunner:
                     pytest.fail(f"Failed to run command {airbyte_command} in container {self.image_tag} with error: {e}")
         return self.parse_airbyte_messages_from_command_output(output)
 
+    def _prepare_container(
+        self,
+        config: SecretDict = None,
+        catalog: dict = None,
+        state: Union[dict, list] = None,
+        enable_caching=True,
+    ) -> dagger.Container:
+        container = self._connector_under_test_container
+        if not enable_caching:
+            container = container.with_env_variable("CAT_CACHEBUSTER", str(uuid.uuid4()))
+        if config:
+            container = container.with_new_file(self.IN_CONTAINER_CONFIG_PATH, json.dumps(dict(config)))
+        if state:
+            container = container.with_new_file(self.IN_CONTAINER_STATE_PATH, json.dumps(state))
+        if catalog:
+            container = container.with_new_file(self.IN_CONTAINER_CATALOG_PATH, catalog.json())
+        return container
+
     async def _read_output_from_stdout(self, airbyte_command: list, container: dagger.Container) -> str:
         return await container.with_exec(airbyte_command).stdout()
 
-    async def _read_output_from_file(self, airbyte_command: list, container: dagger.Container) -> str:
+    async def _export_output_to_file(self, airbyte_command: list, container: dagger.Container) -> str:
         local_output_file_path = f"/tmp/{str(uuid.uuid4())}"
         entrypoint = await container.entrypoint()
         airbyte_command = entrypoint + airbyte_command
@@ -276,21 +326,69 @@ class ConnectorRunner:
             skip_entrypoint=True,
         )
         await container.file(self.IN_CONTAINER_OUTPUT_PATH).export(local_output_file_path)
-        output = await AnyioPath(local_output_file_path).read_text()
-        await AnyioPath(local_output_file_path).unlink()
-        return output
-
-    def parse_airbyte_messages_from_command_output(self, command_output: str) -> List[AirbyteMessage]:
-        airbyte_messages = []
-        for line in command_output.splitlines():
-            try:
-                airbyte_message = AirbyteMessage.parse_raw(line)
-                if airbyte_message.type is AirbyteMessageType.CONTROL and airbyte_message.control.type is OrchestratorType.CONNECTOR_CONFIG:
-                    self._persist_new_configuration(airbyte_message.control.connectorConfig.config, int(airbyte_message.control.emitted_at))
-                airbyte_messages.append(airbyte_message)
-            except ValidationError as exc:
-                logging.warning("Unable to parse connector's output %s, error: %s", line, exc)
-        return airbyte_messages
+        return local_output_file_path
+
+    async def _stream_output_from_file(
+        self, airbyte_command: list, container: dagger.Container, max_records_per_stream: Optional[int] = None
+    ) -> AsyncIterator[AirbyteMessage]:
+        """Run the command with its output written to a file, export the file and parse it line by line."""
+        local_output_file_path = await self._export_output_to_file(airbyte_command, container)
+        records_per_stream = Counter()
+        try:
+            async with await anyio.open_file(local_output_file_path) as output_file:
+                async for line in output_file:
+                    airbyte_message = self._parse_airbyte_message(line, records_per_stream, max_records_per_stream)
+                    if airbyte_message is not None:
+                        yield airbyte_message
+        finally:
+            await AnyioPath(local_output_file_path).unlink()
+
+    def parse_airbyte_messages_from_command_output(
+        self, command_output: str, max_records_per_stream: Optional[int] = None
+    ) -> List[AirbyteMessage]:
+        return list(self.iter_airbyte_messages(command_output.splitlines(), max_records_per_stream))
+
+    def iter_airbyte_messages(self, lines: Iterable[str], max_records_per_stream: Optional[int] = None) -> Iterator[AirbyteMessage]:
+        """Parse the lines of a connector's output into AirbyteMessages as they are iterated.
+
+        Args:
+            lines (Iterable[str]): The lines of the connector's output, e.g. an opened output file.
+            max_records_per_stream (int, optional): The number of records to yield per stream, the next records are skipped without being
+                parsed. All the other messages are yielded. Defaults to None to yield all the records.
+
+        Yields:
+            AirbyteMessage: The AirbyteMessages parsed from the lines, lines which are not AirbyteMessages are logged and skipped.
+        """
+        records_per_stream = Counter()
+        for line in lines:
+            airbyte_message = self._parse_airbyte_message(line, records_per_stream, max_records_per_stream)
+            if airbyte_message is not None:
+                yield airbyte_message
+
+    def _parse_airbyte_message(
+        self, line: str, records_per_stream: Counter, max_records_per_stream: Optional[int]
+    ) -> Optional[AirbyteMessage]:
+        # The line is decoded first and only validated as an AirbyteMessage if it is kept, so that skipped records are not validated
+        try:
+            raw_message = json.loads(line)
+        except ValueError as exc:
+            logging.warning("Unable to parse connector's output %s, error: %s", line, exc)
+            return None
+        is_record = isinstance(raw_message, dict) and raw_message.get("type") == AirbyteMessageType.RECORD.value
+        if max_records_per_stream is not None and is_record:
+            record = raw_message.get("record") or {}
+            stream = (record.get("namespace"), record.get("stream"))
+            if records_per_stream[stream] >= max_records_per_stream:
+                return None
+            records_per_stream[stream] += 1
+        try:
+            airbyte_message = AirbyteMessage.parse_obj(raw_message)
+        except ValidationError as exc:
+            logging.warning("Unable to parse connector's output %s, error: %s", line, exc)
+            return None
+        if airbyte_message.type is AirbyteMessageType.CONTROL and airbyte_message.control.type is OrchestratorType.CONNECTOR_CONFIG:
+            self._persist_new_configuration(airbyte_message.control.connectorConfig.config, int(airbyte_message.control.emitted_at))
+        return airbyte_message
 
     def _persist_new_configuration(self, new_configuration: dict, configuration_emitted_at: int) -> Optional[Path]:
         """Store new configuration values to an updated_configurations subdir under the original configuration path.
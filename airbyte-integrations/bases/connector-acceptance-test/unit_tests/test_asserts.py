@@ -11,6 +11,7 @@ from airbyte_protocol.models import (
     DestinationSyncMode,
     SyncMode,
 )
+from connector_acceptance_test.utils import asserts
 from connector_acceptance_test.utils.asserts import verify_records_schema
 
 
@@ -119,3 +120,43 @@ def test_validate_records_format(record, configured_catalog, valid):
         assert not streams_with_errors
     else:
         assert streams_with_errors, f"Record {record} should produce errors against {configured_catalog.streams[0].stream.json_schema}"
+
+
+def test_verify_records_schema_in_process_pool(mocker, configured_catalog: ConfiguredAirbyteCatalog):
+    records = [
+        {"text_or_null": None, "number_or_null": None, "text": "text", "number": 77},
+        {"text_or_null": None, "number_or_null": None, "text": "text", "number": 77},
+        {"text_or_null": None, "number_or_null": None, "text": "text", "number": "first"},  # wrong format
+        {"text_or_null": 123, "number_or_null": None, "text": "text", "number": 77},  # wrong format
+        {"text_or_null": None, "number_or_null": None, "text": "text", "number": "second"},  # wrong format
+    ]
+    records = [AirbyteRecordMessage(stream="my_stream", data=record, emitted_at=0) for record in records]
+    sequential_errors = verify_records_schema(records, configured_catalog, fail_on_extra_columns=False)
+    mocker.patch.object(asserts, "PARALLEL_VALIDATION_MIN_RECORDS", 1)
+    mocker.patch.object(asserts, "VALIDATION_CHUNK_SIZE", 2)
+
+    streams_with_errors = verify_records_schema(records, configured_catalog, fail_on_extra_columns=False)
+
+    assert [error.message for error in streams_with_errors["my_stream"].values()] == [
+        "'second' is not of type 'number'",
+        "123 is not of type 'null', 'string'",
+    ]
+    assert {
+        stream: {schema_path: error.message for schema_path, error in errors.items()} for stream, errors in streams_with_errors.items()
+    } == {stream: {schema_path: error.message for schema_path, error in errors.items()} for stream, errors in sequential_errors.items()}
+
+
+@pytest.mark.parametrize(
+    "value, valid",
+    [
+        ("2021-08-10T12:43:15.123456+02:00", True),
+        ("2021-08-10 12:43:15.123Z", True),
+        ("2021-02-29T12:43:15Z", False),
+        ("2021-08-10T12:43:15+24:00", True),
+        ("2021-08-10T24:00:00Z", False),
+        ("2021-8-1T12:43:15", True),
+        ("2021-08-10T12:43:15+00:00:30", False),
+    ],
+)
+def test_check_datetime(value, valid):
+    assert bool(asserts.CustomFormatChecker.check_datetime(value)) is valid
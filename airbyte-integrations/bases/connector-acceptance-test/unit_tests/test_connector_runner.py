@@ -71,6 +71,51 @@ class TestContainerRunner:
         runner._persist_new_configuration.assert_called_once_with(new_configuration, 1)
         mock_logging.warning.assert_called_once()
 
+    @staticmethod
+    def _record_message_lines(stream, count):
+        return [
+            AirbyteMessage(
+                type=AirbyteMessageType.RECORD, record=AirbyteRecordMessage(stream=stream, data={"id": i}, emitted_at=1.0)
+            ).json(exclude_unset=True)
+            for i in range(count)
+        ]
+
+    def test_iter_airbyte_messages_keeps_max_records_per_stream(self, mocker):
+        state_line = json.dumps({"type": "STATE", "state": {"data": {"cursor": 1}}})
+        lines = [*self._record_message_lines("stream_a", 5), state_line, *self._record_message_lines("stream_b", 1), "not a message"]
+        parse_obj = mocker.spy(connector_runner.AirbyteMessage, "parse_obj")
+        runner = connector_runner.ConnectorRunner(mocker.Mock())
+
+        messages = list(runner.iter_airbyte_messages(iter(lines), max_records_per_stream=2))
+
+        assert [(message.type, message.record.stream if message.record else None) for message in messages] == [
+            (AirbyteMessageType.RECORD, "stream_a"),
+            (AirbyteMessageType.RECORD, "stream_a"),
+            (AirbyteMessageType.STATE, None),
+            (AirbyteMessageType.RECORD, "stream_b"),
+        ]
+        # The skipped records are not validated
+        assert parse_obj.call_count == 4
+
+    async def test_stream_read_yields_messages_from_exported_output_file(self, mocker, tmp_path):
+        output_file_path = tmp_path / "output.txt"
+        output_file_path.write_text("\n".join(self._record_message_lines("stream_a", 3)) + "\n")
+        runner = connector_runner.ConnectorRunner(mocker.MagicMock())
+        mocker.patch.object(runner, "_export_output_to_file", mocker.AsyncMock(return_value=str(output_file_path)))
+
+        messages = [message async for message in runner.stream_read({"field": "value"}, mocker.MagicMock(), max_records_per_stream=2)]
+
+        assert [message.record.data for message in messages] == [{"id": 0}, {"id": 1}]
+        runner._export_output_to_file.assert_awaited_once()
+        assert runner._export_output_to_file.call_args.args[0] == [
+            "read",
+            "--config",
+            runner.IN_CONTAINER_CONFIG_PATH,
+            "--catalog",
+            runner.IN_CONTAINER_CATALOG_PATH,
+        ]
+        assert not output_file_path.exists()
+
     @pytest.mark.parametrize(
         "pass_configuration_path, old_configuration, new_configuration, new_configuration_emitted_at, expect_new_configuration",
         [